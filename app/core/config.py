@@ -5,6 +5,12 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     # Database
     database_url: str = os.getenv("DATABASE_URL", "sqlite:///./data/timegrave.db")
+    # 목록/인증 등 DB만 쓰는 라우트를 비동기 세션으로 처리 (pip install ".[async]")
+    database_async: bool = os.getenv("DATABASE_ASYNC", "false").lower() == "true"
+    # 비동기 엔진 커넥션 풀 크기 (PostgreSQL, 동시 처리 요청 수 상한)
+    database_async_pool_size: int = int(os.getenv("DATABASE_ASYNC_POOL_SIZE", "20"))
+    # 풀이 가득 찼을 때 추가로 열 수 있는 커넥션 수
+    database_async_max_overflow: int = int(os.getenv("DATABASE_ASYNC_MAX_OVERFLOW", "10"))
     
     # JWT
     jwt_secret_key: str = os.getenv("JWT_SECRET_KEY", "")
@@ -14,16 +20,122 @@ class Settings(BaseSettings):
     # App
     app_env: str = os.getenv("APP_ENV", "development")
     log_level: str = os.getenv("LOG_LEVEL", "INFO")
+    # 운영용 API(X-Internal-Token 헤더로 호출), 비워 두면 운영용 API는 404
+    internal_api_token: str = os.getenv("INTERNAL_API_TOKEN", "")
+    graves_page_size: int = int(os.getenv("GRAVES_PAGE_SIZE", "50"))  # 묘비 목록 기본 페이지 크기
+    graves_page_max: int = int(os.getenv("GRAVES_PAGE_MAX", "200"))  # 묘비 목록 최대 페이지 크기
     
     # AWS S3 설정
     aws_access_key_id: str = os.getenv("AWS_ACCESS_KEY_ID", "")
     aws_secret_access_key: str = os.getenv("AWS_SECRET_ACCESS_KEY", "")
     aws_region: str = os.getenv("AWS_REGION", "ap-northeast-2")
     s3_bucket_name: str = os.getenv("S3_BUCKET_NAME", "timegrave-audio")
+    storage_backend: str = os.getenv("STORAGE_BACKEND", "s3")  # 음성 저장소: s3 / local
+    # STORAGE_BACKEND=local일 때 저장 위치
+    local_storage_dir: str = os.getenv("LOCAL_STORAGE_DIR", "./data/audio")
+    # 로컬 저장소 파일 URL prefix
+    local_storage_base_url: str = os.getenv("LOCAL_STORAGE_BASE_URL", "/media")
+    # S3 호환 로컬 서버 주소 (예: scripts/fake_s3.py), 비우면 AWS
+    s3_endpoint_url: str = os.getenv("S3_ENDPOINT_URL", "")
+    # presigned URL 유효 시간
+    audio_url_expires_seconds: int = int(os.getenv("AUDIO_URL_EXPIRES_SECONDS", "3600"))
+    # 만료 이만큼 전에 새로 서명
+    audio_url_refresh_seconds: int = int(os.getenv("AUDIO_URL_REFRESH_SECONDS", "300"))
+    # 캐시할 최대 URL 수
+    audio_url_cache_size: int = int(os.getenv("AUDIO_URL_CACHE_SIZE", "10000"))
+    # 음성 프록시 로컬 디스크 캐시
+    audio_cache_dir: str = os.getenv("AUDIO_CACHE_DIR", "./data/audio-cache")
+    # 디스크 캐시 최대 크기 (MB)
+    audio_cache_max_mb: int = int(os.getenv("AUDIO_CACHE_MAX_MB", "1024"))
+    # 클라이언트 Cache-Control max-age (초)
+    audio_cache_max_age: int = int(os.getenv("AUDIO_CACHE_MAX_AGE", "86400"))
+    # 최소 5MiB
+    s3_multipart_part_size: int = int(os.getenv("S3_MULTIPART_PART_SIZE", str(8 * 1024 * 1024)))
+    # 저비트레이트 변환 음성 생성
+    audio_transcode_enabled: bool = os.getenv("AUDIO_TRANSCODE_ENABLED", "true").lower() == "true"
+    # 변환 프로세스 풀 크기
+    audio_transcode_workers: int = int(os.getenv("AUDIO_TRANSCODE_WORKERS", "2"))
+    # 넘으면 변환을 건너뜀
+    audio_transcode_max_pending: int = int(os.getenv("AUDIO_TRANSCODE_MAX_PENDING", "100"))
+    # ffmpeg 실행 제한 시간 (초)
+    audio_transcode_timeout: float = float(os.getenv("AUDIO_TRANSCODE_TIMEOUT", "120"))
+    ffmpeg_path: str = os.getenv("FFMPEG_PATH", "ffmpeg")
+    # 파일 삭제 작업 처리 주기
+    storage_cleanup_interval_minutes: int = int(os.getenv("STORAGE_CLEANUP_INTERVAL_MINUTES", "5"))
+    # 한 번에 처리할 삭제 작업 수
+    storage_cleanup_batch_size: int = int(os.getenv("STORAGE_CLEANUP_BATCH_SIZE", "1000"))
+    # 삭제 실패 시 재시도까지 대기
+    storage_cleanup_retry_seconds: float = float(os.getenv("STORAGE_CLEANUP_RETRY_SECONDS", "300"))
     
     # Supertone TTS API 설정
     supertone_api_key: str = os.getenv("SUPERTONE_API_KEY", "")
     supertone_api_url: str = os.getenv("SUPERTONE_API_URL", "")
+    supertone_language: str = os.getenv("SUPERTONE_LANGUAGE", "ko")
+    supertone_style: str = os.getenv("SUPERTONE_STYLE", "neutral")
+    
+    # Supertone HTTP 클라이언트 설정
+    tts_http_pool_size: int = int(os.getenv("TTS_HTTP_POOL_SIZE", "10"))  # keep-alive 커넥션 수
+    tts_connect_timeout: float = float(os.getenv("TTS_CONNECT_TIMEOUT", "5"))  # 초
+    tts_read_timeout: float = float(os.getenv("TTS_READ_TIMEOUT", "60"))  # 초
+    tts_max_retries: int = int(os.getenv("TTS_MAX_RETRIES", "2"))
+    # 지수 백오프 기본값 (초)
+    tts_retry_backoff: float = float(os.getenv("TTS_RETRY_BACKOFF", "0.5"))
+    # 백오프에 더할 최대 jitter (초)
+    tts_retry_jitter: float = float(os.getenv("TTS_RETRY_JITTER", "0.5"))
+    
+    # Supertone 호출 한도 (API 키를 모든 프로세스가 공유)
+    # 0이면 제한 없음
+    tts_rate_limit_per_second: float = float(os.getenv("TTS_RATE_LIMIT_PER_SECOND", "5"))
+    # 순간 최대 요청 수
+    tts_rate_limit_burst: float = float(os.getenv("TTS_RATE_LIMIT_BURST", "10"))
+    # 토큰 대기 최대 시간 (초)
+    tts_rate_limit_max_wait: float = float(os.getenv("TTS_RATE_LIMIT_MAX_WAIT", "30"))
+    # 429에 Retry-After가 없을 때
+    tts_rate_limit_retry_seconds: float = float(os.getenv("TTS_RATE_LIMIT_RETRY_SECONDS", "10"))
+    # 프로세스당 동시 요청 수 (AIMD 시작값)
+    tts_concurrency_initial: int = int(os.getenv("TTS_CONCURRENCY_INITIAL", "4"))
+    tts_concurrency_min: int = int(os.getenv("TTS_CONCURRENCY_MIN", "1"))
+    tts_concurrency_max: int = int(os.getenv("TTS_CONCURRENCY_MAX", "16"))
+    
+    # 긴 텍스트 분할 생성 설정
+    # 요청 하나당 최대 글자 수
+    tts_chunk_max_chars: int = int(os.getenv("TTS_CHUNK_MAX_CHARS", "300"))
+    # 묘비 하나당 동시 요청 수
+    tts_chunk_concurrency: int = int(os.getenv("TTS_CHUNK_CONCURRENCY", "4"))
+    tts_chunk_retries: int = int(os.getenv("TTS_CHUNK_RETRIES", "2"))  # 실패한 조각 재요청 횟수
+    # 응답 읽기 단위 (bytes)
+    tts_stream_chunk_size: int = int(os.getenv("TTS_STREAM_CHUNK_SIZE", str(64 * 1024)))
+    
+    # TTS 작업 큐 설정
+    tts_worker_count: int = int(os.getenv("TTS_WORKER_COUNT", "2"))
+    tts_worker_poll_interval: float = float(os.getenv("TTS_WORKER_POLL_INTERVAL", "1.0"))
+    # 워커 중단 시 재처리까지의 시간
+    tts_job_lease_seconds: float = float(os.getenv("TTS_JOB_LEASE_SECONDS", "300"))
+    
+    # TTS 생성 실패 시 재시도 설정
+    # 이 횟수만큼 연속 실패하면 재시도 중단
+    tts_max_attempts: int = int(os.getenv("TTS_MAX_ATTEMPTS", "5"))
+    # 첫 재시도까지 대기 (이후 2배씩)
+    tts_retry_base_seconds: float = float(os.getenv("TTS_RETRY_BASE_SECONDS", "60"))
+    # 최대 대기
+    tts_retry_max_seconds: float = float(os.getenv("TTS_RETRY_MAX_SECONDS", str(6 * 60 * 60)))
+    # 재시도 스위퍼 실행 주기
+    tts_retry_sweep_minutes: int = int(os.getenv("TTS_RETRY_SWEEP_MINUTES", "5"))
+    # 한 번에 재등록할 최대 수
+    tts_retry_sweep_limit: int = int(os.getenv("TTS_RETRY_SWEEP_LIMIT", "100"))
+    
+    # TTS 미리 생성 설정 (잠금 해제 전)
+    tts_prerender_days: int = int(os.getenv("TTS_PRERENDER_DAYS", "3"))  # 며칠 앞까지 미리 생성할지
+    # 작업 분산 시간
+    tts_prerender_window_hours: float = float(os.getenv("TTS_PRERENDER_WINDOW_HOURS", "20"))
+    # 하루 최대 등록 수
+    tts_prerender_daily_limit: int = int(os.getenv("TTS_PRERENDER_DAILY_LIMIT", "500"))
+    # 동시 처리 수
+    tts_prerender_concurrency: int = int(os.getenv("TTS_PRERENDER_CONCURRENCY", "1"))
+    
+    # 잠금 해제 스케줄러
+    # 한 트랜잭션에서 해제할 묘비 수
+    unlock_sweep_chunk_size: int = int(os.getenv("UNLOCK_SWEEP_CHUNK_SIZE", "1000"))
     
     class Config:
         env_file = ".env"
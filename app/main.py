@@ -5,13 +5,20 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
+from fastapi.staticfiles import StaticFiles
 import logging
 import json
+import os
+
+from app.core.config import env_config
 
 from app.models.database import init_db
-from app.routers import tombstone_router
+from app.routers import tombstone_router, tts_router
 from app.routers import user as user_router
 from app.services.scheduler import start_scheduler, stop_scheduler
+from app.services.tts_worker import start_tts_workers, stop_tts_workers
+from app.services.audio_transcoder import audio_transcoder
+from app.services.http_client import tts_http_client
 from app.utils.migration import run_migrations, check_migration_status
 
 # Configure logging
@@ -107,8 +114,25 @@ app.add_middleware(
 )
 
 # Include routers
+if env_config.database_async:
+    # DB만 쓰는 라우트는 비동기 세션으로 처리
+    # (같은 경로의 동기 라우트보다 먼저 등록되어 우선 매칭됨)
+    from app.routers import async_tombstone, async_user
+    app.include_router(async_user.router)
+    app.include_router(async_tombstone.router)
+    logger.info("⚡ Async database routes enabled")
 app.include_router(user_router.router)
 app.include_router(tombstone_router)
+app.include_router(tts_router)
+
+# 로컬 저장소를 쓰는 개발 환경에서는 음성 파일을 직접 제공
+if env_config.storage_backend == "local":
+    os.makedirs(env_config.local_storage_dir, exist_ok=True)
+    app.mount(
+        env_config.local_storage_base_url,
+        StaticFiles(directory=env_config.local_storage_dir),
+        name="media"
+    )
 
 
 @app.exception_handler(RequestValidationError)
@@ -172,6 +196,10 @@ async def startup_event():
     # Start scheduler
     start_scheduler()
     logger.info("✅ Scheduler started")
+    
+    # Start TTS workers
+    start_tts_workers()
+    logger.info("✅ TTS workers started")
 
 
 @app.on_event("shutdown")
@@ -180,3 +208,10 @@ async def shutdown_event():
     logger.info("👋 TimeGrave API shutting down...")
     stop_scheduler()
     logger.info("✅ Scheduler stopped")
+    stop_tts_workers()
+    audio_transcoder.shutdown()
+    tts_http_client.close()
+    logger.info("✅ TTS workers stopped")
+    if env_config.database_async:
+        from app.models.async_database import dispose_async_engine
+        await dispose_async_engine()
@@ -1,5 +1,25 @@
 from app.models.tombstone import Tombstone, Base
 from app.models.user import User
+from app.models.tts_job import TTSJob
+from app.models.audio_asset import AudioAsset
+from app.models.rate_limit_bucket import RateLimitBucket
+from app.models.storage_outbox import StorageOutbox
+from app.models.tombstone_collaborator import TombstoneCollaborator
+from app.models.sweep_checkpoint import SweepCheckpoint
 from app.models.database import engine, SessionLocal, init_db, get_db
 
-__all__ = ["Tombstone", "User", "Base", "engine", "SessionLocal", "init_db", "get_db"]
+__all__ = [
+    "Tombstone",
+    "User",
+    "TTSJob",
+    "AudioAsset",
+    "RateLimitBucket",
+    "StorageOutbox",
+    "TombstoneCollaborator",
+    "SweepCheckpoint",
+    "Base",
+    "engine",
+    "SessionLocal",
+    "init_db",
+    "get_db"
+]
@@ -0,0 +1,77 @@
+import threading
+
+from app.core.config import env_config
+from app.models.database import DATABASE_URL
+
+# 동기 드라이버 dialect → 비동기 드라이버 (pip install ".[async]")
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+}
+
+_engine = None
+_session_factory = None
+_lock = threading.Lock()
+
+
+def to_async_url(url: str) -> str:
+    """
+    동기 DATABASE_URL을 비동기 드라이버 URL로 바꿉니다
+
+    예: sqlite:///./data/timegrave.db → sqlite+aiosqlite:///./data/timegrave.db,
+    postgresql+psycopg2://... → postgresql+asyncpg://...
+
+    Raises:
+        ValueError: 비동기 드라이버가 없는 데이터베이스인 경우
+    """
+    scheme, separator, rest = url.partition("://")
+    dialect = scheme.split("+", 1)[0]
+    if not separator or dialect not in ASYNC_DRIVERS:
+        raise ValueError(f"Unsupported database for async engine: {scheme}")
+    return f"{ASYNC_DRIVERS[dialect]}://{rest}"
+
+
+def get_async_session_factory():
+    """
+    프로세스 전체에서 공유하는 async_sessionmaker를 반환합니다.
+
+    처음 호출될 때 엔진을 한 번만 생성합니다. sqlalchemy.ext.asyncio는 greenlet이,
+    드라이버는 aiosqlite/asyncpg가 필요하므로 DATABASE_ASYNC를 켰을 때만 불러옵니다.
+    """
+    global _engine, _session_factory
+    if _session_factory is None:
+        with _lock:
+            if _session_factory is None:
+                from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+                url = to_async_url(DATABASE_URL)
+                options = {}
+                if not url.startswith("sqlite"):
+                    # 동시에 처리되는 요청 수는 스레드 수가 아니라 이 풀 크기로 제한됨
+                    options = {
+                        "pool_size": env_config.database_async_pool_size,
+                        "max_overflow": env_config.database_async_max_overflow,
+                        "pool_pre_ping": True,
+                    }
+                _engine = create_async_engine(url, echo=False, **options)
+                # 커밋 후 속성을 다시 읽으면 암묵적 I/O가 일어나므로 만료시키지 않음
+                _session_factory = async_sessionmaker(
+                    _engine, autoflush=False, expire_on_commit=False
+                )
+    return _session_factory
+
+
+async def get_async_db():
+    """Dependency for getting async database session"""
+    async with get_async_session_factory()() as db:
+        yield db
+
+
+async def dispose_async_engine():
+    """비동기 엔진의 커넥션을 모두 닫습니다 (만들어진 적이 없으면 아무것도 하지 않음)"""
+    global _engine, _session_factory
+    with _lock:
+        engine, _engine, _session_factory = _engine, None, None
+    if engine is not None:
+        await engine.dispose()
@@ -0,0 +1,26 @@
+from sqlalchemy import BigInteger, Column, DateTime, Integer, String
+
+from app.models.tombstone import Base, get_kst_now
+
+# 오디오 에셋 상태
+AUDIO_ASSET_RENDERING = "rendering"  # 한 워커가 생성 중
+AUDIO_ASSET_READY = "ready"
+
+
+class AudioAsset(Base):
+    """내용 해시로 식별되는 TTS 음성 파일 (같은 내용은 한 번만 생성/저장)"""
+    __tablename__ = "audio_assets"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    # sha256(정규화된 텍스트, 언어, 스타일, 음성)
+    content_hash = Column(String(64), nullable=False, unique=True, index=True)
+    status = Column(String(20), nullable=False, default=AUDIO_ASSET_RENDERING)
+    storage_key = Column(String(500), nullable=False)  # S3 object key
+    audio_url = Column(String(500), nullable=True)  # 업로드 완료 후 설정
+    duration_ms = Column(Integer, nullable=True)  # 업로드하며 계산한 재생 시간
+    size_bytes = Column(BigInteger, nullable=True)
+    codec = Column(String(20), nullable=True)
+    language = Column(String(20), nullable=False)
+    style = Column(String(50), nullable=False)
+    created_at = Column(DateTime, default=get_kst_now, nullable=False)
+    updated_at = Column(DateTime, default=get_kst_now, onupdate=get_kst_now, nullable=False)
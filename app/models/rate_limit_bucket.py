@@ -0,0 +1,13 @@
+from sqlalchemy import Column, DateTime, Float, String
+
+from app.models.tombstone import Base, get_kst_now
+
+
+class RateLimitBucket(Base):
+    """여러 프로세스가 공유하는 token bucket 상태 (외부 API 호출 한도)"""
+    __tablename__ = "rate_limit_buckets"
+
+    name = Column(String(50), primary_key=True)  # 예: "supertone"
+    tokens = Column(Float, nullable=False)  # refilled_at 시점에 남아 있던 토큰 수
+    refilled_at = Column(Float, nullable=False)  # epoch seconds, 갱신 시 compare-and-set 기준
+    updated_at = Column(DateTime, default=get_kst_now, onupdate=get_kst_now, nullable=False)
@@ -0,0 +1,24 @@
+from sqlalchemy import Column, DateTime, Integer, String, Text
+
+from app.models.tombstone import Base, get_kst_now
+
+# 저장소 작업 종류
+STORAGE_OP_DELETE = "delete"
+
+
+class StorageOutbox(Base):
+    """
+    DB 변경과 같은 트랜잭션으로 기록해 두고 백그라운드에서 처리하는 저장소 작업
+
+    행 삭제가 커밋된 경우에만 파일 삭제가 예약되고, 저장소 호출은 요청 밖에서 묶어서 처리합니다.
+    """
+    __tablename__ = "storage_outbox"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    op = Column(String(20), nullable=False, default=STORAGE_OP_DELETE)
+    storage_key = Column(String(500), nullable=False)  # 대상 object key
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+    # 이 시각 이후 처리 (실패 시 뒤로 미룸)
+    available_at = Column(DateTime, default=get_kst_now, nullable=False, index=True)
+    created_at = Column(DateTime, default=get_kst_now, nullable=False)
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, DateTime, String, Text
+
+from app.models.tombstone import Base, get_kst_now
+
+# 묘비 잠금 해제 스윕
+UNLOCK_SWEEP = "unlock"
+
+
+class SweepCheckpoint(Base):
+    """
+    여러 chunk로 나누어 실행하는 배치 작업의 진행 상태
+
+    chunk의 변경과 같은 트랜잭션으로 기록되므로 중단된 뒤 다시 실행하면
+    후속 단계에 아직 전달하지 못한 id(pending_ids)를 다시 전달합니다.
+    """
+    __tablename__ = "sweep_checkpoints"
+
+    name = Column(String(50), primary_key=True)  # 예: "unlock"
+    # 처리했지만 후속 단계에 전달하지 못한 id (JSON array)
+    pending_ids = Column(Text, nullable=True)
+    updated_at = Column(DateTime, default=get_kst_now, onupdate=get_kst_now, nullable=False)
@@ -1,10 +1,28 @@
 from datetime import datetime
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, Text, Date
+
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Text,
+    text,
+)
 from sqlalchemy.ext.declarative import declarative_base
+
 from app.utils.datetime_utils import now_kst
 
 Base = declarative_base()
 
+# TTS 음성 생성 상태 (audio_status)
+AUDIO_STATUS_PENDING = "pending"
+AUDIO_STATUS_READY = "ready"
+AUDIO_STATUS_FAILED = "failed"
+
 
 def get_kst_now():
     """한국 시간을 naive datetime으로 반환 (SQLite 호환)"""
@@ -18,7 +36,20 @@ class Tombstone(Base):
     user_id = Column(Integer, nullable=False, default=1, index=True)
     title = Column(String(255), nullable=False)
     content = Column(Text, nullable=False)
-    audio_url = Column(String(500), nullable=True)  # S3 오디오 파일 URL
+    # (legacy) 공개 S3 URL, 새 음성은 audio_key만 저장
+    audio_url = Column(String(500), nullable=True)
+    # 저장소 object key (응답 시 presigned URL로 변환)
+    audio_key = Column(String(500), nullable=True)
+    # 변환된 음성 object key (JSON: {"low": "audio/<hash>.low.opus"})
+    audio_variants = Column(Text, nullable=True)
+    audio_duration_ms = Column(Integer, nullable=True)  # 음성 재생 시간 (렌더 후 한 번 계산)
+    audio_size_bytes = Column(BigInteger, nullable=True)  # 음성 파일 크기
+    audio_codec = Column(String(20), nullable=True)  # 예: mp3
+    audio_status = Column(String(20), nullable=True)  # TTS 생성 상태 (pending/ready/failed)
+    audio_attempts = Column(Integer, default=0, nullable=False)  # 연속 TTS 생성 실패 횟수
+    # 이 시각 전까지 재시도하지 않음 (None이면 재시도 안 함)
+    audio_next_retry_at = Column(DateTime, nullable=True, index=True)
+    audio_last_error = Column(String(500), nullable=True)  # 마지막 실패 사유
     unlock_date = Column(Date, nullable=False, index=True)
     is_unlocked = Column(Boolean, default=False, index=True)
     share_token = Column(String(100), nullable=True, unique=True, index=True)  # 공유 링크용 토큰 (읽기 전용)
@@ -27,3 +58,16 @@ class Tombstone(Base):
     share = Column(Text, nullable=True)  # 쓰기 권한 있는 친구들 (JSON array of userIds)
     created_at = Column(DateTime, default=get_kst_now, nullable=False)
     updated_at = Column(DateTime, default=get_kst_now, onupdate=get_kst_now, nullable=False)
+
+    __table_args__ = (
+        # 사용자별 묘비 목록 keyset pagination (unlock_date, id 순서)
+        Index("ix_tombstones_user_unlock_date_id", "user_id", "unlock_date", "id"),
+        # 잠금 해제 스윕은 아직 잠긴 묘비만 읽음 (해제된 묘비는 인덱스에 남지 않음)
+        Index(
+            "ix_tombstones_locked_unlock_date",
+            "unlock_date",
+            "id",
+            sqlite_where=text("is_unlocked = 0"),
+            postgresql_where=text("is_unlocked = false")
+        ),
+    )
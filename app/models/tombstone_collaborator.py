@@ -0,0 +1,21 @@
+from sqlalchemy import Column, DateTime, Index, Integer
+
+from app.models.tombstone import Base, get_kst_now
+
+
+class TombstoneCollaborator(Base):
+    """
+    묘비에 쓰기 권한이 있는 친구 (tombstones.share JSON을 대체)
+
+    기본 키 (tombstone_id, user_id)로 묘비별 친구 목록을,
+    (user_id, tombstone_id) 인덱스로 사용자가 참여한 묘비 목록을 조회합니다.
+    """
+    __tablename__ = "tombstone_collaborators"
+
+    tombstone_id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, primary_key=True)
+    created_at = Column(DateTime, default=get_kst_now, nullable=False)
+
+    __table_args__ = (
+        Index("ix_tombstone_collaborators_user_tombstone", "user_id", "tombstone_id"),
+    )
@@ -0,0 +1,44 @@
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text, text
+
+from app.models.tombstone import Base, get_kst_now
+
+# TTS 작업 상태
+TTS_JOB_PENDING = "pending"
+TTS_JOB_PROCESSING = "processing"
+TTS_JOB_DONE = "done"
+TTS_JOB_FAILED = "failed"
+
+# TTS 작업 등록 경로
+TTS_JOB_SOURCE_VIEW = "view"  # 잠금 해제 후 조회 시
+TTS_JOB_SOURCE_PRERENDER = "prerender"  # 잠금 해제 전 미리 생성
+
+
+class TTSJob(Base):
+    """묘비 content를 음성으로 변환하는 백그라운드 작업"""
+    __tablename__ = "tts_jobs"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    tombstone_id = Column(Integer, nullable=False, index=True)
+    status = Column(String(20), nullable=False, default=TTS_JOB_PENDING, index=True)
+    source = Column(String(20), nullable=False, default=TTS_JOB_SOURCE_VIEW)  # view/prerender
+    attempts = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)  # 마지막 실패 사유
+    lease_owner = Column(String(64), nullable=True)  # 작업을 선점한 워커의 lease 토큰
+    lease_expires_at = Column(DateTime, nullable=True)  # 만료되면 다른 워커가 다시 가져갈 수 있음
+    # 이 시각 이후 처리 가능
+    available_at = Column(DateTime, default=get_kst_now, nullable=False, index=True)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=get_kst_now, nullable=False)
+    updated_at = Column(DateTime, default=get_kst_now, onupdate=get_kst_now, nullable=False)
+
+    __table_args__ = (
+        # 묘비당 대기/처리 중인 작업은 하나만 (동시 조회 시 렌더링 중복 방지)
+        Index(
+            "uq_tts_jobs_active_tombstone",
+            "tombstone_id",
+            unique=True,
+            sqlite_where=text("status IN ('pending', 'processing')"),
+            postgresql_where=text("status IN ('pending', 'processing')")
+        ),
+    )
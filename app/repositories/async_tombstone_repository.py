@@ -0,0 +1,97 @@
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import or_, select, tuple_, update
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.tombstone import Tombstone
+from app.models.tombstone_collaborator import TombstoneCollaborator
+from app.repositories.tombstone_repository import TOMBSTONE_LIST_COLUMNS
+
+
+class AsyncTombstoneRepository:
+    """
+    TombstoneRepository의 비동기 버전 (DATABASE_ASYNC 라우트용)
+
+    같은 쿼리를 AsyncSession으로 실행합니다. 음성 렌더/저장소를 거치는 작업은
+    동기 TombstoneRepository에만 있습니다.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_page(
+        self, user_id: int, limit: int, after: Optional[Tuple[date, int]] = None
+    ) -> List[Row]:
+        """Get a page of a user's tombstones ordered by (unlock_date, id)"""
+        query = select(*TOMBSTONE_LIST_COLUMNS).where(Tombstone.user_id == user_id)
+        return await self._page(query, limit, after)
+
+    async def get_shared_page(
+        self, user_id: int, limit: int, after: Optional[Tuple[date, int]] = None
+    ) -> List[Row]:
+        """Get a page of other users' tombstones the user can write to (unlock_date, id 순서)"""
+        collaborating = select(TombstoneCollaborator.tombstone_id).where(
+            TombstoneCollaborator.user_id == user_id
+        )
+        query = select(*TOMBSTONE_LIST_COLUMNS).where(
+            or_(Tombstone.id.in_(collaborating), Tombstone.enroll == user_id),
+            Tombstone.user_id != user_id
+        )
+        return await self._page(query, limit, after)
+
+    async def _page(self, query, limit: int, after: Optional[Tuple[date, int]]) -> List[Row]:
+        """(unlock_date, id) keyset 순서로 after 다음부터 limit개"""
+        if after:
+            query = query.where(tuple_(Tombstone.unlock_date, Tombstone.id) > tuple_(*after))
+        query = query.order_by(Tombstone.unlock_date, Tombstone.id).limit(limit)
+        result = await self.db.execute(query)
+        return list(result.all())
+
+    async def get_collaborator_ids(self, tombstone_ids: Iterable[int]) -> Dict[int, List[int]]:
+        """Get collaborator userIds for several tombstones in one query (목록 응답용)"""
+        tombstone_ids = list(tombstone_ids)
+        if not tombstone_ids:
+            return {}
+        result = await self.db.execute(
+            select(TombstoneCollaborator.tombstone_id, TombstoneCollaborator.user_id)
+            .where(TombstoneCollaborator.tombstone_id.in_(tombstone_ids))
+            .order_by(TombstoneCollaborator.created_at, TombstoneCollaborator.user_id)
+        )
+        user_ids: Dict[int, List[int]] = {}
+        for tombstone_id, user_id in result:
+            user_ids.setdefault(tombstone_id, []).append(user_id)
+        return user_ids
+
+    async def get_by_id(self, tombstone_id: int) -> Optional[Tombstone]:
+        return await self.db.get(Tombstone, tombstone_id)
+
+    async def exists_by_id(self, tombstone_id: int) -> bool:
+        """Check whether a tombstone exists without loading the row"""
+        result = await self.db.execute(select(Tombstone.id).where(Tombstone.id == tombstone_id))
+        return result.first() is not None
+
+    async def update_share_token(
+        self, tombstone_id: int, share_token: str, owner_id: Optional[int] = None
+    ) -> bool:
+        """Update share token for a tombstone (owner_id를 주면 소유자의 묘비일 때만)"""
+        return await self._update(tombstone_id, owner_id, share_token=share_token)
+
+    async def update_invite_token(
+        self, tombstone_id: int, invite_token: str, owner_id: Optional[int] = None
+    ) -> bool:
+        """Update invite token for a tombstone (owner_id를 주면 소유자의 묘비일 때만)"""
+        return await self._update(tombstone_id, owner_id, invite_token=invite_token)
+
+    async def _update(self, tombstone_id: int, owner_id: Optional[int] = None, **values) -> bool:
+        """묘비 한 행을 UPDATE ... RETURNING id 한 문장으로 수정하고 커밋합니다"""
+        stmt = update(Tombstone).where(Tombstone.id == tombstone_id)
+        if owner_id is not None:
+            stmt = stmt.where(Tombstone.user_id == owner_id)
+        result = await self.db.execute(
+            stmt.values(**values).returning(Tombstone.id).execution_options(synchronize_session=False)
+        )
+        updated = result.first()
+        await self.db.commit()
+        return updated is not None
@@ -0,0 +1,34 @@
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import User
+
+
+class AsyncUserRepository:
+    """UserRepository의 비동기 버전 (DATABASE_ASYNC 라우트용)"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """이메일로 사용자 조회"""
+        result = await self.db.execute(select(User).where(User.email == email))
+        return result.scalars().first()
+
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        """ID로 사용자 조회"""
+        return await self.db.get(User, user_id)
+
+    async def create(self, email: str, username: str, hashed_password: str) -> User:
+        """새 사용자 생성"""
+        user = User(
+            email=email,
+            username=username,
+            hashed_password=hashed_password
+        )
+        self.db.add(user)
+        await self.db.commit()
+        await self.db.refresh(user)
+        return user
@@ -0,0 +1,164 @@
+from datetime import datetime
+from typing import Iterable, List, Optional, Set
+
+from sqlalchemy import func, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.audio_asset import AUDIO_ASSET_READY, AUDIO_ASSET_RENDERING, AudioAsset
+from app.models.tombstone import get_kst_now
+from app.utils.mp3_info import AudioInfo
+
+
+class AudioAssetRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_by_hash(self, content_hash: str) -> Optional[AudioAsset]:
+        """Get an audio asset by its content hash"""
+        return self.db.query(AudioAsset).filter(AudioAsset.content_hash == content_hash).first()
+
+    def get_existing_storage_keys(self, storage_keys: Iterable[str]) -> Set[str]:
+        """Return the given storage keys that belong to an asset (including ones still rendering)"""
+        storage_keys = list(storage_keys)
+        if not storage_keys:
+            return set()
+        rows = self.db.query(AudioAsset.storage_key).filter(
+            AudioAsset.storage_key.in_(storage_keys)
+        ).all()
+        return {row[0] for row in rows}
+
+    def claim(self, content_hash: str, storage_key: str, language: str, style: str) -> bool:
+        """
+        content hash에 대한 생성 권한을 획득합니다.
+
+        content_hash의 unique 제약으로 같은 내용을 동시에 두 워커가 생성하지 않습니다.
+
+        Returns:
+            획득 성공 여부 (이미 다른 워커가 등록했으면 False)
+        """
+        asset = AudioAsset(
+            content_hash=content_hash,
+            status=AUDIO_ASSET_RENDERING,
+            storage_key=storage_key,
+            language=language,
+            style=style
+        )
+        try:
+            self.db.add(asset)
+            self.db.commit()
+            return True
+        except IntegrityError:
+            self.db.rollback()
+            return False
+
+    def take_over(self, content_hash: str, stale_before: datetime) -> bool:
+        """생성 중 상태로 오래 멈춘 에셋(워커 중단)의 생성 권한을 넘겨받습니다"""
+        result = self.db.execute(
+            update(AudioAsset)
+            .where(
+                AudioAsset.content_hash == content_hash,
+                AudioAsset.status == AUDIO_ASSET_RENDERING,
+                AudioAsset.updated_at < stale_before
+            )
+            .values(updated_at=get_kst_now())
+        )
+        self.db.commit()
+        return result.rowcount == 1
+
+    def mark_ready(
+        self,
+        content_hash: str,
+        audio_url: str,
+        audio_info: Optional[AudioInfo] = None,
+        commit: bool = True
+    ) -> None:
+        """Mark an asset as uploaded (commit=False면 호출한 쪽의 트랜잭션에 포함)"""
+        values = dict(status=AUDIO_ASSET_READY, audio_url=audio_url, updated_at=get_kst_now())
+        if audio_info:
+            values.update(
+                duration_ms=audio_info.duration_ms,
+                size_bytes=audio_info.size_bytes,
+                codec=audio_info.codec
+            )
+        self.db.execute(
+            update(AudioAsset)
+            .where(AudioAsset.content_hash == content_hash)
+            .values(**values)
+        )
+        if commit:
+            self.db.commit()
+
+    def update_audio_info(self, storage_key: str, audio_info: AudioInfo) -> None:
+        """Record audio metadata on the asset that owns the storage key"""
+        self.db.query(AudioAsset).filter(AudioAsset.storage_key == storage_key).update({
+            "duration_ms": audio_info.duration_ms,
+            "size_bytes": audio_info.size_bytes,
+            "codec": audio_info.codec
+        }, synchronize_session=False)
+        self.db.commit()
+
+    def get_storage_totals(self) -> dict:
+        """준비된 음성 파일 수와 전체 크기 (저장소를 조회하지 않고 저장된 크기로 계산)"""
+        count, total_bytes = self.db.query(
+            func.count(AudioAsset.id),
+            func.coalesce(func.sum(AudioAsset.size_bytes), 0)
+        ).filter(AudioAsset.status == AUDIO_ASSET_READY).one()
+        return {"assets": count, "bytes": int(total_bytes)}
+
+    def release(self, content_hash: str) -> None:
+        """생성에 실패한 에셋의 생성 권한을 반납합니다"""
+        self.db.query(AudioAsset).filter(
+            AudioAsset.content_hash == content_hash,
+            AudioAsset.status == AUDIO_ASSET_RENDERING
+        ).delete(synchronize_session=False)
+        self.db.commit()
+
+    def get_rendering_storage_keys(
+        self, storage_keys: Iterable[str], updated_after: datetime
+    ) -> Set[str]:
+        """Return the given storage keys that a worker is still rendering (not stale)"""
+        storage_keys = list(storage_keys)
+        if not storage_keys:
+            return set()
+        rows = self.db.query(AudioAsset.storage_key).filter(
+            AudioAsset.storage_key.in_(storage_keys),
+            AudioAsset.status == AUDIO_ASSET_RENDERING,
+            AudioAsset.updated_at >= updated_after
+        ).all()
+        return {row[0] for row in rows}
+
+    def get_stale_rendering(self, stale_before: datetime, limit: int) -> List[AudioAsset]:
+        """생성 중 상태로 멈춘 에셋 조회 (업로드 후 DB 기록 전에 워커가 중단된 경우 등)"""
+        return self.db.query(AudioAsset).filter(
+            AudioAsset.status == AUDIO_ASSET_RENDERING,
+            AudioAsset.updated_at < stale_before
+        ).order_by(AudioAsset.updated_at).limit(limit).all()
+
+    def delete_stale_rendering(self, asset_ids: List[int], stale_before: datetime) -> int:
+        """
+        생성 중 상태로 멈춘 에셋을 지웁니다. 커밋은 호출한 쪽에서 합니다.
+
+        그 사이 다른 워커가 넘겨받은(take_over) 에셋은 updated_at이 갱신되어 지워지지 않습니다.
+        """
+        if not asset_ids:
+            return 0
+        return self.db.query(AudioAsset).filter(
+            AudioAsset.id.in_(asset_ids),
+            AudioAsset.status == AUDIO_ASSET_RENDERING,
+            AudioAsset.updated_at < stale_before
+        ).delete(synchronize_session=False)
+
+    def delete_by_storage_keys(self, storage_keys: List[str]) -> None:
+        """
+        파일이 삭제될 에셋을 지웁니다.
+
+        같은 내용이 다시 요청되면 새로 생성되며,
+        key는 내용 해시로 정해지므로 같은 key에 다시 저장됩니다.
+        """
+        if not storage_keys:
+            return
+        self.db.query(AudioAsset).filter(
+            AudioAsset.storage_key.in_(storage_keys)
+        ).delete(synchronize_session=False)
+        self.db.commit()
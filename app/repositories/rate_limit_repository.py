@@ -0,0 +1,54 @@
+from typing import Optional
+
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.rate_limit_bucket import RateLimitBucket
+
+
+class RateLimitRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_state(self, name: str) -> Optional[RateLimitBucket]:
+        """Get the stored bucket state"""
+        return self.db.query(RateLimitBucket).filter(RateLimitBucket.name == name).first()
+
+    def take_token(self, name: str, rate: float, capacity: float, now: float) -> Optional[float]:
+        """
+        Token bucket에서 토큰 하나를 가져갑니다.
+
+        저장된 토큰 수를 경과 시간만큼 채운 뒤, refilled_at이 읽은 값 그대로일 때만
+        갱신하는 compare-and-set UPDATE로 차감하므로 여러 프로세스가 동시에
+        호출해도 한도를 넘지 않습니다.
+
+        Returns:
+            0이면 토큰 획득, 양수면 다음 토큰까지 기다릴 시간(초),
+            다른 프로세스와 경합해 갱신하지 못했으면 None (바로 다시 시도)
+        """
+        row = self.db.query(RateLimitBucket.tokens, RateLimitBucket.refilled_at).filter(
+            RateLimitBucket.name == name
+        ).first()
+
+        if row is None:
+            try:
+                self.db.add(RateLimitBucket(name=name, tokens=capacity - 1, refilled_at=now))
+                self.db.commit()
+                return 0.0
+            except IntegrityError:
+                self.db.rollback()
+                return None
+
+        elapsed = max(0.0, now - row.refilled_at)
+        tokens = min(capacity, row.tokens + elapsed * rate)
+        if tokens < 1:
+            return (1 - tokens) / rate
+
+        result = self.db.execute(
+            update(RateLimitBucket)
+            .where(RateLimitBucket.name == name, RateLimitBucket.refilled_at == row.refilled_at)
+            .values(tokens=tokens - 1, refilled_at=now)
+        )
+        self.db.commit()
+        return 0.0 if result.rowcount == 1 else None
@@ -0,0 +1,60 @@
+from datetime import datetime
+from typing import Iterable, List
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.models.storage_outbox import STORAGE_OP_DELETE, StorageOutbox
+
+
+class StorageOutboxRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def add_deletes(self, storage_keys: Iterable[str]) -> int:
+        """
+        파일 삭제 작업을 세션에 추가합니다.
+
+        커밋하지 않으므로 호출한 쪽의 행 삭제와 같은 트랜잭션으로 저장됩니다.
+
+        Returns:
+            추가된 작업 수
+        """
+        entries = [
+            StorageOutbox(op=STORAGE_OP_DELETE, storage_key=key) for key in set(storage_keys) if key
+        ]
+        self.db.add_all(entries)
+        return len(entries)
+
+    def get_due(self, op: str, now: datetime, limit: int) -> List[StorageOutbox]:
+        """Get pending outbox entries that are ready to be processed"""
+        return self.db.query(StorageOutbox).filter(
+            StorageOutbox.op == op,
+            StorageOutbox.available_at <= now
+        ).order_by(StorageOutbox.available_at, StorageOutbox.id).limit(limit).all()
+
+    def delete_entries(self, entry_ids: List[int]) -> None:
+        """Remove processed outbox entries"""
+        if not entry_ids:
+            return
+        self.db.query(StorageOutbox).filter(
+            StorageOutbox.id.in_(entry_ids)
+        ).delete(synchronize_session=False)
+        self.db.commit()
+
+    def reschedule(self, entry_ids: List[int], error: str, available_at: datetime) -> None:
+        """처리에 실패한 작업을 available_at 이후에 다시 시도하도록 미룹니다"""
+        if not entry_ids:
+            return
+        self.db.execute(
+            update(StorageOutbox)
+            .where(StorageOutbox.id.in_(entry_ids))
+            .values(
+                attempts=StorageOutbox.attempts + 1, last_error=error, available_at=available_at
+            )
+        )
+        self.db.commit()
+
+    def count_pending(self) -> int:
+        """Count outbox entries waiting to be processed"""
+        return self.db.query(StorageOutbox).count()
@@ -0,0 +1,39 @@
+import json
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models.sweep_checkpoint import SweepCheckpoint
+
+
+class SweepCheckpointRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get(self, name: str) -> Optional[SweepCheckpoint]:
+        """Get the saved progress of a sweep (없으면 처음부터 실행)"""
+        return self.db.query(SweepCheckpoint).filter(SweepCheckpoint.name == name).first()
+
+    def save(self, name: str, pending_ids: List[int]) -> None:
+        """
+        후속 단계에 전달할 id를 기록합니다.
+
+        커밋하지 않으므로 chunk의 변경과 같은 트랜잭션으로 저장됩니다.
+        """
+        checkpoint = self.get(name) or SweepCheckpoint(name=name)
+        checkpoint.pending_ids = json.dumps(pending_ids)
+        self.db.add(checkpoint)
+
+    def clear_pending(self, name: str) -> None:
+        """Mark the pending ids as delivered"""
+        self.db.query(SweepCheckpoint).filter(
+            SweepCheckpoint.name == name
+        ).update({"pending_ids": None}, synchronize_session=False)
+        self.db.commit()
+
+    def delete(self, name: str) -> None:
+        """Remove the checkpoint once a sweep has finished (다음 실행은 처음부터)"""
+        self.db.query(SweepCheckpoint).filter(
+            SweepCheckpoint.name == name
+        ).delete(synchronize_session=False)
+        self.db.commit()
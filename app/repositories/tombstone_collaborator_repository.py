@@ -0,0 +1,145 @@
+import json
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.models.tombstone import Tombstone, get_kst_now
+from app.models.tombstone_collaborator import TombstoneCollaborator
+from app.repositories.unit_of_work import commit
+
+
+def parse_share_json(share: Optional[str]) -> List[int]:
+    """(legacy) tombstones.share JSON 문자열을 userId 목록으로 변환합니다. 잘못된 값은 무시"""
+    if not share:
+        return []
+    try:
+        user_ids = json.loads(share)
+    except ValueError:
+        return []
+    if not isinstance(user_ids, list):
+        return []
+    return [
+        user_id for user_id in user_ids
+        if isinstance(user_id, int) and not isinstance(user_id, bool)
+    ]
+
+
+class TombstoneCollaboratorRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_user_ids(self, tombstone_id: int) -> List[int]:
+        """Get the collaborator userIds of a tombstone (추가된 순서)"""
+        rows = self.db.query(TombstoneCollaborator.user_id).filter(
+            TombstoneCollaborator.tombstone_id == tombstone_id
+        ).order_by(TombstoneCollaborator.created_at, TombstoneCollaborator.user_id).all()
+        return [row[0] for row in rows]
+
+    def get_user_ids_by_tombstone(self, tombstone_ids: Iterable[int]) -> Dict[int, List[int]]:
+        """Get collaborator userIds for several tombstones in one query (목록 응답용)"""
+        tombstone_ids = list(tombstone_ids)
+        if not tombstone_ids:
+            return {}
+        rows = self.db.query(
+            TombstoneCollaborator.tombstone_id, TombstoneCollaborator.user_id
+        ).filter(
+            TombstoneCollaborator.tombstone_id.in_(tombstone_ids)
+        ).order_by(TombstoneCollaborator.created_at, TombstoneCollaborator.user_id).all()
+        result: Dict[int, List[int]] = {}
+        for tombstone_id, user_id in rows:
+            result.setdefault(tombstone_id, []).append(user_id)
+        return result
+
+    def add(self, tombstone_id: int, user_id: int) -> bool:
+        """
+        Add a collaborator with a single INSERT ... ON CONFLICT DO NOTHING
+
+        충돌해도 트랜잭션을 롤백하지 않으므로 unit_of_work 안에서도 쓸 수 있습니다.
+
+        Returns:
+            추가 여부 (이미 있으면 False)
+        """
+        dialect = postgresql if self.db.get_bind().dialect.name == "postgresql" else sqlite
+        stmt = dialect.insert(TombstoneCollaborator).values(
+            tombstone_id=tombstone_id, user_id=user_id, created_at=get_kst_now()
+        ).on_conflict_do_nothing(index_elements=["tombstone_id", "user_id"])
+        result = self.db.execute(stmt)
+        commit(self.db)
+        return result.rowcount == 1
+
+    def remove(self, tombstone_id: int, user_id: int) -> bool:
+        """Remove a collaborator with a single DELETE"""
+        result = self.db.query(TombstoneCollaborator).filter(
+            TombstoneCollaborator.tombstone_id == tombstone_id,
+            TombstoneCollaborator.user_id == user_id
+        ).delete(synchronize_session=False)
+        commit(self.db)
+        return result == 1
+
+    def delete_for_user(self, user_id: int, tombstone_ids: Iterable[int]) -> None:
+        """
+        탈퇴하는 사용자의 참여 기록과 그 사용자 묘비의 친구 목록을 삭제합니다.
+
+        커밋하지 않으므로 호출한 쪽의 행 삭제와 같은 트랜잭션으로 저장됩니다.
+        """
+        self.db.query(TombstoneCollaborator).filter(
+            TombstoneCollaborator.user_id == user_id
+        ).delete(synchronize_session=False)
+        tombstone_ids = list(tombstone_ids)
+        if tombstone_ids:
+            self.db.query(TombstoneCollaborator).filter(
+                TombstoneCollaborator.tombstone_id.in_(tombstone_ids)
+            ).delete(synchronize_session=False)
+
+    def migrate_share(self, rows: Iterable[Tuple[int, Optional[str]]]) -> int:
+        """
+        (tombstone_id, share JSON) 행의 친구 목록을 collaborator 행으로 옮기고 share를 비웁니다.
+
+        이미 옮겨진 친구는 건너뛰므로 여러 번 실행해도 안전합니다.
+
+        Returns:
+            추가된 collaborator 수
+        """
+        rows = list(rows)
+        if not rows:
+            return 0
+        tombstone_ids = [tombstone_id for tombstone_id, _ in rows]
+        existing = set(
+            self.db.query(TombstoneCollaborator.tombstone_id, TombstoneCollaborator.user_id).filter(
+                TombstoneCollaborator.tombstone_id.in_(tombstone_ids)
+            ).all()
+        )
+        added = 0
+        for tombstone_id, share in rows:
+            for user_id in parse_share_json(share):
+                if (tombstone_id, user_id) not in existing:
+                    existing.add((tombstone_id, user_id))
+                    self.db.add(TombstoneCollaborator(tombstone_id=tombstone_id, user_id=user_id))
+                    added += 1
+        self.db.flush()
+        self.db.execute(
+            update(Tombstone)
+            .where(Tombstone.id.in_(tombstone_ids))
+            .values(share=None, updated_at=Tombstone.updated_at)  # 데이터 이전이므로 수정 시각 유지
+            .execution_options(synchronize_session=False)
+        )
+        commit(self.db)
+        return added
+
+    def backfill_batch(self, after_id: int, limit: int) -> Tuple[int, int]:
+        """
+        id가 after_id보다 큰 묘비 중 share JSON이 남은 limit개를 옮깁니다 (온라인 backfill)
+
+        Returns:
+            (처리한 묘비 수, 마지막 묘비 id) - 처리한 묘비가 없으면 (0, after_id)
+        """
+        rows = self.db.query(Tombstone.id, Tombstone.share).filter(
+            Tombstone.id > after_id,
+            Tombstone.share.isnot(None)
+        ).order_by(Tombstone.id).limit(limit).all()
+        if not rows:
+            return 0, after_id
+        self.migrate_share((row.id, row.share) for row in rows)
+        return len(rows), rows[-1].id
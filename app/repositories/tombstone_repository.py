@@ -1,7 +1,38 @@
-from datetime import date
-from typing import List, Optional
+from datetime import date, datetime
+from typing import Iterable, List, Optional, Set, Tuple
+from sqlalchemy import exists, false, or_, select, tuple_, update
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
-from app.models.tombstone import Tombstone
+from app.models.tombstone import Tombstone, AUDIO_STATUS_READY, AUDIO_STATUS_FAILED, get_kst_now
+from app.models.tombstone_collaborator import TombstoneCollaborator
+from app.models.tts_job import TTSJob, TTS_JOB_PENDING, TTS_JOB_PROCESSING
+from app.repositories.unit_of_work import commit
+from app.utils.mp3_info import AudioInfo
+
+# 목록 응답에 필요한 컬럼만 (content 같은 큰 Text 컬럼은 읽지 않음)
+TOMBSTONE_LIST_COLUMNS = (
+    Tombstone.id,
+    Tombstone.user_id,
+    Tombstone.title,
+    Tombstone.unlock_date,
+    Tombstone.is_unlocked,
+    Tombstone.enroll,
+    Tombstone.share,
+    Tombstone.audio_duration_ms,
+    Tombstone.audio_size_bytes,
+    Tombstone.audio_codec,
+    Tombstone.created_at,
+    Tombstone.updated_at,
+)
+
+
+def _audio_info_values(audio_info: Optional[AudioInfo]) -> dict:
+    """AudioInfo → 묘비 음성 메타데이터 컬럼 값 (없으면 모두 None)"""
+    return {
+        "audio_duration_ms": audio_info.duration_ms if audio_info else None,
+        "audio_size_bytes": audio_info.size_bytes if audio_info else None,
+        "audio_codec": audio_info.codec if audio_info else None,
+    }
 
 
 class TombstoneRepository:
@@ -12,105 +43,322 @@ class TombstoneRepository:
         """Get all tombstones for a user"""
         return self.db.query(Tombstone).filter(Tombstone.user_id == user_id).all()
 
+    def get_page(
+        self,
+        user_id: int,
+        limit: int,
+        after: Optional[Tuple[date, int]] = None
+    ) -> List[Row]:
+        """
+        Get a page of a user's tombstones ordered by (unlock_date, id)
+
+        after(직전 페이지의 마지막 unlock_date, id) 다음부터 조회하므로 OFFSET 없이
+        (user_id, unlock_date, id) 인덱스를 그대로 따라 읽습니다.
+        ORM 엔티티 대신 TOMBSTONE_LIST_COLUMNS만 담은 가벼운 Row를 반환합니다.
+        """
+        query = self.db.query(*TOMBSTONE_LIST_COLUMNS).filter(Tombstone.user_id == user_id)
+        return self._page(query, limit, after)
+
+    def get_shared_page(
+        self,
+        user_id: int,
+        limit: int,
+        after: Optional[Tuple[date, int]] = None
+    ) -> List[Row]:
+        """
+        Get a page of other users' tombstones the user can write to, ordered by (unlock_date, id)
+
+        tombstone_collaborators의 (user_id, tombstone_id) 인덱스와 enroll 인덱스로
+        대상 묘비를 찾으므로 전체 묘비를 읽지 않습니다.
+        """
+        collaborating = self.db.query(TombstoneCollaborator.tombstone_id).filter(
+            TombstoneCollaborator.user_id == user_id
+        )
+        query = self.db.query(*TOMBSTONE_LIST_COLUMNS).filter(
+            or_(Tombstone.id.in_(collaborating), Tombstone.enroll == user_id),
+            Tombstone.user_id != user_id
+        )
+        return self._page(query, limit, after)
+
+    @staticmethod
+    def _page(query, limit: int, after: Optional[Tuple[date, int]]) -> List[Row]:
+        """(unlock_date, id) keyset 순서로 after 다음부터 limit개"""
+        if after:
+            query = query.filter(tuple_(Tombstone.unlock_date, Tombstone.id) > tuple_(*after))
+        return query.order_by(Tombstone.unlock_date, Tombstone.id).limit(limit).all()
+
     def get_by_id(self, tombstone_id: int) -> Optional[Tombstone]:
         """Get a single tombstone by ID"""
         return self.db.query(Tombstone).filter(Tombstone.id == tombstone_id).first()
 
-    def create(self, user_id: int, title: str, content: str, unlock_date: date, audio_url: str = None, enroll: int = None, share: str = None) -> Tombstone:
-        """Create a new tombstone"""
+    def get_prerender_candidates(
+        self,
+        start_date: date,
+        end_date: date,
+        limit: int
+    ) -> List[Tombstone]:
+        """잠금 해제 예정이지만 아직 음성이 없고 대기 중인 TTS 작업도 없는 묘비 조회"""
+        active_job = exists().where(
+            TTSJob.tombstone_id == Tombstone.id,
+            TTSJob.status.in_((TTS_JOB_PENDING, TTS_JOB_PROCESSING))
+        )
+        return self.db.query(Tombstone).filter(
+            Tombstone.unlock_date >= start_date,
+            Tombstone.unlock_date <= end_date,
+            Tombstone.is_unlocked.is_(False),
+            Tombstone.audio_key.is_(None),
+            Tombstone.audio_url.is_(None),
+            ~active_job
+        ).order_by(Tombstone.unlock_date, Tombstone.id).limit(limit).all()
+
+    def create(
+        self,
+        user_id: int,
+        title: str,
+        content: str,
+        unlock_date: date,
+        audio_key: str = None,
+        audio_variants: str = None,
+        audio_info: AudioInfo = None,
+        enroll: int = None,
+        collaborators: Iterable[int] = (),
+        is_unlocked: bool = False
+    ) -> Tombstone:
+        """
+        Create a new tombstone
+
+        collaborators는 같은 트랜잭션으로 tombstone_collaborators에 저장합니다.
+        """
         tombstone = Tombstone(
+            **_audio_info_values(audio_info),
             user_id=user_id,
             title=title,
             content=content,
-            audio_url=audio_url,
+            audio_key=audio_key,
+            audio_variants=audio_variants,
+            audio_status=AUDIO_STATUS_READY if audio_key else None,
             unlock_date=unlock_date,
-            is_unlocked=False,
-            enroll=enroll,
-            share=share
+            is_unlocked=is_unlocked,
+            enroll=enroll
         )
         self.db.add(tombstone)
+        self.db.flush()
+        for user_id in dict.fromkeys(collaborators):
+            self.db.add(TombstoneCollaborator(tombstone_id=tombstone.id, user_id=user_id))
         self.db.commit()
         self.db.refresh(tombstone)
         return tombstone
 
-    def update_unlock_status(self, current_date: date) -> int:
-        """Update unlock status for tombstones whose unlock date has arrived"""
+    def unlock_due_chunk(self, current_date: date, limit: int) -> List[Tuple[date, int]]:
+        """
+        Unlock up to limit due tombstones in (unlock_date, id) order
+
+        잠긴 묘비 부분 인덱스를 앞에서부터 읽어 한 번에 limit개만 잠그고
+        UPDATE ... RETURNING으로 해제한 묘비를 돌려줍니다. 해제된 행은 인덱스에서 빠지므로
+        cursor 없이 다시 호출하면 다음 chunk를 읽습니다. PostgreSQL에서는 다른 트랜잭션이
+        잡고 있는 행을 기다리지 않고 건너뛰며 (SKIP LOCKED), 그 행은 다음 호출에서 다시 시도합니다.
+        커밋하지 않으므로 호출한 쪽이 진행 상태와 함께 커밋합니다.
+
+        Returns:
+            해제한 묘비의 (unlock_date, id) 목록
+        """
+        # 리터럴 false로 비교해야 부분 인덱스 조건(is_unlocked = false)과 일치
+        due = select(Tombstone.id).where(
+            Tombstone.is_unlocked == false(),
+            Tombstone.unlock_date <= current_date
+        )
+        due = (
+            due.order_by(Tombstone.unlock_date, Tombstone.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        rows = self.db.execute(
+            update(Tombstone)
+            .where(Tombstone.id.in_(due.scalar_subquery()))
+            .values(is_unlocked=True)
+            .returning(Tombstone.unlock_date, Tombstone.id)
+            .execution_options(synchronize_session=False)
+        ).all()
+        return [(row.unlock_date, row.id) for row in rows]
+
+    def set_audio_key(
+        self,
+        tombstone_id: int,
+        audio_key: str,
+        audio_variants: Optional[str] = None,
+        audio_info: Optional[AudioInfo] = None
+    ) -> bool:
+        """
+        Set the stored audio object key for a tombstone and mark its audio as ready
+
+        커밋하지 않으므로 작업 완료 처리와 같은 트랜잭션으로 저장됩니다.
+        """
+        result = self.db.execute(
+            update(Tombstone)
+            .where(Tombstone.id == tombstone_id)
+            .values(
+                audio_key=audio_key,
+                audio_variants=audio_variants,
+                audio_status=AUDIO_STATUS_READY,
+                **_audio_info_values(audio_info),
+                audio_attempts=0,
+                audio_next_retry_at=None,
+                audio_last_error=None
+            )
+        )
+        return result.rowcount == 1
+
+    def get_audio_variants(self, audio_key: str) -> Optional[str]:
+        """Get the variant keys already recorded for an audio key (by any tombstone)"""
+        row = self.db.query(Tombstone.audio_variants).filter(
+            Tombstone.audio_key == audio_key,
+            Tombstone.audio_variants.isnot(None)
+        ).first()
+        return row[0] if row else None
+
+    def get_audio_keys_without_info(self, after: str, limit: int) -> List[str]:
+        """Get audio keys (> after) whose duration/size has not been recorded yet"""
+        rows = self.db.query(Tombstone.audio_key).filter(
+            Tombstone.audio_key > after,
+            Tombstone.audio_duration_ms.is_(None)
+        ).distinct().order_by(Tombstone.audio_key).limit(limit).all()
+        return [row[0] for row in rows]
+
+    def update_audio_info(self, audio_key: str, audio_info: Optional[AudioInfo]) -> int:
+        """Record audio metadata on every tombstone that uses the audio key"""
         result = self.db.query(Tombstone).filter(
-            Tombstone.unlock_date <= current_date,
-            Tombstone.is_unlocked == False
-        ).update({"is_unlocked": True})
+            Tombstone.audio_key == audio_key
+        ).update(_audio_info_values(audio_info), synchronize_session=False)
         self.db.commit()
         return result
 
-    def update_audio_url(self, tombstone_id: int, audio_url: str) -> bool:
-        """Update audio_url for a tombstone"""
-        try:
-            tombstone = self.get_by_id(tombstone_id)
-            if tombstone:
-                tombstone.audio_url = audio_url
-                self.db.commit()
-                return True
-            return False
-        except Exception:
-            self.db.rollback()
-            return False
-
-    def update_share_token(self, tombstone_id: int, share_token: str) -> bool:
-        """Update share token for a tombstone"""
-        try:
-            tombstone = self.get_by_id(tombstone_id)
-            if tombstone:
-                tombstone.share_token = share_token
-                self.db.commit()
-                return True
-            return False
-        except Exception:
-            self.db.rollback()
-            return False
-    
+    def update_audio_variants(self, audio_key: str, audio_variants: str) -> int:
+        """Record variant keys on every tombstone that uses the audio key"""
+        result = self.db.query(Tombstone).filter(
+            Tombstone.audio_key == audio_key
+        ).update({"audio_variants": audio_variants}, synchronize_session=False)
+        self.db.commit()
+        return result
+
+    def update_audio_status(self, tombstone_id: int, audio_status: str) -> bool:
+        """Update TTS generation status for a tombstone"""
+        return self._update(tombstone_id, audio_status=audio_status)
+
+    def mark_audio_failed(
+        self,
+        tombstone_id: int,
+        attempts: int,
+        error: str,
+        next_retry_at: Optional[datetime]
+    ) -> bool:
+        """Record a failed TTS render and when it may be retried"""
+        return self._update(
+            tombstone_id,
+            audio_status=AUDIO_STATUS_FAILED,
+            audio_attempts=attempts,
+            audio_last_error=error[:500] if error else None,
+            audio_next_retry_at=next_retry_at
+        )
+
+    def get_audio_retry_candidates(self, now: datetime, limit: int) -> List[Tombstone]:
+        """
+        Get unlocked tombstones whose failed TTS render is due for a retry
+
+        재시도 횟수를 모두 쓴 묘비는 audio_next_retry_at이 None이므로 제외됩니다.
+        """
+        return self.db.query(Tombstone).filter(
+            Tombstone.audio_status == AUDIO_STATUS_FAILED,
+            Tombstone.audio_next_retry_at <= now,
+            Tombstone.is_unlocked.is_(True),
+            Tombstone.audio_key.is_(None),
+            Tombstone.audio_url.is_(None)
+        ).order_by(Tombstone.audio_next_retry_at).limit(limit).all()
+
+    def get_referenced_audio_keys(self, audio_keys: Iterable[str]) -> Set[str]:
+        """Return the given audio keys that are still used by some tombstone (e.g. shared copies)"""
+        audio_keys = list(audio_keys)
+        if not audio_keys:
+            return set()
+        rows = self.db.query(Tombstone.audio_key).filter(
+            Tombstone.audio_key.in_(audio_keys)
+        ).distinct().all()
+        return {row[0] for row in rows}
+
+    def count_unconverted_audio_urls(self) -> int:
+        """
+        Count tombstones whose legacy audio URL has not been converted to an audio key yet
+
+        backfill_audio_keys가 변환한 행은 audio_url이 비워지므로, 이전 버전의 마이그레이션이
+        URL을 그대로 복사해 둔 audio_key도 변환 전으로 셉니다.
+        """
+        return self.db.query(Tombstone).filter(Tombstone.audio_url.isnot(None)).count()
+
+    def update_share_token(
+        self,
+        tombstone_id: int,
+        share_token: str,
+        owner_id: Optional[int] = None
+    ) -> bool:
+        """Update share token for a tombstone (owner_id를 주면 소유자의 묘비일 때만)"""
+        return self._update(tombstone_id, owner_id, share_token=share_token)
+
     def get_by_share_token(self, share_token: str) -> Optional[Tombstone]:
         """Get a tombstone by share token"""
         return self.db.query(Tombstone).filter(Tombstone.share_token == share_token).first()
     
     def update_unlock_status_by_id(self, tombstone_id: int, is_unlocked: bool) -> bool:
         """Update unlock status for a specific tombstone"""
-        try:
-            tombstone = self.get_by_id(tombstone_id)
-            if tombstone:
-                tombstone.is_unlocked = is_unlocked
-                self.db.commit()
-                return True
-            return False
-        except Exception:
-            self.db.rollback()
-            return False
-    
-    def update_share_list(self, tombstone_id: int, share_json: str) -> bool:
-        """Update share list for a tombstone"""
-        try:
-            tombstone = self.get_by_id(tombstone_id)
-            if tombstone:
-                tombstone.share = share_json
-                self.db.commit()
-                return True
-            return False
-        except Exception:
-            self.db.rollback()
-            return False
-    
-    def update_invite_token(self, tombstone_id: int, invite_token: str) -> bool:
-        """Update invite token for a tombstone"""
-        try:
-            tombstone = self.get_by_id(tombstone_id)
-            if tombstone:
-                tombstone.invite_token = invite_token
-                self.db.commit()
-                return True
-            return False
-        except Exception:
-            self.db.rollback()
-            return False
-    
+        return self._update(tombstone_id, is_unlocked=is_unlocked)
+
+    def update_invite_token(
+        self,
+        tombstone_id: int,
+        invite_token: str,
+        owner_id: Optional[int] = None
+    ) -> bool:
+        """Update invite token for a tombstone (owner_id를 주면 소유자의 묘비일 때만)"""
+        return self._update(tombstone_id, owner_id, invite_token=invite_token)
+
+    def touch(self, tombstone_id: int, owner_id: Optional[int] = None) -> Optional[Tombstone]:
+        """
+        Bump updated_at of the owner's tombstone and return it (UPDATE ... RETURNING 한 번)
+
+        소유권 확인, 수정 시각 갱신, 응답에 쓸 행 조회를 한 문장으로 처리합니다.
+        소유자의 묘비가 아니거나 없으면 None (owner_id가 None이면 소유자를 확인하지 않음)
+        """
+        conditions = [Tombstone.id == tombstone_id]
+        if owner_id is not None:
+            conditions.append(Tombstone.user_id == owner_id)
+        stmt = (
+            update(Tombstone)
+            .where(*conditions)
+            .values(updated_at=get_kst_now())
+            .returning(Tombstone)
+            .execution_options(populate_existing=True)
+        )
+        tombstone = self.db.scalars(stmt).first()
+        commit(self.db)
+        return tombstone
+
+    def exists_by_id(self, tombstone_id: int) -> bool:
+        """Check whether a tombstone exists without loading the row"""
+        return self.db.query(Tombstone.id).filter(Tombstone.id == tombstone_id).first() is not None
+
+    def _update(self, tombstone_id: int, owner_id: Optional[int] = None, **values) -> bool:
+        """
+        묘비 한 행을 UPDATE ... RETURNING id 한 문장으로 수정합니다 (행을 먼저 읽지 않음)
+
+        unit_of_work 안에서는 커밋을 블록이 끝날 때로 미룹니다.
+        """
+        stmt = update(Tombstone).where(Tombstone.id == tombstone_id)
+        if owner_id is not None:
+            stmt = stmt.where(Tombstone.user_id == owner_id)
+        updated = self.db.execute(
+            stmt.values(**values).returning(Tombstone.id).execution_options(synchronize_session=False)
+        ).first()
+        commit(self.db)
+        return updated is not None
+
     def get_by_invite_token(self, invite_token: str) -> Optional[Tombstone]:
         """Get a tombstone by invite token"""
         return self.db.query(Tombstone).filter(Tombstone.invite_token == invite_token).first()
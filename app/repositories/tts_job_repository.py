@@ -0,0 +1,186 @@
+import uuid
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import and_, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.tombstone import get_kst_now
+from app.models.tts_job import (
+    TTS_JOB_DONE,
+    TTS_JOB_FAILED,
+    TTS_JOB_PENDING,
+    TTS_JOB_PROCESSING,
+    TTS_JOB_SOURCE_PRERENDER,
+    TTS_JOB_SOURCE_VIEW,
+    TTSJob,
+)
+
+ACTIVE_STATUSES = (TTS_JOB_PENDING, TTS_JOB_PROCESSING)
+
+
+def _claimable(now: datetime):
+    """대기 중이면서 처리 가능하거나, 처리 중이지만 lease가 만료된(워커 중단) 작업"""
+    return or_(
+        and_(TTSJob.status == TTS_JOB_PENDING, TTSJob.available_at <= now),
+        and_(TTSJob.status == TTS_JOB_PROCESSING, TTSJob.lease_expires_at < now)
+    )
+
+
+class TTSJobRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_by_id(self, job_id: int) -> Optional[TTSJob]:
+        """Get a single job by ID"""
+        return self.db.query(TTSJob).filter(TTSJob.id == job_id).first()
+
+    def get_active(self, tombstone_id: int) -> Optional[TTSJob]:
+        """Get the pending or processing job for a tombstone"""
+        return self.db.query(TTSJob).filter(
+            TTSJob.tombstone_id == tombstone_id,
+            TTSJob.status.in_(ACTIVE_STATUSES)
+        ).first()
+
+    def create(
+        self,
+        tombstone_id: int,
+        source: str = TTS_JOB_SOURCE_VIEW,
+        available_at: Optional[datetime] = None
+    ) -> TTSJob:
+        """
+        Create a new pending job
+
+        묘비당 활성 작업은 partial unique index로 하나만 허용되므로, 동시 요청이
+        먼저 만든 작업이 있으면 그 작업을 반환합니다.
+        """
+        job = TTSJob(
+            tombstone_id=tombstone_id,
+            status=TTS_JOB_PENDING,
+            source=source,
+            available_at=available_at or get_kst_now()
+        )
+        try:
+            self.db.add(job)
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            return self.get_active(tombstone_id)
+        self.db.refresh(job)
+        return job
+
+    def promote(self, job_id: int) -> None:
+        """미리 생성 예약된 작업을 조회 요청 작업으로 바꾸어 즉시 처리 가능하게 합니다"""
+        now = get_kst_now()
+        self.db.execute(
+            update(TTSJob)
+            .where(TTSJob.id == job_id, TTSJob.status == TTS_JOB_PENDING)
+            .values(source=TTS_JOB_SOURCE_VIEW, available_at=now, updated_at=now)
+        )
+        self.db.commit()
+
+    def promote_prerender(self, tombstone_ids: List[int]) -> int:
+        """Promote pending prerender jobs of the given tombstones so they run right away"""
+        if not tombstone_ids:
+            return 0
+        now = get_kst_now()
+        result = self.db.execute(
+            update(TTSJob)
+            .where(
+                TTSJob.tombstone_id.in_(tombstone_ids),
+                TTSJob.status == TTS_JOB_PENDING,
+                TTSJob.source == TTS_JOB_SOURCE_PRERENDER
+            )
+            .values(source=TTS_JOB_SOURCE_VIEW, available_at=now, updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        return result.rowcount
+
+    def claim_next(
+        self,
+        prerender_budget: Optional[int] = None,
+        lease_seconds: float = 300
+    ) -> Optional[TTSJob]:
+        """
+        처리 가능한 작업 하나를 processing으로 전환하고 lease를 잡아 반환합니다.
+
+        조건부 UPDATE로 선점하므로 여러 워커/프로세스가 동시에 호출해도
+        같은 작업을 두 번 가져가지 않습니다 (SQLite, PostgreSQL 공통).
+        lease가 만료된 작업은 워커가 중단된 것으로 보고 다시 가져갑니다.
+
+        Args:
+            prerender_budget: 동시에 처리할 수 있는 미리 생성(prerender) 작업 수.
+                이미 그만큼 처리 중이면 조회 요청 작업만 가져갑니다.
+            lease_seconds: 이 시간 안에 완료하지 못하면 다른 워커가 가져갈 수 있음
+        """
+        now = get_kst_now()
+        query = self.db.query(TTSJob.id).filter(_claimable(now))
+        if (
+            prerender_budget is not None
+            and self.count_processing(TTS_JOB_SOURCE_PRERENDER) >= prerender_budget
+        ):
+            query = query.filter(TTSJob.source != TTS_JOB_SOURCE_PRERENDER)
+
+        candidate_ids = [
+            row.id for row in query.order_by(TTSJob.available_at, TTSJob.id).limit(5)
+        ]
+
+        lease_owner = uuid.uuid4().hex
+        for job_id in candidate_ids:
+            result = self.db.execute(
+                update(TTSJob)
+                .where(TTSJob.id == job_id, _claimable(now))
+                .values(
+                    status=TTS_JOB_PROCESSING,
+                    attempts=TTSJob.attempts + 1,
+                    lease_owner=lease_owner,
+                    lease_expires_at=now + timedelta(seconds=lease_seconds),
+                    started_at=now,
+                    updated_at=now
+                )
+            )
+            self.db.commit()
+            if result.rowcount == 1:
+                return self.get_by_id(job_id)
+
+        return None
+
+    def _finish(self, job: TTSJob, commit: bool = True, **values) -> bool:
+        """lease를 가진 워커만 작업 상태를 바꿀 수 있습니다 (lease를 잃은 워커의 결과는 무시)"""
+        result = self.db.execute(
+            update(TTSJob)
+            .where(TTSJob.id == job.id, TTSJob.lease_owner == job.lease_owner)
+            .values(lease_owner=None, lease_expires_at=None, updated_at=get_kst_now(), **values)
+        )
+        if commit:
+            self.db.commit()
+        return result.rowcount == 1
+
+    def mark_done(self, job: TTSJob, commit: bool = True) -> bool:
+        """Mark a job as finished (commit=False면 호출한 쪽의 트랜잭션에 포함)"""
+        return self._finish(job, commit, status=TTS_JOB_DONE, error=None, finished_at=get_kst_now())
+
+    def reschedule(self, job: TTSJob, delay_seconds: float) -> bool:
+        """처리 중인 작업을 다시 대기 상태로 돌려 delay_seconds 후에 처리되게 합니다"""
+        return self._finish(
+            job,
+            status=TTS_JOB_PENDING,
+            available_at=get_kst_now() + timedelta(seconds=delay_seconds)
+        )
+
+    def mark_failed(self, job: TTSJob, error: str) -> bool:
+        """Mark a job as failed with the reason"""
+        return self._finish(job, status=TTS_JOB_FAILED, error=error, finished_at=get_kst_now())
+
+    def count_pending(self) -> int:
+        """Count jobs waiting to be processed"""
+        return self.db.query(TTSJob).filter(TTSJob.status == TTS_JOB_PENDING).count()
+
+    def count_processing(self, source: Optional[str] = None) -> int:
+        """Count jobs currently being processed, optionally by source"""
+        query = self.db.query(TTSJob).filter(TTSJob.status == TTS_JOB_PROCESSING)
+        if source:
+            query = query.filter(TTSJob.source == source)
+        return query.count()
@@ -0,0 +1,37 @@
+from contextlib import contextmanager
+from typing import Iterator
+
+from sqlalchemy.orm import Session
+
+_DEPTH_KEY = "unit_of_work_depth"
+
+
+@contextmanager
+def unit_of_work(db: Session) -> Iterator[Session]:
+    """
+    블록 안에서 호출한 저장소 변경을 한 트랜잭션으로 모아 블록이 끝날 때 한 번 커밋합니다.
+
+    예외가 나면 전체를 롤백합니다. 중첩되면 가장 바깥 블록만 커밋/롤백합니다.
+
+        with unit_of_work(db):
+            repository.update_share_token(...)
+            collaborator_repository.add(...)
+    """
+    db.info[_DEPTH_KEY] = db.info.get(_DEPTH_KEY, 0) + 1
+    outermost = db.info[_DEPTH_KEY] == 1
+    try:
+        yield db
+        if outermost:
+            db.commit()
+    except Exception:
+        if outermost:
+            db.rollback()
+        raise
+    finally:
+        db.info[_DEPTH_KEY] -= 1
+
+
+def commit(db: Session):
+    """unit_of_work 밖이면 바로 커밋하고, 안이면 블록이 끝날 때까지 미룹니다"""
+    if not db.info.get(_DEPTH_KEY):
+        db.commit()
@@ -1,3 +1,4 @@
 from app.routers.tombstone import router as tombstone_router
+from app.routers.tts import router as tts_router
 
-__all__ = ["tombstone_router"]
+__all__ = ["tombstone_router", "tts_router"]
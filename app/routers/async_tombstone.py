@@ -0,0 +1,131 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import env_config
+from app.models.async_database import get_async_db
+from app.models.user import User
+from app.routers.tombstone import invite_link_response, page_response, share_link_response
+from app.services.async_tombstone_service import AsyncTombstoneService
+from app.utils.async_auth import get_current_user_async
+
+# DATABASE_ASYNC=true일 때 app.routers.tombstone의 같은 경로보다 먼저 등록되는 비동기 라우트
+# 요청/응답 형식은 동기 라우트와 같으므로 API 문서에는 동기 라우트만 노출합니다.
+router = APIRouter(prefix="/api/graves", tags=["graves"], include_in_schema=False)
+
+
+@router.get("")
+async def list_graves(
+    limit: int = Query(env_config.graves_page_size, ge=1, le=env_config.graves_page_max),
+    cursor: Optional[str] = Query(None),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """묘비 목록 조회 (app.routers.tombstone.list_graves 참고)"""
+    try:
+        service = AsyncTombstoneService(db)
+        tombstones, next_cursor = await service.list_tombstones(
+            user_id=current_user.id, limit=limit, cursor=cursor
+        )
+        return page_response(tombstones, next_cursor)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"status": 400, "error": {"message": str(e)}}
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"status": 500, "error": {"message": str(e)}}
+        )
+
+
+@router.get("/shared-with-me")
+async def list_shared_graves(
+    limit: int = Query(env_config.graves_page_size, ge=1, le=env_config.graves_page_max),
+    cursor: Optional[str] = Query(None),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """공유받은 묘비 목록 조회 (app.routers.tombstone.list_shared_graves 참고)"""
+    try:
+        service = AsyncTombstoneService(db)
+        tombstones, next_cursor = await service.list_shared_tombstones(
+            user_id=current_user.id, limit=limit, cursor=cursor
+        )
+        return page_response(tombstones, next_cursor)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"status": 400, "error": {"message": str(e)}}
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"status": 500, "error": {"message": str(e)}}
+        )
+
+
+@router.post("/{grave_id}/share")
+async def create_share_link(
+    grave_id: int,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """묘비 공유 링크 생성 (app.routers.tombstone.create_share_link 참고)"""
+    try:
+        service = AsyncTombstoneService(db)
+        share_token = await service.generate_share_token(grave_id, current_user.id)
+
+        if not share_token:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={"status": 404, "error": {"message": "Grave not found"}}
+            )
+
+        return share_link_response(share_token)
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={"status": 403, "error": {"message": str(e)}}
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"status": 500, "error": {"message": str(e)}}
+        )
+
+
+@router.post("/{grave_id}/invite")
+async def create_invite_link(
+    grave_id: int,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """묘비 초대 링크 생성 (app.routers.tombstone.create_invite_link 참고)"""
+    try:
+        service = AsyncTombstoneService(db)
+        invite_token = await service.generate_invite_token(grave_id, current_user.id)
+
+        if not invite_token:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={"status": 404, "error": {"message": "Grave not found"}}
+            )
+
+        return invite_link_response(invite_token)
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={"status": 403, "error": {"message": str(e)}}
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"status": 500, "error": {"message": str(e)}}
+        )
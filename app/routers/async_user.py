@@ -0,0 +1,51 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.async_database import get_async_db
+from app.models.user import User
+from app.routers.user import sign_in_response, sign_out_response, sign_up_error, sign_up_response
+from app.schemas.user import UserSignInDto, UserSignUpDto
+from app.services.async_user_service import AsyncUserService
+from app.utils.async_auth import get_current_user_async
+
+# DATABASE_ASYNC=true일 때 app.routers.user의 같은 경로보다 먼저 등록되는 비동기 라우트
+# 회원탈퇴는 저장소 정리 예약과 함께 처리되므로 동기 라우트를 그대로 사용합니다.
+router = APIRouter(prefix="/api/users", tags=["users"], include_in_schema=False)
+
+
+@router.post("", status_code=status.HTTP_201_CREATED)
+async def sign_up(data: UserSignUpDto, db: AsyncSession = Depends(get_async_db)):
+    """회원가입 (app.routers.user.sign_up 참고)"""
+    try:
+        service = AsyncUserService(db)
+        user = await service.sign_up(data)
+
+        return sign_up_response(user)
+    except Exception as e:
+        raise sign_up_error(e)
+
+
+@router.post("/sign-in")
+async def sign_in(data: UserSignInDto, db: AsyncSession = Depends(get_async_db)):
+    """로그인 (app.routers.user.sign_in 참고)"""
+    try:
+        service = AsyncUserService(db)
+        token_data = await service.sign_in(data)
+
+        return sign_in_response(token_data)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail={"status": 401, "error": {"code": "INVALID_CREDENTIALS", "message": str(e)}}
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"status": 500, "error": {"message": str(e)}}
+        )
+
+
+@router.post("/sign-out")
+async def sign_out(current_user: User = Depends(get_current_user_async)):
+    """로그아웃 (app.routers.user.sign_out 참고)"""
+    return sign_out_response()
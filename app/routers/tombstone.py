@@ -1,20 +1,90 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import hashlib
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
+from app.core.config import env_config
 from app.models.database import get_db
 from app.models.user import User
+from app.services.audio_cache import audio_disk_cache
+from app.services.audio_transcoder import LOW_BITRATE_VARIANT
+from app.services.audio_url import get_audio_url
 from app.services.tombstone_service import TombstoneService
 from app.schemas.tombstone import CreateTombstoneDto, TombstoneResponseDto, UpdateShareDto, InviteLinkResponseDto
 from app.utils.auth import get_current_user
+from app.utils.client_hints import AUDIO_VARIANT_HINTS, select_audio_variant
 
 router = APIRouter(prefix="/api/graves", tags=["graves"])
 
 
+class CachedFileResponse(FileResponse):
+    """디스크 캐시에 고정한 파일을 전송하고, 끝나면 (연결이 끊겨도) 고정을 풉니다"""
+
+    def __init__(self, audio_key: str, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.audio_key = audio_key
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            audio_disk_cache.release(self.audio_key)
+
+
+def page_response(tombstones: List[TombstoneResponseDto], next_cursor: Optional[str]) -> dict:
+    """묘비 목록 페이지 응답 본문 (마지막 페이지면 next_cursor 생략)"""
+    data = {"result": [tombstone.model_dump(exclude_none=True) for tombstone in tombstones]}
+    if next_cursor:
+        data["next_cursor"] = next_cursor
+    return {"status": 200, "data": data}
+
+
+def share_link_response(share_token: str) -> dict:
+    """공유 링크 생성 응답 본문"""
+    # TODO: 실제 프론트엔드 URL로 변경 필요
+    share_url = f"https://timegrave.com/shared/{share_token}"
+    
+    return {
+        "status": 200,
+        "data": {
+            "result": {
+                "share_url": share_url,
+                "share_token": share_token,
+                "expires_at": None
+            },
+            "message": "공유 링크가 생성되었습니다. 친구에게 전달하세요!"
+        }
+    }
+
+
+def invite_link_response(invite_token: str) -> dict:
+    """초대 링크 생성 응답 본문"""
+    # TODO: 실제 프론트엔드 URL로 변경 필요
+    invite_url = f"https://timegrave.com/invite/{invite_token}"
+    
+    return {
+        "status": 200,
+        "data": {
+            "result": {
+                "invite_url": invite_url,
+                "invite_token": invite_token,
+                "message": (
+                    "친구들에게 이 링크를 공유하세요. "
+                    "링크를 통해 가입한 친구는 자동으로 쓰기 권한을 받습니다."
+                )
+            }
+        }
+    }
+
+
 @router.get(
     "",
     summary="묘비 목록 조회",
-    description="인증된 사용자의 모든 묘비 목록을 조회합니다. 잠금 상태와 관계없이 제목만 표시됩니다.",
+    description=(
+        "인증된 사용자의 묘비 목록을 잠금 해제 날짜 순으로 페이지 단위 조회합니다. "
+        "잠금 상태와 관계없이 제목만 표시됩니다."
+    ),
     response_description="묘비 목록",
     responses={
         200: {
@@ -44,7 +114,8 @@ router = APIRouter(prefix="/api/graves", tags=["graves"])
                                     "created_at": "2025-12-01T10:00:00",
                                     "updated_at": "2025-12-01T10:00:00"
                                 }
-                            ]
+                            ],
+                            "next_cursor": "WyIyMDI2LTEyLTAxIiwyXQ"
                         }
                     }
                 }
@@ -53,13 +124,23 @@ router = APIRouter(prefix="/api/graves", tags=["graves"])
     }
 )
 def list_graves(
+    limit: int = Query(
+        env_config.graves_page_size, ge=1, le=env_config.graves_page_max,
+        description="한 페이지의 묘비 수"
+    ),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (첫 페이지는 생략)"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
     ## 묘비 목록 조회
     
-    인증된 사용자의 모든 묘비를 조회합니다.
+    인증된 사용자의 묘비를 잠금 해제 날짜(unlock_date), id 순서로 조회합니다.
+    
+    ### 페이지 조회
+    - `limit`: 한 페이지의 묘비 수 (기본 50)
+    - 응답의 `next_cursor`를 `cursor`로 넘기면 다음 페이지를 조회합니다
+    - `next_cursor`가 없으면 마지막 페이지입니다
     
     ### 응답 내용
     - 잠금 상태: `title`, `days_remaining` 포함
@@ -70,14 +151,98 @@ def list_graves(
     """
     try:
         service = TombstoneService(db)
-        tombstones = service.list_tombstones(user_id=current_user.id)
+        tombstones, next_cursor = service.list_tombstones(
+            user_id=current_user.id, limit=limit, cursor=cursor
+        )
         
-        return {
-            "status": 200,
-            "data": {
-                "result": [tombstone.model_dump(exclude_none=True) for tombstone in tombstones]
+        return page_response(tombstones, next_cursor)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"status": 400, "error": {"message": str(e)}}
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={"status": 500, "error": {"message": str(e)}}
+        )
+
+
+@router.get(
+    "/shared-with-me",
+    summary="공유받은 묘비 목록 조회",
+    description=(
+        "다른 사용자의 묘비 중 쓰기 권한이 있거나(초대 수락, 공유 목록) "
+        "작성자(enroll)로 지정된 묘비를 페이지 단위로 조회합니다."
+    ),
+    response_description="공유받은 묘비 목록",
+    responses={
+        200: {
+            "description": "성공",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "status": 200,
+                        "data": {
+                            "result": [
+                                {
+                                    "id": 7,
+                                    "user_id": 2,
+                                    "title": "우리의 졸업 10주년",
+                                    "unlock_date": "2027-02-20",
+                                    "is_unlocked": False,
+                                    "days_remaining": 430,
+                                    "enroll": 2,
+                                    "share": [1, 3],
+                                    "created_at": "2025-12-01T10:00:00",
+                                    "updated_at": "2025-12-01T10:00:00"
+                                }
+                            ],
+                            "next_cursor": "WyIyMDI3LTAyLTIwIiw3XQ"
+                        }
+                    }
+                }
             }
         }
+    }
+)
+def list_shared_graves(
+    limit: int = Query(
+        env_config.graves_page_size, ge=1, le=env_config.graves_page_max,
+        description="한 페이지의 묘비 수"
+    ),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (첫 페이지는 생략)"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    ## 공유받은 묘비 목록 조회
+    
+    다른 사용자의 묘비 중 내가 함께 쓸 수 있는 묘비를
+    잠금 해제 날짜(unlock_date), id 순서로 조회합니다.
+    
+    ### 대상
+    - 초대 링크를 수락했거나 공유 목록(`share`)에 추가된 묘비
+    - 작성자(`enroll`)로 지정된 묘비
+    
+    ### 페이지 조회
+    - `GET /api/graves`와 같은 `limit`, `cursor`, `next_cursor` 사용
+    
+    ### 인증
+    - Bearer Token 필요
+    """
+    try:
+        service = TombstoneService(db)
+        tombstones, next_cursor = service.list_shared_tombstones(
+            user_id=current_user.id, limit=limit, cursor=cursor
+        )
+        
+        return page_response(tombstones, next_cursor)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"status": 400, "error": {"message": str(e)}}
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -202,6 +367,7 @@ def create_grave(
                                         "title": "나의 사랑하는 친구들에게",
                                         "content": "안녕, 미래의 나야. 오늘은 2025년 12월 1일이야. 1년 후의 너는 어떤 모습일까?",
                                         "audio_url": "https://kiroween.s3.ap-northeast-2.amazonaws.com/tombstone_1_1_1733011200.123.mp3",
+                                        "audio_status": "ready",
                                         "unlock_date": "2025-12-01",
                                         "is_unlocked": True,
                                         "created_at": "2025-11-01T10:00:00",
@@ -278,9 +444,11 @@ def get_grave(
     - `content`, `audio_url` 제외
     
     **잠금 해제 상태:**
-    - `title`, `content`, `audio_url` 포함
-    - TTS 음성이 없으면 자동 생성 후 S3 업로드
-    - 이후 조회 시 저장된 `audio_url` 재사용
+    - `title`, `content`, `audio_url`, `audio_status` 포함
+    - TTS 음성이 없으면 백그라운드 작업 큐에 생성 요청 후 즉시 응답 (`audio_status: pending`)
+    - 워커가 음성 생성 및 S3 업로드를 마치면 `audio_url`이 채워짐 (`audio_status: ready`)
+    - 생성에 실패하면 `audio_status: failed` (백오프 후 재시도 스위퍼가 다시 생성)
+    - `audio_url`은 일정 시간 후 만료되는 presigned URL이므로 저장하지 말고 매번 조회 결과를 사용
     
     ### 권한
     - 본인의 묘비만 조회 가능
@@ -320,6 +488,123 @@ def get_grave(
         )
 
 
+@router.get(
+    "/{grave_id}/audio",
+    summary="묘비 음성 스트리밍",
+    description=(
+        "잠금 해제된 묘비의 TTS 음성을 직접 전송합니다. "
+        "Range 요청을 지원하여 재생 위치 이동이 가능하고, "
+        "데이터 절약 환경에서는 저비트레이트 Opus를 전송합니다."
+    ),
+    response_description="음성 파일 (audio/mpeg 또는 audio/ogg)",
+    responses={
+        200: {"description": "전체 파일", "content": {"audio/mpeg": {}, "audio/ogg": {}}},
+        206: {
+            "description": "Range 요청에 대한 부분 응답",
+            "content": {"audio/mpeg": {}, "audio/ogg": {}}
+        },
+        304: {"description": "If-None-Match의 ETag와 같음 (클라이언트 캐시 사용)"},
+        403: {
+            "description": "권한 없음 또는 잠금 해제 전",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "status": 403,
+                        "error": {
+                            "message": "You don't have permission to access this tombstone"
+                        }
+                    }
+                }
+            }
+        },
+        404: {
+            "description": "묘비가 없거나 음성이 아직 준비되지 않음",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "status": 404,
+                        "error": {
+                            "message": "Audio is not ready yet"
+                        }
+                    }
+                }
+            }
+        }
+    }
+)
+def get_grave_audio(
+    grave_id: int,
+    request: Request,
+    quality: Optional[str] = Query(
+        None,
+        pattern="^(low|original)$",
+        description="low: 저비트레이트 Opus, original: 원본 MP3 (생략 시 client hint로 선택)"
+    ),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    ## 묘비 음성 스트리밍
+    
+    presigned URL 대신 API 서버가 음성을 직접 전송합니다.
+    
+    ### 동작 방식
+    - 서버의 로컬 디스크 캐시(LRU)에 있으면 디스크에서 바로 전송, 없으면 저장소에서 한 번 받아 캐시
+    - `Range: bytes=start-end` 요청 시 `206 Partial Content`로 해당 구간만 전송
+    - `ETag`, `Last-Modified`, `Cache-Control` 헤더 포함
+    - `If-None-Match`가 ETag와 같으면 `304 Not Modified`
+    
+    ### 음성 형식 선택
+    - `Save-Data: on`, `ECT: 2g/3g`, `Downlink` < 1.5 client hint가 있으면
+      저비트레이트 Opus(`audio/ogg`) 전송
+    - `quality=low|original`로 직접 지정 가능
+    - 변환 음성이 아직 없거나 `Accept`가 `audio/ogg`를 허용하지 않으면 원본 MP3 전송
+    
+    ### 권한
+    - 본인의 잠금 해제된 묘비만 조회 가능
+    
+    ### 인증
+    - Bearer Token 필요
+    """
+    variant = select_audio_variant(
+        request.headers, quality, LOW_BITRATE_VARIANT.name, LOW_BITRATE_VARIANT.media_type
+    )
+    try:
+        audio_key = TombstoneService(db).get_audio_key(grave_id, current_user.id, variant)
+    except ValueError as e:
+        error_msg = str(e)
+        status_code = status.HTTP_403_FORBIDDEN if (
+            "permission" in error_msg or "not yet unlocked" in error_msg
+        ) else status.HTTP_404_NOT_FOUND
+        raise HTTPException(
+            status_code=status_code,
+            detail={"status": status_code, "error": {"message": error_msg}}
+        )
+    
+    # key는 음성 내용의 해시로 만들어지므로 key가 같으면 내용도 같음
+    headers = {
+        "ETag": f'"{hashlib.sha256(audio_key.encode("utf-8")).hexdigest()[:32]}"',
+        "Cache-Control": f"private, max-age={env_config.audio_cache_max_age}, immutable",
+        "Vary": ", ".join(AUDIO_VARIANT_HINTS + ("Accept",)),
+        "Accept-CH": ", ".join(AUDIO_VARIANT_HINTS)
+    }
+    if headers["ETag"] in request.headers.get("if-none-match", ""):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    is_low = audio_key.endswith(f".{LOW_BITRATE_VARIANT.extension}")
+    media_type = LOW_BITRATE_VARIANT.media_type if is_low else "audio/mpeg"
+    # 전송이 끝날 때까지 캐시 정리로 파일이 지워지지 않도록 고정
+    path = audio_disk_cache.get(audio_key, pin=True)
+    if path is None:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail={"status": 502, "error": {"message": "Audio file is unavailable"}}
+        )
+    
+    # FileResponse가 Range/If-Range를 처리하고, 서버가 지원하면 pathsend(zero-copy)로 전송
+    return CachedFileResponse(audio_key, path, media_type=media_type, headers=headers)
+
+
 @router.post(
     "/unlock-check",
     status_code=status.HTTP_200_OK,
@@ -338,6 +623,7 @@ def manual_unlock_check(
     
     ### 동작 방식
     - `unlock_date <= 오늘` 인 묘비들을 `is_unlocked = true`로 변경
+    - `UNLOCK_SWEEP_CHUNK_SIZE`개씩 나누어 커밋하며, 중단되면 다음 실행이 이어서 처리
     - 자정 스케줄러와 동일한 로직
     
     ### 용도
@@ -434,20 +720,9 @@ def create_share_link(
                 detail={"status": 404, "error": {"message": "Grave not found"}}
             )
         
-        # TODO: 실제 프론트엔드 URL로 변경 필요
-        share_url = f"https://timegrave.com/shared/{share_token}"
-        
-        return {
-            "status": 200,
-            "data": {
-                "result": {
-                    "share_url": share_url,
-                    "share_token": share_token,
-                    "expires_at": None
-                },
-                "message": "공유 링크가 생성되었습니다. 친구에게 전달하세요!"
-            }
-        }
+        return share_link_response(share_token)
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -546,7 +821,7 @@ def view_shared_grave(
                     "id": tombstone.id,
                     "title": tombstone.title,
                     "content": tombstone.content,
-                    "audio_url": tombstone.audio_url,
+                    "audio_url": get_audio_url(tombstone),
                     "unlock_date": tombstone.unlock_date.isoformat(),
                     "is_unlocked": tombstone.is_unlocked,
                     "created_at": tombstone.created_at.isoformat(),
@@ -616,7 +891,7 @@ def copy_shared_grave(
     1. share_token으로 원본 묘비 조회
     2. 내 계정에 복사본 생성
     3. 제목에 "[공유받음]" 접두사 추가
-    4. 동일한 audio_url 재사용
+    4. 동일한 음성 파일 재사용
     
     ### 제약사항
     - 잠금 해제된 묘비만 복사 가능
@@ -728,19 +1003,9 @@ def create_invite_link(
                 detail={"status": 404, "error": {"message": "Grave not found"}}
             )
         
-        # TODO: 실제 프론트엔드 URL로 변경 필요
-        invite_url = f"https://timegrave.com/invite/{invite_token}"
-        
-        return {
-            "status": 200,
-            "data": {
-                "result": {
-                    "invite_url": invite_url,
-                    "invite_token": invite_token,
-                    "message": "친구들에게 이 링크를 공유하세요. 링크를 통해 가입한 친구는 자동으로 쓰기 권한을 받습니다."
-                }
-            }
-        }
+        return invite_link_response(invite_token)
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
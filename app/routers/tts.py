@@ -0,0 +1,67 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.models.database import get_db
+from app.models.tts_job import TTS_JOB_SOURCE_PRERENDER
+from app.repositories.audio_asset_repository import AudioAssetRepository
+from app.repositories.tts_job_repository import TTSJobRepository
+from app.services.audio_cache import audio_disk_cache
+from app.services.audio_transcoder import audio_transcoder
+from app.services.http_client import tts_http_client
+from app.services.tts_rate_limiter import tts_rate_limiter
+from app.utils.auth import require_internal_token
+
+# 운영용 라우트: 공개 API 문서에서 제외하고 INTERNAL_API_TOKEN으로만 호출
+router = APIRouter(
+    prefix="/api/tts",
+    tags=["tts"],
+    include_in_schema=False,
+    dependencies=[Depends(require_internal_token)]
+)
+
+
+@router.get(
+    "/stats",
+    summary="TTS 연동 상태 조회 (운영용)",
+    description=(
+        "Supertone API 호출 한도, 동시 요청 수, 작업 큐 길이, "
+        "HTTP 커넥션 풀 사용 현황을 조회합니다."
+    ),
+    response_description="TTS 연동 상태"
+)
+def get_tts_stats(db: Session = Depends(get_db)):
+    """
+    ## TTS 연동 상태 조회
+    
+    ### 응답 내용
+    - `http_pool`: 커넥션 풀 크기, 진행 중인 요청 수, 호스트별 유휴/사용 중 커넥션 수
+    - `rate_limit`: 이 프로세스의 동시 요청 한도(AIMD), 공유 token bucket의 남은 토큰,
+      응답 결과 집계
+    - `queue`: 대기 중/처리 중인 TTS 작업 수 (전체 프로세스 기준)
+    - `audio_cache`: 음성 프록시 디스크 캐시 사용량과 hit/miss 수
+    - `transcode`: 저비트레이트 변환 음성 생성 완료/실패/건너뜀 수
+    - `storage`: 저장된 음성 파일 수와 전체 크기 (렌더 때 기록한 크기 기준, 저장소를 조회하지 않음)
+    
+    ### 인증
+    - `X-Internal-Token` 헤더 필요 (`INTERNAL_API_TOKEN`, 설정하지 않으면 404)
+    """
+    job_repository = TTSJobRepository(db)
+    return {
+        "status": 200,
+        "data": {
+            "result": {
+                "http_pool": tts_http_client.pool_stats(),
+                "rate_limit": tts_rate_limiter.stats(),
+                "audio_cache": audio_disk_cache.stats(),
+                "transcode": audio_transcoder.stats(),
+                "storage": AudioAssetRepository(db).get_storage_totals(),
+                "queue": {
+                    "pending": job_repository.count_pending(),
+                    "processing": job_repository.count_processing(),
+                    "processing_prerender": job_repository.count_processing(
+                        TTS_JOB_SOURCE_PRERENDER
+                    )
+                }
+            }
+        }
+    }
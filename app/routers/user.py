@@ -4,12 +4,72 @@ from sqlalchemy.orm import Session
 from app.models.database import get_db
 from app.models.user import User
 from app.services.user_service import UserService
-from app.schemas.user import UserSignUpDto, UserSignInDto
+from app.schemas.user import UserSignUpDto, UserSignInDto, UserResponseDto, TokenResponseDto
 from app.utils.auth import get_current_user
 
 router = APIRouter(prefix="/api/users", tags=["users"])
 
 
+def sign_up_response(user: UserResponseDto) -> dict:
+    """회원가입 응답 본문"""
+    return {
+        "status": 201,
+        "data": {
+            "result": {
+                "id": user.id,
+                "email": user.email,
+                "username": user.username,
+                "created_at": user.created_at
+            },
+            "message": f"환영합니다, {user.username}님. TimeGrave에 오신 것을 환영합니다."
+        }
+    }
+
+
+def sign_up_error(e: Exception) -> HTTPException:
+    """회원가입 실패 → 400 응답"""
+    error_message = str(e)
+    # Determine error code based on error message
+    if isinstance(e, ValueError) and "이미 사용 중인 이메일" in error_message:
+        error_code = "EMAIL_ALREADY_EXISTS"
+    else:
+        error_code = "VALIDATION_ERROR"
+    
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail={"status": 400, "error": {"code": error_code, "message": error_message}}
+    )
+
+
+def sign_in_response(token_data: TokenResponseDto) -> dict:
+    """로그인 응답 본문"""
+    return {
+        "status": 200,
+        "data": {
+            "result": {
+                "user": {
+                    "id": token_data.user.id,
+                    "email": token_data.user.email,
+                    "username": token_data.user.username
+                },
+                "session_token": token_data.session_token,
+                "expires_at": token_data.expires_at
+            },
+            "message": "다시 돌아오신 것을 환영합니다."
+        }
+    }
+
+
+def sign_out_response() -> dict:
+    """로그아웃 응답 본문 (JWT는 stateless이므로 서버에서 할 일은 없음)"""
+    return {
+        "status": 200,
+        "data": {
+            "message": "안전하게 로그아웃되었습니다. 다음에 또 만나요."
+        }
+    }
+
+
 @router.post(
     "",
     status_code=status.HTTP_201_CREATED,
@@ -71,35 +131,9 @@ def sign_up(data: UserSignUpDto, db: Session = Depends(get_db)):
         service = UserService(db)
         user = service.sign_up(data)
         
-        return {
-            "status": 201,
-            "data": {
-                "result": {
-                    "id": user.id,
-                    "email": user.email,
-                    "username": user.username,
-                    "created_at": user.created_at
-                },
-                "message": f"환영합니다, {user.username}님. TimeGrave에 오신 것을 환영합니다."
-            }
-        }
-    except ValueError as e:
-        error_message = str(e)
-        # Determine error code based on error message
-        if "이미 사용 중인 이메일" in error_message:
-            error_code = "EMAIL_ALREADY_EXISTS"
-        else:
-            error_code = "VALIDATION_ERROR"
-        
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={"status": 400, "error": {"code": error_code, "message": error_message}}
-        )
+        return sign_up_response(user)
     except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={"status": 400, "error": {"code": "VALIDATION_ERROR", "message": str(e)}}
-        )
+        raise sign_up_error(e)
 
 
 @router.post(
@@ -169,21 +203,7 @@ def sign_in(data: UserSignInDto, db: Session = Depends(get_db)):
         service = UserService(db)
         token_data = service.sign_in(data)
         
-        return {
-            "status": 200,
-            "data": {
-                "result": {
-                    "user": {
-                        "id": token_data.user.id,
-                        "email": token_data.user.email,
-                        "username": token_data.user.username
-                    },
-                    "session_token": token_data.session_token,
-                    "expires_at": token_data.expires_at
-                },
-                "message": "다시 돌아오신 것을 환영합니다."
-            }
-        }
+        return sign_in_response(token_data)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -215,12 +235,7 @@ def sign_out(current_user: User = Depends(get_current_user)):
     - JWT는 stateless이므로 서버에서 토큰을 무효화하지 않음
     - 클라이언트에서 토큰을 삭제해야 함
     """
-    return {
-        "status": 200,
-        "data": {
-            "message": "안전하게 로그아웃되었습니다. 다음에 또 만나요."
-        }
-    }
+    return sign_out_response()
 
 
 @router.delete(
@@ -33,7 +33,18 @@ class TombstoneResponseDto(BaseModel):
     user_id: int = Field(..., description="사용자 ID")
     title: str = Field(..., description="묘비 제목")
     content: Optional[str] = Field(None, description="묘비 내용 (잠금 해제된 경우에만 포함)")
-    audio_url: Optional[str] = Field(None, description="TTS 음성 파일 S3 URL (잠금 해제된 경우에만 포함)")
+    audio_url: Optional[str] = Field(
+        None,
+        description="TTS 음성 파일 presigned URL (잠금 해제된 경우에만 포함, 일정 시간 후 만료)"
+    )
+    audio_status: Optional[str] = Field(
+        None, description="TTS 음성 생성 상태: pending/ready/failed (잠금 해제된 경우에만 포함)"
+    )
+    audio_duration_ms: Optional[int] = Field(
+        None, description="음성 재생 시간 (ms, 음성이 준비된 경우에만 포함)"
+    )
+    audio_size_bytes: Optional[int] = Field(None, description="음성 파일 크기 (bytes)")
+    audio_codec: Optional[str] = Field(None, description="음성 코덱 (예: mp3)")
     unlock_date: str = Field(..., description="잠금 해제 날짜 (ISO 8601)")
     is_unlocked: bool = Field(..., description="잠금 해제 여부")
     days_remaining: Optional[int] = Field(None, description="잠금 해제까지 남은 일수 (잠금 상태인 경우에만 포함)")
@@ -54,6 +65,10 @@ class TombstoneResponseDto(BaseModel):
                     "title": "나의 사랑하는 친구들에게",
                     "content": "안녕, 미래의 나야. 오늘은 2025년 12월 1일이야...",
                     "audio_url": "https://kiroween.s3.ap-northeast-2.amazonaws.com/tombstone_1_1_1733011200.123.mp3",
+                    "audio_status": "ready",
+                    "audio_duration_ms": 12408,
+                    "audio_size_bytes": 198528,
+                    "audio_codec": "mp3",
                     "unlock_date": "2025-12-01",
                     "is_unlocked": True,
                     "created_at": "2025-12-01T10:30:00",
@@ -96,7 +111,9 @@ class SharedTombstoneViewDto(BaseModel):
     id: int = Field(..., description="묘비 ID")
     title: str = Field(..., description="묘비 제목")
     content: str = Field(..., description="묘비 내용")
-    audio_url: Optional[str] = Field(None, description="TTS 음성 파일 S3 URL")
+    audio_url: Optional[str] = Field(
+        None, description="TTS 음성 파일 presigned URL (일정 시간 후 만료)"
+    )
     unlock_date: str = Field(..., description="잠금 해제 날짜")
     is_unlocked: bool = Field(..., description="잠금 해제 여부")
     created_at: str = Field(..., description="생성 시간")
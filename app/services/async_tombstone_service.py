@@ -0,0 +1,87 @@
+import secrets
+import uuid
+from typing import List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.async_tombstone_repository import AsyncTombstoneRepository
+from app.schemas.tombstone import TombstoneResponseDto
+from app.services.tombstone_service import list_item_response, merge_share_lists, split_page
+from app.utils.cursor import decode_cursor
+
+
+class AsyncTombstoneService:
+    """
+    TombstoneService 중 DB만 쓰는 기능의 비동기 버전 (DATABASE_ASYNC 라우트용)
+
+    응답 형식과 오류 메시지는 TombstoneService와 같습니다.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.repository = AsyncTombstoneRepository(db)
+
+    async def list_tombstones(
+        self,
+        user_id: int,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[TombstoneResponseDto], Optional[str]]:
+        """
+        List a page of tombstones for a user - always shows only title, never content
+
+        Raises:
+            ValueError: cursor 형식이 잘못된 경우
+        """
+        after = decode_cursor(cursor) if cursor else None
+        tombstones = await self.repository.get_page(user_id, limit + 1, after)
+        return await self._list_page(tombstones, limit)
+
+    async def list_shared_tombstones(
+        self,
+        user_id: int,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[TombstoneResponseDto], Optional[str]]:
+        """
+        List a page of other users' tombstones the user collaborates on or authored (enroll)
+
+        Raises:
+            ValueError: cursor 형식이 잘못된 경우
+        """
+        after = decode_cursor(cursor) if cursor else None
+        tombstones = await self.repository.get_shared_page(user_id, limit + 1, after)
+        return await self._list_page(tombstones, limit)
+
+    async def _list_page(
+        self, tombstones, limit: int
+    ) -> Tuple[List[TombstoneResponseDto], Optional[str]]:
+        """limit + 1개 읽은 목록 행을 응답 DTO와 next_cursor로 변환합니다"""
+        tombstones, next_cursor = split_page(tombstones, limit)
+        collaborators = await self.repository.get_collaborator_ids(t.id for t in tombstones)
+        share_lists = merge_share_lists(tombstones, collaborators)
+        items = [list_item_response(row, share_lists[row.id]) for row in tombstones]
+        return items, next_cursor
+
+    async def generate_share_token(self, tombstone_id: int, user_id: int) -> Optional[str]:
+        """Generate a share token for a tombstone"""
+        share_token = secrets.token_urlsafe(16)
+
+        # 소유자의 묘비일 때만 저장 (UPDATE 한 번, 실패했을 때만 원인 확인)
+        if await self.repository.update_share_token(tombstone_id, share_token, owner_id=user_id):
+            return share_token
+
+        if not await self.repository.exists_by_id(tombstone_id):
+            return None
+        raise ValueError("You don't have permission to share this tombstone")
+
+    async def generate_invite_token(self, tombstone_id: int, user_id: int) -> Optional[str]:
+        """Generate an invite token for a tombstone"""
+        invite_token = str(uuid.uuid4())
+
+        if await self.repository.update_invite_token(tombstone_id, invite_token, owner_id=user_id):
+            return invite_token
+
+        if not await self.repository.exists_by_id(tombstone_id):
+            return None
+        raise ValueError("You don't have permission to create invite link for this tombstone")
@@ -0,0 +1,50 @@
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.async_user_repository import AsyncUserRepository
+from app.schemas.user import TokenResponseDto, UserResponseDto, UserSignInDto, UserSignUpDto
+from app.services.user_service import issue_token, user_response
+from app.utils.auth import get_password_hash, verify_password
+
+
+class AsyncUserService:
+    """
+    UserService의 회원가입/로그인 비동기 버전 (DATABASE_ASYNC 라우트용)
+
+    bcrypt 해싱은 CPU를 오래 쓰므로 이벤트 루프를 막지 않도록 스레드풀에서 실행합니다.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.user_repository = AsyncUserRepository(db)
+
+    async def sign_up(self, data: UserSignUpDto) -> UserResponseDto:
+        """회원가입"""
+        # 이메일 중복 확인
+        existing_user = await self.user_repository.get_by_email(data.email)
+        if existing_user:
+            raise ValueError("이미 사용 중인 이메일입니다.")
+
+        # 비밀번호 해싱
+        hashed_password = await run_in_threadpool(get_password_hash, data.password)
+
+        # 사용자 생성
+        user = await self.user_repository.create(
+            email=data.email,
+            username=data.username,
+            hashed_password=hashed_password
+        )
+
+        return user_response(user)
+
+    async def sign_in(self, data: UserSignInDto) -> TokenResponseDto:
+        """로그인"""
+        user = await self.user_repository.get_by_email(data.email)
+        if not user:
+            raise ValueError("이메일 또는 비밀번호가 올바르지 않습니다.")
+
+        # 비밀번호 검증
+        if not await run_in_threadpool(verify_password, data.password, user.hashed_password):
+            raise ValueError("이메일 또는 비밀번호가 올바르지 않습니다.")
+
+        return issue_token(user)
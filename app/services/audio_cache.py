@@ -0,0 +1,159 @@
+import hashlib
+import logging
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from app.core.config import env_config
+from app.services.storage import StorageBackend, get_storage
+
+logger = logging.getLogger(__name__)
+
+
+class AudioDiskCache:
+    """
+    저장소 앞에 두는 크기 제한 로컬 디스크 LRU 캐시
+
+    음성 key는 내용 해시로 만들어져 내용이 바뀌지 않으므로 만료 없이 캐시하고,
+    전체 크기가 max_bytes를 넘으면 오래 쓰지 않은 파일부터 지웁니다.
+    같은 key를 동시에 요청하면 한 번만 내려받습니다.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_bytes: int,
+        storage_factory: Callable[[], StorageBackend] = get_storage
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.storage_factory = storage_factory
+        self._entries: "OrderedDict[str, int]" = OrderedDict()  # 파일명 → 크기 (오래된 순)
+        self._total_bytes = 0
+        self._loaded = False
+        self._lock = threading.Lock()
+        self._fetch_locks: Dict[str, threading.Lock] = {}
+        self._pins: Dict[str, int] = {}  # 파일명 → 전송 중인 요청 수 (정리하지 않음)
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self):
+        """재시작 후에도 남아 있는 캐시 파일을 최근 접근 순으로 다시 등록"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        files = [
+            path for path in self.cache_dir.iterdir()
+            if path.is_file() and not path.name.startswith(".")
+        ]
+        for path in sorted(files, key=lambda p: p.stat().st_atime):
+            size = path.stat().st_size
+            self._entries[path.name] = size
+            self._total_bytes += size
+        self._loaded = True
+
+    @staticmethod
+    def _file_name(key: str) -> str:
+        return hashlib.sha256(key.encode("utf-8")).hexdigest() + Path(key).suffix
+
+    def get(self, key: str, pin: bool = False) -> Optional[Path]:
+        """
+        key에 해당하는 로컬 파일 경로를 반환합니다. 없으면 저장소에서 내려받습니다.
+
+        pin=True이면 release(key)를 호출할 때까지 파일을 지우지 않으므로
+        경로를 반환한 뒤 전송을 시작하기 전에 다른 요청의 정리로 사라지지 않습니다.
+
+        Returns:
+            캐시된 파일 경로, 저장소에 파일이 없거나 내려받지 못하면 None
+        """
+        name = self._file_name(key)
+        path = self.cache_dir / name
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            if self._touch(name, path):
+                self.hits += 1
+                self._pin(name, pin)
+                return path
+            fetch_lock = self._fetch_locks.setdefault(name, threading.Lock())
+
+        with fetch_lock:
+            try:
+                with self._lock:
+                    # 기다리는 동안 다른 요청이 내려받았을 수 있음
+                    if self._touch(name, path):
+                        self.hits += 1
+                        self._pin(name, pin)
+                        return path
+                    self.misses += 1
+
+                tmp_path = self.cache_dir / f".{name}.{uuid.uuid4().hex}"
+                try:
+                    if not self.storage_factory().download_audio(key, str(tmp_path)):
+                        return None
+                    os.replace(tmp_path, path)
+                finally:
+                    tmp_path.unlink(missing_ok=True)
+
+                with self._lock:
+                    size = path.stat().st_size
+                    self._entries[name] = size
+                    self._total_bytes += size
+                    self._pin(name, pin)
+                    self._evict(keep=name)
+                return path
+            finally:
+                # 실패한 경우에도 key별 lock을 남기지 않음
+                with self._lock:
+                    if self._fetch_locks.get(name) is fetch_lock:
+                        del self._fetch_locks[name]
+
+    def release(self, key: str):
+        """get(key, pin=True)로 고정한 파일을 다시 정리 대상으로 돌립니다"""
+        name = self._file_name(key)
+        with self._lock:
+            count = self._pins.get(name, 0) - 1
+            if count > 0:
+                self._pins[name] = count
+            else:
+                self._pins.pop(name, None)
+
+    def _pin(self, name: str, pin: bool):
+        if pin:
+            self._pins[name] = self._pins.get(name, 0) + 1
+
+    def _touch(self, name: str, path: Path) -> bool:
+        if name not in self._entries:
+            return False
+        if not path.exists():
+            self._total_bytes -= self._entries.pop(name)
+            return False
+        self._entries.move_to_end(name)
+        return True
+
+    def _evict(self, keep: str):
+        for name, size in list(self._entries.items()):
+            if self._total_bytes <= self.max_bytes or len(self._entries) <= 1:
+                break
+            if name == keep or name in self._pins:
+                continue  # 방금 받은 파일, 전송 중인 파일은 남김
+            del self._entries[name]
+            self._total_bytes -= size
+            (self.cache_dir / name).unlink(missing_ok=True)
+            logger.info(f"🧹 Evicted cached audio {name}")
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+
+audio_disk_cache = AudioDiskCache(
+    cache_dir=env_config.audio_cache_dir,
+    max_bytes=env_config.audio_cache_max_mb * 1024 * 1024
+)
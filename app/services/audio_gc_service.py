@@ -0,0 +1,99 @@
+import logging
+import time
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.repositories.audio_asset_repository import AudioAssetRepository
+from app.repositories.tombstone_repository import TombstoneRepository
+from app.services.audio_transcoder import source_storage_key
+from app.services.storage import StorageBackend, StoredObject, get_storage
+
+logger = logging.getLogger(__name__)
+
+
+class AudioGCService:
+    """어떤 묘비/에셋도 가리키지 않는 음성 파일(고아 파일)을 찾아 삭제하는 로직"""
+
+    def __init__(self, db: Session, storage: Optional[StorageBackend] = None):
+        self.tombstone_repository = TombstoneRepository(db)
+        self.asset_repository = AudioAssetRepository(db)
+        self._storage = storage
+
+    @property
+    def storage(self) -> StorageBackend:
+        return self._storage or get_storage()
+
+    def collect(
+        self,
+        grace_seconds: float,
+        batch_size: int = 1000,
+        prefix: str = "",
+        dry_run: bool = False,
+        now: Optional[float] = None
+    ) -> dict:
+        """
+        저장소 목록을 페이지 단위로 읽으며 고아 파일을 삭제합니다.
+
+        목록을 batch_size개씩 모아 그 key들(변환 음성은 원본 key)만 DB에서 조회
+        (tombstones.audio_key, audio_assets.storage_key)하므로 저장소와 DB 어느 쪽도 전체를 메모리에
+        올리지 않습니다. 수정된 지 grace_seconds가 지나지 않은 파일은 업로드 직후
+        DB에 기록되기 전일 수 있으므로 건드리지 않습니다.
+
+        Returns:
+            검사/삭제 결과 통계 (bytes_reclaimed 포함)
+
+        Raises:
+            ValueError: 아직 key로 변환되지 않은 예전 audio_url이 남아 있는 경우
+        """
+        unconverted = self.tombstone_repository.count_unconverted_audio_urls()
+        if unconverted:
+            raise ValueError(
+                f"{unconverted} tombstones still store a legacy audio_url; "
+                "start the app once so backfill_audio_keys converts them first"
+            )
+
+        cutoff = (now if now is not None else time.time()) - grace_seconds
+        report = {
+            "scanned": 0,
+            "skipped_recent": 0,
+            "referenced": 0,
+            "orphaned": 0,
+            "deleted": 0,
+            "failed": 0,
+            "bytes_reclaimed": 0,
+            "dry_run": dry_run
+        }
+
+        batch: List[StoredObject] = []
+        for obj in self.storage.list_objects(prefix):
+            report["scanned"] += 1
+            if obj.last_modified > cutoff:
+                report["skipped_recent"] += 1
+                continue
+            batch.append(obj)
+            if len(batch) >= batch_size:
+                self._collect_batch(batch, dry_run, report)
+                batch = []
+        if batch:
+            self._collect_batch(batch, dry_run, report)
+
+        logger.info(f"🧹 Audio GC finished: {report}")
+        return report
+
+    def _collect_batch(self, batch: List[StoredObject], dry_run: bool, report: dict):
+        # 변환 음성은 원본 MP3가 참조되는 동안 유지
+        sources = {obj.key: source_storage_key(obj.key) for obj in batch}
+        referenced = self.tombstone_repository.get_referenced_audio_keys(set(sources.values()))
+        referenced |= self.asset_repository.get_existing_storage_keys(set(sources.values()))
+        orphans = [obj for obj in batch if sources[obj.key] not in referenced]
+        report["referenced"] += len(batch) - len(orphans)
+        report["orphaned"] += len(orphans)
+        if not orphans or dry_run:
+            return
+
+        failed = set(self.storage.delete_many([obj.key for obj in orphans]))
+        deleted = [obj for obj in orphans if obj.key not in failed]
+        report["deleted"] += len(deleted)
+        report["failed"] += len(failed)
+        report["bytes_reclaimed"] += sum(obj.size for obj in deleted)
@@ -0,0 +1,230 @@
+import json
+import logging
+import multiprocessing
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from pathlib import PurePosixPath
+from typing import Callable, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import env_config
+from app.models.database import SessionLocal
+from app.repositories.tombstone_repository import TombstoneRepository
+from app.services.storage import StorageBackend, get_storage
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class AudioVariant:
+    """원본 MP3에서 만들어 두는 변환 음성"""
+    name: str
+    codec: str  # ffmpeg 인코더
+    bitrate: str
+    extension: str
+    media_type: str
+
+
+# 모바일 데이터 환경용 저비트레이트 Opus (음성은 24kbps에서도 충분히 명료)
+LOW_BITRATE_VARIANT = AudioVariant("low", "libopus", "24k", "opus", "audio/ogg")
+AUDIO_VARIANTS: Dict[str, AudioVariant] = {LOW_BITRATE_VARIANT.name: LOW_BITRATE_VARIANT}
+
+
+def variant_storage_key(storage_key: str, variant_name: str) -> str:
+    """원본 key 옆에 저장할 변환 음성의 key (audio/<hash>.mp3 → audio/<hash>.low.opus)"""
+    variant = AUDIO_VARIANTS[variant_name]
+    path = PurePosixPath(storage_key)
+    return str(path.with_name(f"{path.stem}.{variant.name}.{variant.extension}"))
+
+
+def source_storage_key(storage_key: str) -> str:
+    """변환 음성 key이면 원본 MP3 key를, 아니면 그대로 반환합니다"""
+    path = PurePosixPath(storage_key)
+    for variant in AUDIO_VARIANTS.values():
+        suffix = f".{variant.name}.{variant.extension}"
+        if path.name.endswith(suffix):
+            return str(path.with_name(path.name[:-len(suffix)] + ".mp3"))
+    return storage_key
+
+
+def transcode_file(source_path: str, dest_path: str, variant: AudioVariant):
+    """
+    ffmpeg로 source_path를 variant 형식으로 변환합니다 (프로세스 풀에서 실행)
+
+    Raises:
+        RuntimeError: ffmpeg가 실패한 경우
+    """
+    command = [
+        env_config.ffmpeg_path, "-nostdin", "-hide_banner", "-loglevel", "error", "-y",
+        "-i", source_path,
+        "-vn", "-ac", "1", "-c:a", variant.codec, "-b:a", variant.bitrate,
+        "-application", "voip",
+        dest_path
+    ]
+    result = subprocess.run(
+        command, capture_output=True, timeout=env_config.audio_transcode_timeout
+    )
+    if result.returncode != 0:
+        error = result.stderr.decode("utf-8", "replace").strip()[:500]
+        raise RuntimeError(f"ffmpeg failed: {error}")
+
+
+class AudioTranscoder:
+    """
+    렌더가 끝난 음성을 변환 음성으로 만드는 후처리 단계
+
+    CPU를 쓰는 변환은 크기가 제한된 프로세스 풀에서 실행하여 API/TTS 워커를
+    막지 않습니다. 변환 결과 업로드와 audio_variants 저장은 별도 스레드에서 처리합니다.
+    대기 중인 변환이 max_pending개를 넘으면 새 요청은 건너뜁니다 (원본은 그대로 제공).
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_pending: int,
+        transcode_fn: Callable[[str, str, AudioVariant], None] = transcode_file,
+        storage_factory: Callable[[], StorageBackend] = get_storage,
+        session_factory: Callable[[], Session] = SessionLocal
+    ):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.transcode_fn = transcode_fn
+        self.storage_factory = storage_factory
+        self.session_factory = session_factory
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._finisher: Optional[ThreadPoolExecutor] = None
+        self._pending = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self.completed = 0
+        self.failed = 0
+        self.skipped = 0
+
+    @property
+    def enabled(self) -> bool:
+        return env_config.audio_transcode_enabled and self.max_workers > 0
+
+    def _executors(self):
+        with self._lock:
+            if self._pool is None:
+                # 워커 스레드가 있는 프로세스를 fork하지 않도록 spawn 사용
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+                self._finisher = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="transcode"
+                )
+            return self._pool, self._finisher
+
+    def submit(self, storage_key: str, source_path: str) -> Optional[Future]:
+        """
+        source_path(원본 MP3 사본)의 변환을 예약합니다. source_path는 처리 후 삭제됩니다.
+
+        Returns:
+            변환/업로드 완료 Future, 비활성화되었거나 대기열이 가득 차면 None
+        """
+        if not self.enabled or not self._pending.acquire(blocking=False):
+            self.skipped += 1
+            os.unlink(source_path)
+            return None
+
+        try:
+            pool, finisher = self._executors()
+            future = finisher.submit(self._run, storage_key, source_path, pool)
+        except Exception as e:
+            # 종료 중이라 실행기를 쓸 수 없는 경우 등
+            logger.warning(f"⚠️ Audio transcode not scheduled for {storage_key}: {e}")
+            self._discard(source_path)
+            return None
+        future.add_done_callback(partial(self._discard_cancelled, source_path))
+        return future
+
+    def _discard(self, source_path: str):
+        """실행되지 않는 변환의 대기 자리와 원본 사본을 정리합니다"""
+        self.skipped += 1
+        os.unlink(source_path)
+        self._pending.release()
+
+    def _discard_cancelled(self, source_path: str, future: Future):
+        # 취소된 작업은 _run이 실행되지 않으므로 여기서 정리
+        if future.cancelled():
+            self._discard(source_path)
+
+    def _run(self, storage_key: str, source_path: str, pool: ProcessPoolExecutor) -> Dict[str, str]:
+        try:
+            variants = {}
+            for variant in AUDIO_VARIANTS.values():
+                key = variant_storage_key(storage_key, variant.name)
+                fd, dest_path = tempfile.mkstemp(suffix=f".{variant.extension}")
+                os.close(fd)
+                try:
+                    pool.submit(self.transcode_fn, source_path, dest_path, variant).result()
+                    with open(dest_path, "rb") as file:
+                        chunks = iter(lambda: file.read(256 * 1024), b"")
+                        if not self.storage_factory().upload_stream(chunks, key):
+                            raise RuntimeError("Variant upload failed")
+                    variants[variant.name] = key
+                finally:
+                    os.unlink(dest_path)
+
+            db = self.session_factory()
+            try:
+                TombstoneRepository(db).update_audio_variants(storage_key, json.dumps(variants))
+            finally:
+                db.close()
+            self.completed += 1
+            logger.info(f"🎚️ Audio variants ready for {storage_key}: {', '.join(variants)}")
+            return variants
+        except Exception as e:
+            self.failed += 1
+            logger.error(f"❌ Audio transcode failed for {storage_key}: {e}")
+            raise
+        finally:
+            os.unlink(source_path)
+            self._pending.release()
+
+    def shutdown(self):
+        """
+        대기 중인 변환은 취소하고 실행 중인 ffmpeg만 기다립니다
+
+        대기열 전체(max_pending개 × 제한 시간)를 기다리면 앱 종료가 오래 걸리므로
+        변환 음성은 건너뜁니다 (원본은 그대로 제공).
+        """
+        with self._lock:
+            if self._pool:
+                # 프로세스 풀 대기 작업을 먼저 취소해야 이를 기다리는 finisher 스레드가 바로 끝남
+                self._pool.shutdown(wait=False, cancel_futures=True)
+            if self._finisher:
+                self._finisher.shutdown(wait=True, cancel_futures=True)
+            if self._pool:
+                self._pool.shutdown(wait=True)
+            self._pool = self._finisher = None
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "workers": self.max_workers,
+            "completed": self.completed,
+            "failed": self.failed,
+            "skipped": self.skipped
+        }
+
+
+def _default_workers() -> int:
+    if shutil.which(env_config.ffmpeg_path) is None:
+        logger.warning(f"⚠️ {env_config.ffmpeg_path} not found, audio variants are disabled")
+        return 0
+    return env_config.audio_transcode_workers
+
+
+audio_transcoder = AudioTranscoder(
+    max_workers=_default_workers(),
+    max_pending=env_config.audio_transcode_max_pending
+)
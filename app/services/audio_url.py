@@ -0,0 +1,81 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from app.core.config import env_config
+from app.models.tombstone import Tombstone
+from app.services.storage import StorageBackend, get_storage
+from app.utils.storage_key import storage_key_from_url
+
+
+class AudioURLSigner:
+    """
+    object key → presigned URL 캐시
+
+    URL을 만료 refresh_seconds 전까지 재사용하므로 목록/상세 응답에서
+    행마다, 요청마다 SigV4 서명을 다시 계산하지 않습니다.
+    오래 쓰지 않은 항목부터 max_entries개를 넘지 않게 정리합니다.
+    """
+
+    def __init__(
+        self,
+        expires_seconds: int,
+        refresh_seconds: int,
+        max_entries: int,
+        storage_factory: Callable[[], StorageBackend] = get_storage
+    ):
+        self.expires_seconds = expires_seconds
+        self.refresh_seconds = min(refresh_seconds, expires_seconds // 2)
+        self.max_entries = max_entries
+        self.storage_factory = storage_factory
+        self._cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def url_for(self, key: str) -> str:
+        now = time.monotonic()
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached and now < cached[1]:
+                self._cache.move_to_end(key)
+                return cached[0]
+
+        url = self.storage_factory().get_url(key, self.expires_seconds)
+        # 만료 직전의 URL을 내주지 않도록 refresh_seconds만큼 일찍 새로 서명
+        reuse_until = now + self.expires_seconds - self.refresh_seconds
+        with self._lock:
+            self._cache[key] = (url, reuse_until)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return url
+
+    def invalidate(self, key: str):
+        with self._lock:
+            self._cache.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+
+audio_url_signer = AudioURLSigner(
+    expires_seconds=env_config.audio_url_expires_seconds,
+    refresh_seconds=env_config.audio_url_refresh_seconds,
+    max_entries=env_config.audio_url_cache_size
+)
+
+
+def get_audio_key(tombstone: Tombstone) -> Optional[str]:
+    """묘비 음성의 object key (예전에 URL로 저장된 묘비는 URL에서 key를 추출)"""
+    if tombstone.audio_key:
+        return tombstone.audio_key
+    return storage_key_from_url(
+        tombstone.audio_url, env_config.s3_bucket_name, env_config.local_storage_base_url
+    )
+
+
+def get_audio_url(tombstone: Tombstone) -> Optional[str]:
+    """클라이언트에 내려줄 음성 URL (음성이 없으면 None)"""
+    key = get_audio_key(tombstone)
+    return audio_url_signer.url_for(key) if key else None
@@ -0,0 +1,134 @@
+import logging
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from app.core.config import env_config
+
+logger = logging.getLogger(__name__)
+
+# 재시도 대상 응답 코드 (일시적 서버 오류)
+# 429는 재시도하지 않고 호출 측 rate limiter가 처리 (tts_rate_limiter)
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+
+class _NoThrottleRetry(Retry):
+    """Retry-After가 붙은 429도 재시도하지 않도록 기본 대상에서 429를 제외"""
+    RETRY_AFTER_STATUS_CODES = frozenset({413, 503})
+
+
+class PooledHTTPClient:
+    """
+    프로세스 전체에서 공유하는 keep-alive HTTP 클라이언트
+
+    커넥션 풀을 재사용하여 요청마다 TLS 연결을 새로 맺지 않고,
+    connect/read timeout과 jitter가 적용된 제한된 재시도를 사용합니다.
+    """
+
+    def __init__(
+        self,
+        pool_size: int,
+        connect_timeout: float,
+        read_timeout: float,
+        max_retries: int,
+        backoff_factor: float,
+        backoff_jitter: float
+    ):
+        self.pool_size = pool_size
+        self.timeout = (connect_timeout, read_timeout)
+        self.retry = _NoThrottleRetry(
+            total=max_retries,
+            connect=max_retries,
+            read=max_retries,
+            status=max_retries,
+            backoff_factor=backoff_factor,
+            backoff_jitter=backoff_jitter,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=None,  # TTS 요청(POST)도 재시도
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        self._session: Optional[requests.Session] = None
+        self._adapter: Optional[HTTPAdapter] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._total_requests = 0
+
+    @property
+    def session(self) -> requests.Session:
+        """처음 사용할 때 세션과 커넥션 풀을 생성합니다"""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    adapter = HTTPAdapter(
+                        pool_connections=self.pool_size,
+                        pool_maxsize=self.pool_size,
+                        max_retries=self.retry,
+                        pool_block=True
+                    )
+                    session = requests.Session()
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    self._adapter = adapter
+                    self._session = session
+        return self._session
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """POST 요청 (timeout 미지정 시 기본 timeout 적용)"""
+        kwargs.setdefault("timeout", self.timeout)
+        with self._lock:
+            self._in_flight += 1
+            self._total_requests += 1
+        try:
+            return self.session.post(url, **kwargs)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def pool_stats(self) -> dict:
+        """커넥션 풀 사용 현황"""
+        stats = {
+            "pool_size": self.pool_size,
+            "in_flight": self._in_flight,
+            "total_requests": self._total_requests,
+            "hosts": []
+        }
+        if self._adapter is None:
+            return stats
+
+        pools = self._adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            # 큐에는 유휴 커넥션과 아직 만들지 않은 자리(None)가 함께 들어 있음
+            queued = list(pool.pool.queue) if pool.pool is not None else []
+            stats["hosts"].append({
+                "host": pool.host,
+                "idle_connections": sum(1 for conn in queued if conn is not None),
+                "in_use": self.pool_size - len(queued),
+                "connections_opened": pool.num_connections,
+                "requests": pool.num_requests
+            })
+        return stats
+
+    def close(self):
+        """Close pooled connections"""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+            self._session = None
+            self._adapter = None
+
+
+tts_http_client = PooledHTTPClient(
+    pool_size=env_config.tts_http_pool_size,
+    connect_timeout=env_config.tts_connect_timeout,
+    read_timeout=env_config.tts_read_timeout,
+    max_retries=env_config.tts_max_retries,
+    backoff_factor=env_config.tts_retry_backoff,
+    backoff_jitter=env_config.tts_retry_jitter
+)
@@ -1,21 +1,47 @@
+import os
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 import logging
-from typing import Optional
+from typing import Iterable, Iterator, List, Optional
 from app.core.config import env_config
+from app.services.storage import StorageBackend, StoredObject
 
 logger = logging.getLogger(__name__)
 
+# S3 multipart 업로드의 마지막 part를 제외한 최소 크기
+MIN_PART_SIZE = 5 * 1024 * 1024
+# DeleteObjects 요청 하나에 담을 수 있는 최대 key 수
+MAX_DELETE_KEYS = 1000
 
-class S3Service:
+
+class S3Service(StorageBackend):
+    """
+    AWS S3(또는 S3 호환 서버) 저장소
+    
+    boto3 client 생성 비용이 크므로 직접 생성하지 말고
+    app.services.storage.get_storage()로 공유 인스턴스를 사용합니다.
+    """
+    
     def __init__(self):
+        self.endpoint_url = env_config.s3_endpoint_url or None
         self.s3_client = boto3.client(
             's3',
             aws_access_key_id=env_config.aws_access_key_id,
             aws_secret_access_key=env_config.aws_secret_access_key,
-            region_name=env_config.aws_region
+            region_name=env_config.aws_region,
+            endpoint_url=self.endpoint_url,
+            # S3 호환 로컬 서버는 path-style 주소만 지원
+            config=Config(s3={"addressing_style": "path"}) if self.endpoint_url else None
         )
         self.bucket_name = env_config.s3_bucket_name
+        self.part_size = max(env_config.s3_multipart_part_size, MIN_PART_SIZE)
+        self.list_page_size = 1000  # ListObjectsV2 페이지 크기 (S3 최대값)
+    
+    def _object_url(self, file_name: str) -> str:
+        if self.endpoint_url:
+            return f"{self.endpoint_url.rstrip('/')}/{self.bucket_name}/{file_name}"
+        return f"https://{self.bucket_name}.s3.{env_config.aws_region}.amazonaws.com/{file_name}"
     
     def upload_audio(self, file_content: bytes, file_name: str) -> Optional[str]:
         """
@@ -38,7 +64,7 @@ class S3Service:
             )
             
             # S3 URL 생성
-            url = f"https://{self.bucket_name}.s3.{env_config.aws_region}.amazonaws.com/{file_name}"
+            url = self._object_url(file_name)
             logger.info(f"✅ S3 upload successful: {url}")
             return url
             
@@ -46,6 +72,143 @@ class S3Service:
             logger.error(f"❌ S3 upload failed: {e}")
             return None
     
+    def upload_stream(self, chunks: Iterable[bytes], file_name: str) -> Optional[str]:
+        """
+        bytes 조각 스트림을 S3에 업로드하고 URL을 반환합니다.
+        
+        part_size만큼 모일 때마다 multipart part로 올리므로 메모리에는
+        part 하나 분량만 유지됩니다. 전체가 part_size보다 작으면
+        put_object 한 번으로 업로드합니다. 업로드 중 오류가 나면
+        multipart 업로드를 abort하여 미완성 part가 남지 않게 합니다.
+        
+        Args:
+            chunks: 업로드할 데이터 조각 (생성과 동시에 읽음)
+            file_name: S3에 저장될 파일명
+        
+        Returns:
+            업로드된 파일의 S3 URL, S3 오류 시 None
+        
+        Raises:
+            chunks를 읽는 중 발생한 예외는 업로드를 abort한 뒤 그대로 전달
+        """
+        iterator = iter(chunks)
+        buffer = bytearray()
+        for chunk in iterator:
+            buffer.extend(chunk)
+            if len(buffer) >= self.part_size:
+                break
+        else:
+            # part 하나에 다 들어가면 multipart 없이 업로드
+            return self.upload_audio(bytes(buffer), file_name)
+        
+        upload_id = None
+        try:
+            upload_id = self.s3_client.create_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=file_name,
+                ContentType='audio/mpeg'
+            )["UploadId"]
+            parts = []
+            
+            def flush(data: bytes):
+                part_number = len(parts) + 1
+                response = self.s3_client.upload_part(
+                    Bucket=self.bucket_name,
+                    Key=file_name,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=data
+                )
+                parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+            
+            flush(bytes(buffer[:self.part_size]))
+            del buffer[:self.part_size]
+            for chunk in iterator:
+                buffer.extend(chunk)
+                while len(buffer) >= self.part_size:
+                    flush(bytes(buffer[:self.part_size]))
+                    del buffer[:self.part_size]
+            if buffer:
+                flush(bytes(buffer))
+            
+            self.s3_client.complete_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=file_name,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts}
+            )
+            url = self._object_url(file_name)
+            logger.info(f"✅ S3 multipart upload successful ({len(parts)} parts): {url}")
+            return url
+            
+        except ClientError as e:
+            logger.error(f"❌ S3 multipart upload failed: {e}")
+            self._abort_multipart(file_name, upload_id)
+            return None
+        except Exception:
+            self._abort_multipart(file_name, upload_id)
+            raise
+    
+    def _abort_multipart(self, file_name: str, upload_id: Optional[str]):
+        if not upload_id:
+            return
+        try:
+            self.s3_client.abort_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=file_name,
+                UploadId=upload_id
+            )
+        except ClientError as e:
+            logger.error(f"❌ S3 multipart abort failed: {e}")
+    
+    def get_url(self, file_name: str, expires_in: int) -> str:
+        """
+        비공개 버킷의 파일을 받을 수 있는 presigned GET URL을 생성합니다.
+        
+        서명은 로컬에서 계산되며 S3 호출은 없습니다.
+        """
+        return self.s3_client.generate_presigned_url(
+            'get_object',
+            Params={'Bucket': self.bucket_name, 'Key': file_name},
+            ExpiresIn=expires_in
+        )
+    
+    def download_audio(self, file_name: str, dest_path: str) -> bool:
+        """
+        S3 파일을 dest_path에 내려받습니다.
+        
+        Returns:
+            성공 여부 (파일이 없거나 S3 오류 시 False)
+        """
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=file_name)
+            with open(dest_path, "wb") as file:
+                for chunk in response["Body"].iter_chunks(chunk_size=256 * 1024):
+                    file.write(chunk)
+            modified = response["LastModified"].timestamp()
+            os.utime(dest_path, (modified, modified))
+            return True
+            
+        except ClientError as e:
+            logger.error(f"❌ S3 download failed: {e}")
+            return False
+    
+    def list_objects(self, prefix: str = "") -> Iterator[StoredObject]:
+        """
+        ListObjectsV2를 페이지(list_page_size개) 단위로 읽으며 object를 key 순서로 반환합니다.
+        
+        다음 페이지는 앞 페이지를 모두 소비한 뒤에 요청합니다.
+        """
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        pages = paginator.paginate(
+            Bucket=self.bucket_name,
+            Prefix=prefix,
+            PaginationConfig={"PageSize": self.list_page_size}
+        )
+        for page in pages:
+            for obj in page.get("Contents", []):
+                yield StoredObject(obj["Key"], obj["Size"], obj["LastModified"].timestamp())
+    
     def delete_audio(self, file_name: str) -> bool:
         """
         S3에서 오디오 파일을 삭제합니다.
@@ -67,3 +230,34 @@ class S3Service:
         except ClientError as e:
             logger.error(f"❌ S3 delete failed: {e}")
             return False
+    
+    def delete_many(self, file_names: List[str]) -> List[str]:
+        """
+        DeleteObjects로 최대 1000개씩 묶어서 삭제합니다.
+        
+        Args:
+            file_names: 삭제할 파일명 목록
+        
+        Returns:
+            삭제하지 못한 파일명 목록 (없는 파일은 삭제된 것으로 봄)
+        """
+        failed = []
+        for start in range(0, len(file_names), MAX_DELETE_KEYS):
+            batch = file_names[start:start + MAX_DELETE_KEYS]
+            try:
+                response = self.s3_client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True}
+                )
+            except ClientError as e:
+                logger.error(f"❌ S3 batch delete failed: {e}")
+                failed.extend(batch)
+                continue
+            
+            # Quiet 모드에서는 실패한 key만 응답에 포함됨
+            errors = response.get("Errors", [])
+            for error in errors:
+                logger.error(f"❌ S3 delete failed: {error.get('Key')} ({error.get('Code')})")
+            failed.extend(error["Key"] for error in errors)
+            logger.info(f"✅ S3 batch delete: {len(batch) - len(errors)}/{len(batch)} objects")
+        return failed
@@ -1,8 +1,14 @@
+from datetime import date
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from sqlalchemy.orm import Session
+from app.core.config import env_config
 from app.models.database import SessionLocal
+from app.services.storage_cleanup_service import StorageCleanupService
 from app.services.tombstone_service import TombstoneService
+from app.services.tts_job_service import TTSJobService
+from app.services.tts_worker import notify_tts_workers
 import logging
 
 logger = logging.getLogger(__name__)
@@ -23,6 +29,54 @@ def unlock_tombstones_job():
         db.close()
 
 
+def prerender_tts_job():
+    """Job to queue TTS generation for tombstones unlocking in the next few days"""
+    db: Session = SessionLocal()
+    try:
+        service = TTSJobService(db)
+        scheduled_count = service.schedule_prerender(
+            today=date.today(),
+            days_ahead=env_config.tts_prerender_days,
+            window_hours=env_config.tts_prerender_window_hours,
+            limit=env_config.tts_prerender_daily_limit
+        )
+        logger.info(f"Scheduled {scheduled_count} TTS prerender jobs")
+    except Exception as e:
+        logger.error(f"Error scheduling TTS prerender jobs: {e}")
+    finally:
+        db.close()
+
+
+def retry_failed_tts_job():
+    """Job to requeue failed TTS renders whose backoff has elapsed"""
+    db: Session = SessionLocal()
+    try:
+        service = TTSJobService(db)
+        requeued_count = service.retry_failed(limit=env_config.tts_retry_sweep_limit)
+        if requeued_count:
+            notify_tts_workers()
+            logger.info(f"Requeued {requeued_count} failed TTS renders")
+    except Exception as e:
+        logger.error(f"Error requeueing failed TTS renders: {e}")
+    finally:
+        db.close()
+
+
+def storage_cleanup_job():
+    """Job to relay the storage outbox: queue abandoned renders and delete queued audio files"""
+    db: Session = SessionLocal()
+    try:
+        service = StorageCleanupService(db)
+        service.requeue_abandoned_renders(limit=env_config.storage_cleanup_batch_size)
+        deleted_count = service.process_deletes(limit=env_config.storage_cleanup_batch_size)
+        if deleted_count:
+            logger.info(f"Deleted {deleted_count} audio files from storage")
+    except Exception as e:
+        logger.error(f"Error deleting audio files: {e}")
+    finally:
+        db.close()
+
+
 def start_scheduler():
     """Start the background scheduler"""
     # Run daily at midnight
@@ -33,6 +87,31 @@ def start_scheduler():
         name="Check and unlock tombstones",
         replace_existing=True
     )
+    # Run daily after the unlock job, spreading renders across the rest of the day
+    if env_config.tts_prerender_days > 0:
+        scheduler.add_job(
+            prerender_tts_job,
+            trigger=CronTrigger(hour=1, minute=0),
+            id="prerender_tts",
+            name="Queue TTS prerender for upcoming unlocks",
+            replace_existing=True
+        )
+    # Retry failed renders once their backoff window has passed
+    scheduler.add_job(
+        retry_failed_tts_job,
+        trigger=IntervalTrigger(minutes=env_config.tts_retry_sweep_minutes),
+        id="retry_failed_tts",
+        name="Requeue failed TTS renders",
+        replace_existing=True
+    )
+    # Remove audio files left behind by deleted accounts
+    scheduler.add_job(
+        storage_cleanup_job,
+        trigger=IntervalTrigger(minutes=env_config.storage_cleanup_interval_minutes),
+        id="storage_cleanup",
+        name="Delete queued audio files",
+        replace_existing=True
+    )
     scheduler.start()
     logger.info("Scheduler started")
 
@@ -0,0 +1,190 @@
+import logging
+import os
+import shutil
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from app.core.config import env_config
+
+logger = logging.getLogger(__name__)
+
+
+class StoredObject(NamedTuple):
+    """저장소 목록 조회 결과 항목"""
+    key: str
+    size: int  # bytes
+    last_modified: float  # epoch seconds
+
+
+class StorageBackend(ABC):
+    """음성 파일 저장소 인터페이스 (S3, 로컬 파일시스템 등)"""
+
+    @abstractmethod
+    def upload_audio(self, file_content: bytes, file_name: str) -> Optional[str]:
+        """파일을 저장하고 URL을 반환합니다. 실패 시 None"""
+
+    @abstractmethod
+    def upload_stream(self, chunks: Iterable[bytes], file_name: str) -> Optional[str]:
+        """bytes 조각 스트림을 저장하고 URL을 반환합니다. 저장소 오류 시 None"""
+
+    @abstractmethod
+    def delete_audio(self, file_name: str) -> bool:
+        """파일을 삭제합니다"""
+
+    @abstractmethod
+    def get_url(self, file_name: str, expires_in: int) -> str:
+        """클라이언트가 파일을 받을 수 있는 URL (expires_in초 동안 유효)"""
+
+    @abstractmethod
+    def download_audio(self, file_name: str, dest_path: str) -> bool:
+        """
+        파일을 dest_path에 내려받습니다. 없거나 실패하면 False
+
+        dest_path의 수정 시각은 원본 파일의 수정 시각으로 맞춥니다.
+        """
+
+    def delete_many(self, file_names: List[str]) -> List[str]:
+        """
+        여러 파일을 삭제합니다. 저장소가 일괄 삭제를 지원하면 재정의합니다.
+
+        Returns:
+            삭제하지 못한 파일명 목록
+        """
+        return [file_name for file_name in file_names if not self.delete_audio(file_name)]
+
+    @abstractmethod
+    def list_objects(self, prefix: str = "") -> Iterator[StoredObject]:
+        """
+        prefix로 시작하는 파일을 key 순서로 하나씩 반환합니다.
+
+        저장소의 목록 API를 페이지 단위로 읽으므로 전체 목록을 메모리에 올리지 않습니다.
+        """
+
+
+class LocalStorageBackend(StorageBackend):
+    """로컬 디렉토리에 음성 파일을 저장하는 개발/테스트용 저장소"""
+
+    def __init__(self, root_dir: str, base_url: str):
+        self.root_dir = Path(root_dir)
+        self.base_url = base_url.rstrip("/")
+
+    def _path(self, file_name: str) -> Path:
+        path = (self.root_dir / file_name).resolve()
+        if self.root_dir.resolve() not in path.parents:
+            raise ValueError(f"Invalid storage key: {file_name}")
+        return path
+
+    def upload_audio(self, file_content: bytes, file_name: str) -> Optional[str]:
+        return self.upload_stream([file_content], file_name)
+
+    def upload_stream(self, chunks: Iterable[bytes], file_name: str) -> Optional[str]:
+        path = self._path(file_name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # 임시 파일에 쓴 뒤 교체하여 읽는 쪽이 쓰다 만 파일을 보지 않게 함
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}")
+        try:
+            with open(tmp_path, "wb") as file:
+                for chunk in chunks:
+                    file.write(chunk)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.error(f"❌ Local storage write failed: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return None
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return f"{self.base_url}/{file_name}"
+
+    def get_url(self, file_name: str, expires_in: int) -> str:
+        return f"{self.base_url}/{file_name}"
+
+    def download_audio(self, file_name: str, dest_path: str) -> bool:
+        try:
+            shutil.copy2(self._path(file_name), dest_path)
+            return True
+        except OSError as e:
+            logger.error(f"❌ Local storage read failed: {e}")
+            return False
+
+    def list_objects(self, prefix: str = "") -> Iterator[StoredObject]:
+        def walk(directory: Path) -> Iterator[Path]:
+            # 디렉토리 단위로 정렬하며 내려가므로 key 순서가 유지됨
+            entries = sorted(
+                directory.iterdir(), key=lambda p: p.name + "/" if p.is_dir() else p.name
+            )
+            for path in entries:
+                if path.name.startswith("."):
+                    continue  # 쓰는 중인 임시 파일
+                if path.is_dir():
+                    yield from walk(path)
+                else:
+                    yield path
+
+        if not self.root_dir.is_dir():
+            return
+        for path in walk(self.root_dir):
+            key = path.relative_to(self.root_dir).as_posix()
+            if key.startswith(prefix):
+                stat = path.stat()
+                yield StoredObject(key, stat.st_size, stat.st_mtime)
+
+    def delete_audio(self, file_name: str) -> bool:
+        try:
+            self._path(file_name).unlink(missing_ok=True)
+            return True
+        except OSError as e:
+            logger.error(f"❌ Local storage delete failed: {e}")
+            return False
+
+
+def _create_s3_backend() -> StorageBackend:
+    from app.services.s3_service import S3Service
+    return S3Service()
+
+
+def _create_local_backend() -> StorageBackend:
+    return LocalStorageBackend(env_config.local_storage_dir, env_config.local_storage_base_url)
+
+
+_factories: Dict[str, Callable[[], StorageBackend]] = {
+    "s3": _create_s3_backend,
+    "local": _create_local_backend,
+}
+_storage: Optional[StorageBackend] = None
+_lock = threading.Lock()
+
+
+def register_storage_backend(name: str, factory: Callable[[], StorageBackend]):
+    """STORAGE_BACKEND 값으로 선택할 수 있는 저장소를 등록합니다"""
+    _factories[name] = factory
+
+
+def get_storage() -> StorageBackend:
+    """
+    프로세스 전체에서 공유하는 저장소를 반환합니다.
+
+    처음 호출될 때 STORAGE_BACKEND에 해당하는 저장소를 한 번만 생성합니다.
+    boto3 client 생성은 비용이 크고 default session은 thread-safe하지 않으므로
+    요청/작업마다 만들지 않습니다. FastAPI에서는 Depends(get_storage)로 주입합니다.
+    """
+    global _storage
+    if _storage is None:
+        with _lock:
+            if _storage is None:
+                name = env_config.storage_backend
+                if name not in _factories:
+                    raise ValueError(f"Unknown storage backend: {name}")
+                _storage = _factories[name]()
+                logger.info(f"Storage backend initialized: {name}")
+    return _storage
+
+
+def set_storage(storage: Optional[StorageBackend]):
+    """사용할 저장소를 직접 지정합니다 (None이면 다음 호출 때 다시 생성)"""
+    global _storage
+    with _lock:
+        _storage = storage
@@ -0,0 +1,119 @@
+import logging
+from datetime import timedelta
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import env_config
+from app.models.storage_outbox import STORAGE_OP_DELETE
+from app.models.tombstone import get_kst_now
+from app.repositories.audio_asset_repository import AudioAssetRepository
+from app.repositories.storage_outbox_repository import StorageOutboxRepository
+from app.repositories.tombstone_repository import TombstoneRepository
+from app.services.audio_transcoder import AUDIO_VARIANTS, source_storage_key, variant_storage_key
+from app.services.storage import StorageBackend, get_storage
+from app.services.tts_job_service import ASSET_STALE_AFTER
+
+logger = logging.getLogger(__name__)
+
+
+class StorageCleanupService:
+    """storage_outbox에 쌓인 파일 삭제 작업을 묶어서 처리하는 백그라운드 로직"""
+
+    def __init__(self, db: Session, storage: Optional[StorageBackend] = None):
+        self.outbox_repository = StorageOutboxRepository(db)
+        self.tombstone_repository = TombstoneRepository(db)
+        self.asset_repository = AudioAssetRepository(db)
+        self.db = db
+        self._storage = storage
+
+    @property
+    def storage(self) -> StorageBackend:
+        return self._storage or get_storage()
+
+    def process_deletes(self, limit: int) -> int:
+        """
+        storage_outbox relay: 예약된 파일 삭제 작업을 최대 limit개 처리합니다.
+
+        공유받은 묘비 복사본이나 같은 내용의 다른 묘비가 아직 쓰고 있는 key는
+        삭제하지 않고 작업만 지웁니다. 워커가 같은 key로 다시 생성 중이면 나중에 다시 확인합니다.
+        나머지는 에셋 행을 먼저 지운 뒤 변환 음성과 함께 저장소의 일괄 삭제
+        (S3는 요청당 최대 1000개)로 지우고, 실패한 key는 retry_seconds 뒤에 다시 시도합니다.
+        삭제는 여러 번 실행되어도 결과가 같으므로 중간에 중단되어도 다시 처리하면 됩니다.
+
+        Returns:
+            삭제된 파일 수
+        """
+        now = get_kst_now()
+        # 커밋하면 ORM 객체가 만료되므로 (id, key)만 가지고 처리
+        entries = [
+            (entry.id, entry.storage_key)
+            for entry in self.outbox_repository.get_due(STORAGE_OP_DELETE, now, limit)
+        ]
+        if not entries:
+            return 0
+
+        keys = {key for _, key in entries}
+        referenced = self.tombstone_repository.get_referenced_audio_keys(keys)
+        rendering = self.asset_repository.get_rendering_storage_keys(
+            keys - referenced, now - ASSET_STALE_AFTER
+        )
+        keys_to_delete = sorted(keys - referenced - rendering)
+        if referenced:
+            logger.info(f"🔗 Keeping {len(referenced)} audio files still used by other tombstones")
+
+        # 에셋이 남아 있으면 같은 내용의 새 묘비가 삭제된 파일을 재사용하므로 먼저 지움
+        self.asset_repository.delete_by_storage_keys(keys_to_delete)
+        # 원본 옆에 만들어 둔 변환 음성도 함께 삭제 (없는 key는 삭제된 것으로 처리됨)
+        file_names = keys_to_delete + [
+            variant_storage_key(key, name) for key in keys_to_delete for name in AUDIO_VARIANTS
+        ]
+        failed = (
+            {source_storage_key(key) for key in self.storage.delete_many(file_names)}
+            if file_names else set()
+        )
+
+        retry_at = now + timedelta(seconds=env_config.storage_cleanup_retry_seconds)
+        self.outbox_repository.delete_entries(
+            [entry_id for entry_id, key in entries if key not in failed | rendering]
+        )
+        self.outbox_repository.reschedule(
+            [entry_id for entry_id, key in entries if key in rendering],
+            "Render in progress",
+            retry_at,
+        )
+        if failed:
+            logger.warning(f"⚠️ Failed to delete {len(failed)} audio files, will retry")
+            self.outbox_repository.reschedule(
+                [entry_id for entry_id, key in entries if key in failed],
+                "Storage delete failed",
+                retry_at,
+            )
+
+        deleted_count = len(keys_to_delete) - len(failed)
+        if deleted_count:
+            logger.info(f"🗑️ Deleted {deleted_count} audio files and their variants")
+        return deleted_count
+
+    def requeue_abandoned_renders(self, limit: int) -> int:
+        """
+        생성 중 상태로 멈춘 에셋(업로드 후 DB 기록 전에 워커가 중단된 경우 등)을 지우고
+        업로드되었을 수 있는 파일의 삭제를 같은 트랜잭션으로 storage_outbox에 기록합니다.
+
+        Returns:
+            정리된 에셋 수
+        """
+        stale_before = get_kst_now() - ASSET_STALE_AFTER
+        assets = self.asset_repository.get_stale_rendering(stale_before, limit)
+        if not assets:
+            return 0
+
+        self.outbox_repository.add_deletes(asset.storage_key for asset in assets)
+        # 그 사이 다른 워커가 넘겨받은 에셋은 지워지지 않음 (outbox 작업은 생성 중인 key를 건너뜀)
+        removed = self.asset_repository.delete_stale_rendering(
+            [asset.id for asset in assets], stale_before
+        )
+        self.db.commit()
+        if removed:
+            logger.info(f"🧹 Queued cleanup for {removed} abandoned audio renders")
+        return removed
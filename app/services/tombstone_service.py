@@ -1,65 +1,171 @@
+import json
 from datetime import date, datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple, Union
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 import logging
-from app.models.tombstone import Tombstone
+from app.core.config import env_config
+from app.models.tombstone import (
+    Tombstone,
+    AUDIO_STATUS_PENDING,
+    AUDIO_STATUS_READY,
+    AUDIO_STATUS_FAILED,
+)
+from app.repositories.tombstone_collaborator_repository import (
+    TombstoneCollaboratorRepository,
+    parse_share_json,
+)
 from app.repositories.tombstone_repository import TombstoneRepository
+from app.repositories.unit_of_work import unit_of_work
 from app.schemas.tombstone import CreateTombstoneDto, TombstoneResponseDto
-from app.services.tts_service import TTSService
-from app.services.s3_service import S3Service
+from app.services.audio_url import get_audio_key, get_audio_url
+from app.services.tts_job_service import TTSJobService
+from app.services.tts_worker import notify_tts_workers
+from app.services.unlock_sweep_service import UnlockSweepService
+from app.utils.cursor import decode_cursor, encode_cursor
+from app.utils.mp3_info import AudioInfo
 
 logger = logging.getLogger(__name__)
 
 
+def _audio_info(tombstone: Union[Tombstone, Row]) -> Optional[AudioInfo]:
+    """렌더 후 저장된 음성 메타데이터 (아직 계산되지 않았으면 None)"""
+    if tombstone.audio_duration_ms is None:
+        return None
+    return AudioInfo(tombstone.audio_duration_ms, tombstone.audio_size_bytes, tombstone.audio_codec)
+
+
+def _audio_metadata(tombstone: Union[Tombstone, Row]) -> dict:
+    """응답에 포함할 음성 메타데이터 필드"""
+    audio_info = _audio_info(tombstone)
+    if not audio_info:
+        return {}
+    return {f"audio_{field}": value for field, value in audio_info._asdict().items()}
+
+
+def split_page(tombstones: List[Row], limit: int) -> Tuple[List[Row], Optional[str]]:
+    """limit + 1개 읽은 목록 행을 limit개와 next_cursor로 나눕니다 (다음 페이지가 없으면 None)"""
+    if len(tombstones) <= limit:
+        return tombstones, None
+    tombstones = tombstones[:limit]
+    return tombstones, encode_cursor(tombstones[-1].unlock_date, tombstones[-1].id)
+
+
+def merge_share_lists(
+    tombstones: List[Union[Tombstone, Row]],
+    collaborators: Dict[int, List[int]]
+) -> Dict[int, Optional[List[int]]]:
+    """
+    묘비별 쓰기 권한 친구 목록 (collaborators: tombstone_collaborators 조회 결과)
+
+    아직 backfill되지 않은 묘비는 남아 있는 share JSON도 함께 반영합니다.
+    """
+    result = {}
+    for tombstone in tombstones:
+        user_ids = collaborators.get(tombstone.id, [])
+        legacy = [
+            user_id for user_id in parse_share_json(tombstone.share) if user_id not in user_ids
+        ]
+        result[tombstone.id] = (legacy + user_ids) or None
+    return result
+
+
+def list_item_response(tombstone: Row, share: Optional[List[int]]) -> TombstoneResponseDto:
+    """목록 행 → 목록 응답 DTO (content는 포함하지 않음)"""
+    response_data = {
+        "id": tombstone.id,
+        "user_id": tombstone.user_id,
+        "title": tombstone.title,
+        "unlock_date": tombstone.unlock_date.isoformat(),
+        "is_unlocked": tombstone.is_unlocked,
+        "enroll": tombstone.enroll,
+        "share": share,
+        "created_at": tombstone.created_at.isoformat(),
+        "updated_at": tombstone.updated_at.isoformat()
+    }
+    
+    # Always calculate days_remaining for list view, regardless of unlock status
+    if not tombstone.is_unlocked:
+        days_remaining = (tombstone.unlock_date - date.today()).days
+        response_data["days_remaining"] = days_remaining
+    
+    # Never include content in list view
+    # 음성 메타데이터는 저장된 컬럼 값이므로 저장소를 조회하지 않음
+    if tombstone.is_unlocked:
+        response_data.update(_audio_metadata(tombstone))
+    
+    return TombstoneResponseDto(**response_data)
+
+
 class TombstoneService:
     def __init__(self, db: Session):
+        self.db = db
         self.repository = TombstoneRepository(db)
-        self.tts_service = TTSService()
-        self.s3_service = S3Service()
+        self.collaborator_repository = TombstoneCollaboratorRepository(db)
+        self.tts_job_service = TTSJobService(db)
 
-    def list_tombstones(self, user_id: int = 1) -> List[TombstoneResponseDto]:
-        """List all tombstones for a user - always shows only title, never content"""
-        import json
-        
-        tombstones = self.repository.get_all(user_id)
-        result = []
-        
-        for tombstone in tombstones:
-            # Parse share list
-            share_list = None
-            if tombstone.share:
-                try:
-                    share_list = json.loads(tombstone.share)
-                except:
-                    share_list = None
-            
-            response_data = {
-                "id": tombstone.id,
-                "user_id": tombstone.user_id,
-                "title": tombstone.title,
-                "unlock_date": tombstone.unlock_date.isoformat(),
-                "is_unlocked": tombstone.is_unlocked,
-                "enroll": tombstone.enroll,
-                "share": share_list,
-                "created_at": tombstone.created_at.isoformat(),
-                "updated_at": tombstone.updated_at.isoformat()
-            }
-            
-            # Always calculate days_remaining for list view, regardless of unlock status
-            if not tombstone.is_unlocked:
-                days_remaining = (tombstone.unlock_date - date.today()).days
-                response_data["days_remaining"] = days_remaining
-            
-            # Never include content in list view
-            
-            result.append(TombstoneResponseDto(**response_data))
-        
-        return result
+    def _share_lists(
+        self,
+        tombstones: List[Union[Tombstone, Row]]
+    ) -> Dict[int, Optional[List[int]]]:
+        """묘비별 쓰기 권한 친구 목록 (tombstone_collaborators 한 번 조회)"""
+        collaborators = self.collaborator_repository.get_user_ids_by_tombstone(
+            t.id for t in tombstones
+        )
+        return merge_share_lists(tombstones, collaborators)
+
+    def list_tombstones(
+        self,
+        user_id: int = 1,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[TombstoneResponseDto], Optional[str]]:
+        """
+        List a page of tombstones for a user - always shows only title, never content
+
+        unlock_date, id 순서로 limit개씩 반환하며, 다음 페이지가 있으면
+        마지막 항목 위치를 담은 next_cursor를 함께 반환합니다 (없으면 None).
+
+        Raises:
+            ValueError: cursor 형식이 잘못된 경우
+        """
+        after = decode_cursor(cursor) if cursor else None
+        # 한 개 더 읽어 다음 페이지가 있는지 확인 (목록용 컬럼만 조회, content는 읽지 않음)
+        return self._list_page(self.repository.get_page(user_id, limit + 1, after), limit)
+
+    def list_shared_tombstones(
+        self,
+        user_id: int,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[TombstoneResponseDto], Optional[str]]:
+        """
+        List a page of other users' tombstones the user collaborates on or authored (enroll)
+
+        목록 조회와 같은 순서, cursor, 응답 형식을 사용합니다.
+
+        Raises:
+            ValueError: cursor 형식이 잘못된 경우
+        """
+        after = decode_cursor(cursor) if cursor else None
+        return self._list_page(self.repository.get_shared_page(user_id, limit + 1, after), limit)
+
+    def _list_page(
+        self,
+        tombstones: List[Row],
+        limit: int
+    ) -> Tuple[List[TombstoneResponseDto], Optional[str]]:
+        """limit + 1개 읽은 목록 행을 응답 DTO와 next_cursor로 변환합니다"""
+        tombstones, next_cursor = split_page(tombstones, limit)
+        share_lists = self._share_lists(tombstones)
+        items = [
+            list_item_response(tombstone, share_lists[tombstone.id]) for tombstone in tombstones
+        ]
+        return items, next_cursor
 
     def create_tombstone(self, data: CreateTombstoneDto) -> TombstoneResponseDto:
         """Create a new tombstone with validation"""
-        import json
-        
         # Validate unlock date is in the future
         if data.unlock_date <= date.today():
             raise ValueError("Unlock date must be in the future")
@@ -67,31 +173,18 @@ class TombstoneService:
         # Set enroll to current user if not specified
         enroll = data.enroll if data.enroll else data.user_id
         
-        # Convert share list to JSON string
-        share_json = None
-        if data.share:
-            share_json = json.dumps(data.share)
-        
         # 묘비 생성 시에는 TTS를 생성하지 않음 (조회 시 생성)
         tombstone = self.repository.create(
             user_id=data.user_id,
             title=data.title,
             content=data.content,
-            audio_url=None,
             unlock_date=data.unlock_date,
             enroll=enroll,
-            share=share_json
+            collaborators=data.share or ()
         )
         
         days_remaining = (tombstone.unlock_date - date.today()).days
-        
-        # Parse share for response
-        share_list = None
-        if tombstone.share:
-            try:
-                share_list = json.loads(tombstone.share)
-            except:
-                share_list = None
+        share_list = list(dict.fromkeys(data.share)) if data.share else None
         
         return TombstoneResponseDto(
             id=tombstone.id,
@@ -108,20 +201,25 @@ class TombstoneService:
 
     def get_tombstone(self, tombstone_id: int) -> Optional[TombstoneResponseDto]:
         """Get a single tombstone with content filtering based on unlock status"""
-        import json
-        
         tombstone = self.repository.get_by_id(tombstone_id)
         
         if not tombstone:
             return None
         
-        # Parse share list
-        share_list = None
-        if tombstone.share:
-            try:
-                share_list = json.loads(tombstone.share)
-            except:
-                share_list = None
+        return self._detail_response(tombstone)
+
+    def _detail_response(
+        self,
+        tombstone: Tombstone,
+        queue_audio: bool = True
+    ) -> TombstoneResponseDto:
+        """
+        이미 읽은 묘비로 상세 응답을 만듭니다 (잠금 해제되었고 음성이 없으면 TTS 작업 등록)
+
+        queue_audio=False면 TTS 작업은 등록하지 않고 pending으로만 응답합니다
+        (unit_of_work 안에서는 커밋한 뒤 _queue_audio로 등록).
+        """
+        share_list = self._share_lists([tombstone])[tombstone.id]
         
         response_data = {
             "id": tombstone.id,
@@ -138,69 +236,82 @@ class TombstoneService:
         if tombstone.is_unlocked:
             response_data["content"] = tombstone.content
             
-            # 잠금 해제된 경우, audio_url이 없으면 TTS 생성
-            if not tombstone.audio_url and tombstone.content:
-                logger.info(f"🎙️ Generating TTS for tombstone {tombstone_id}")
-                try:
-                    # TTS 음성 생성
-                    audio_bytes = self.tts_service.generate_audio(tombstone.content)
-                    
-                    if audio_bytes:
-                        # S3에 업로드
-                        from app.utils.datetime_utils import now_kst
-                        timestamp = now_kst().timestamp()
-                        file_name = f"tombstone_{tombstone.user_id}_{tombstone.id}_{timestamp}.mp3"
-                        audio_url = self.s3_service.upload_audio(audio_bytes, file_name)
-                        
-                        if audio_url:
-                            logger.info(f"✅ Audio uploaded successfully: {audio_url}")
-                            # DB에 audio_url 저장
-                            self.repository.update_audio_url(tombstone_id, audio_url)
-                            response_data["audio_url"] = audio_url
-                        else:
-                            logger.warning("⚠️ S3 upload failed")
-                            response_data["audio_url"] = None
-                    else:
-                        logger.warning("⚠️ TTS generation failed")
-                        response_data["audio_url"] = None
-                        
-                except Exception as e:
-                    logger.error(f"❌ Error during TTS/S3 process: {e}")
-                    response_data["audio_url"] = None
-            else:
-                # 이미 audio_url이 있으면 그대로 사용
-                response_data["audio_url"] = tombstone.audio_url
+            if get_audio_key(tombstone):
+                # 이미 음성이 있으면 presigned URL(캐시됨)로 제공
+                response_data["audio_url"] = get_audio_url(tombstone)
+                response_data["audio_status"] = AUDIO_STATUS_READY
+                response_data.update(_audio_metadata(tombstone))
+            elif self.tts_job_service.is_in_backoff(tombstone):
+                # 최근에 생성이 실패했으면 재시도 스위퍼에 맡기고 Supertone을 다시 호출하지 않음
+                response_data["audio_status"] = AUDIO_STATUS_FAILED
+            elif tombstone.content:
+                # 잠금 해제된 경우, 음성이 없으면 TTS 작업을 큐에 등록하고 바로 응답
+                if queue_audio:
+                    self._queue_audio(tombstone)
+                response_data["audio_status"] = AUDIO_STATUS_PENDING
         else:
             days_remaining = (tombstone.unlock_date - date.today()).days
             response_data["days_remaining"] = days_remaining
         
         return TombstoneResponseDto(**response_data)
 
+    def get_audio_key(self, tombstone_id: int, user_id: int, variant: Optional[str] = None) -> str:
+        """
+        Get the stored audio object key of an unlocked tombstone owned by the user
+
+        variant가 지정되었고 변환 음성이 준비되어 있으면 그 key를, 아니면 원본 MP3 key를 반환합니다.
+        """
+        tombstone = self.repository.get_by_id(tombstone_id)
+
+        if not tombstone:
+            raise ValueError("Tombstone not found")
+
+        if tombstone.user_id != user_id:
+            raise ValueError("You don't have permission to access this tombstone")
+
+        if not tombstone.is_unlocked:
+            raise ValueError("This tombstone is not yet unlocked")
+
+        audio_key = get_audio_key(tombstone)
+        if not audio_key:
+            raise ValueError("Audio is not ready yet")
+
+        if variant and tombstone.audio_variants:
+            return json.loads(tombstone.audio_variants).get(variant, audio_key)
+
+        return audio_key
+
     def check_and_unlock_tombstones(self) -> int:
-        """Check and unlock tombstones whose unlock date has arrived"""
-        current_date = date.today()
-        return self.repository.update_unlock_status(current_date)
+        """
+        Check and unlock tombstones whose unlock date has arrived
+
+        UNLOCK_SWEEP_CHUNK_SIZE개씩 나누어 해제하고, 해제된 묘비의 미리 생성 작업을 앞당깁니다.
+        """
+        return UnlockSweepService(self.db).sweep(
+            current_date=date.today(),
+            chunk_size=env_config.unlock_sweep_chunk_size,
+            on_unlocked=self._on_unlocked
+        )
+
+    def _on_unlocked(self, tombstone_ids: List[int]):
+        """잠금 해제 스윕 chunk마다 호출: 미리 생성 작업을 앞당기고 워커를 깨움"""
+        if self.tts_job_service.promote_unlocked(tombstone_ids):
+            notify_tts_workers()
 
     def generate_share_token(self, tombstone_id: int, user_id: int) -> Optional[str]:
         """Generate a share token for a tombstone"""
         import secrets
         
-        tombstone = self.repository.get_by_id(tombstone_id)
-        
-        if not tombstone:
-            return None
-        
-        # Check ownership
-        if tombstone.user_id != user_id:
-            raise ValueError("You don't have permission to share this tombstone")
-        
         # Generate unique token
         share_token = secrets.token_urlsafe(16)
         
-        # Update tombstone with share token
-        self.repository.update_share_token(tombstone_id, share_token)
+        # 소유자의 묘비일 때만 저장 (UPDATE 한 번, 실패했을 때만 원인 확인)
+        if self.repository.update_share_token(tombstone_id, share_token, owner_id=user_id):
+            return share_token
         
-        return share_token
+        if not self.repository.exists_by_id(tombstone_id):
+            return None
+        raise ValueError("You don't have permission to share this tombstone")
     
     def get_tombstone_by_share_token(self, share_token: str) -> Optional[Tombstone]:
         """Get tombstone by share token"""
@@ -223,19 +334,20 @@ class TombstoneService:
             user_id=new_user_id,
             title=f"[공유받음] {original.title}",
             content=original.content,
-            audio_url=original.audio_url,  # Reuse the same audio URL
-            unlock_date=original.unlock_date
+            audio_key=get_audio_key(original),  # Reuse the same audio file
+            audio_variants=original.audio_variants,
+            audio_info=_audio_info(original),
+            unlock_date=original.unlock_date,
+            is_unlocked=True  # Already unlocked since it's a copy of an unlocked tombstone
         )
         
-        # Mark as unlocked since it's a copy of an unlocked tombstone
-        self.repository.update_unlock_status_by_id(copied_tombstone.id, True)
-        
         return TombstoneResponseDto(
             id=copied_tombstone.id,
             user_id=copied_tombstone.user_id,
             title=copied_tombstone.title,
             content=copied_tombstone.content,
-            audio_url=copied_tombstone.audio_url,
+            audio_url=get_audio_url(copied_tombstone),
+            **_audio_metadata(copied_tombstone),
             unlock_date=copied_tombstone.unlock_date.isoformat(),
             is_unlocked=True,
             created_at=copied_tombstone.created_at.isoformat(),
@@ -243,86 +355,82 @@ class TombstoneService:
         )
     
     def update_share_list(self, tombstone_id: int, user_id: int, action: str, target_user_id: int) -> TombstoneResponseDto:
-        """Add or remove a user from the share list"""
-        import json
-        
-        tombstone = self.repository.get_by_id(tombstone_id)
-        
-        if not tombstone:
-            raise ValueError("Tombstone not found")
-        
-        # Check ownership
-        if tombstone.user_id != user_id:
-            raise ValueError("You don't have permission to modify this tombstone")
-        
-        # Parse current share list
-        current_share = []
-        if tombstone.share:
-            try:
-                current_share = json.loads(tombstone.share)
-            except:
-                current_share = []
-        
-        # Update share list
-        if action == "add":
-            if target_user_id not in current_share:
-                current_share.append(target_user_id)
-        elif action == "remove":
-            if target_user_id in current_share:
-                current_share.remove(target_user_id)
-        else:
+        """
+        Add or remove a user from the share list
+
+        소유권 확인과 묘비 조회는 UPDATE ... RETURNING 한 번,
+        친구 추가/삭제는 INSERT/DELETE 한 번이며 응답까지 만든 뒤 한 번 커밋합니다.
+        """
+        if action not in ("add", "remove"):
             raise ValueError("Invalid action. Use 'add' or 'remove'")
         
-        # Save updated share list
-        share_json = json.dumps(current_share)
-        self.repository.update_share_list(tombstone_id, share_json)
+        with unit_of_work(self.db):
+            tombstone = self.repository.touch(tombstone_id, owner_id=user_id)
+            
+            if not tombstone:
+                if not self.repository.exists_by_id(tombstone_id):
+                    raise ValueError("Tombstone not found")
+                raise ValueError("You don't have permission to modify this tombstone")
+            
+            self._migrate_legacy_share(tombstone)
+            
+            # Update share list
+            if action == "add":
+                self.collaborator_repository.add(tombstone_id, target_user_id)
+            else:
+                self.collaborator_repository.remove(tombstone_id, target_user_id)
+            
+            # Return updated tombstone (이미 읽은 행으로 응답, 다시 조회하지 않음)
+            response = self._detail_response(tombstone, queue_audio=False)
         
-        # Return updated tombstone
-        return self.get_tombstone(tombstone_id)
+        if response.audio_status == AUDIO_STATUS_PENDING:
+            self._queue_audio(tombstone)
+        return response
     
     def generate_invite_token(self, tombstone_id: int, user_id: int) -> Optional[str]:
         """Generate an invite token for a tombstone"""
         import uuid
         
-        tombstone = self.repository.get_by_id(tombstone_id)
-        
-        if not tombstone:
-            return None
-        
-        # Check ownership
-        if tombstone.user_id != user_id:
-            raise ValueError("You don't have permission to create invite link for this tombstone")
-        
         # Generate unique UUID token
         invite_token = str(uuid.uuid4())
         
-        # Update tombstone with invite token
-        self.repository.update_invite_token(tombstone_id, invite_token)
+        # 소유자의 묘비일 때만 저장 (UPDATE 한 번, 실패했을 때만 원인 확인)
+        if self.repository.update_invite_token(tombstone_id, invite_token, owner_id=user_id):
+            return invite_token
         
-        return invite_token
+        if not self.repository.exists_by_id(tombstone_id):
+            return None
+        raise ValueError("You don't have permission to create invite link for this tombstone")
     
     def accept_invite(self, invite_token: str, user_id: int) -> TombstoneResponseDto:
         """Accept an invite and add user to share list"""
-        import json
-        
-        tombstone = self.repository.get_by_invite_token(invite_token)
-        
-        if not tombstone:
-            raise ValueError("Invalid invite token")
-        
-        # Parse current share list
-        current_share = []
-        if tombstone.share:
-            try:
-                current_share = json.loads(tombstone.share)
-            except:
-                current_share = []
-        
-        # Add user to share list if not already there
-        if user_id not in current_share:
-            current_share.append(user_id)
-            share_json = json.dumps(current_share)
-            self.repository.update_share_list(tombstone.id, share_json)
+        with unit_of_work(self.db):
+            tombstone = self.repository.get_by_invite_token(invite_token)
+            
+            if not tombstone:
+                raise ValueError("Invalid invite token")
+            
+            self._migrate_legacy_share(tombstone)
+            
+            # Add user to share list if not already there (이미 있으면 INSERT가 무시됨)
+            if self.collaborator_repository.add(tombstone.id, user_id):
+                # 친구 목록이 바뀌었으므로 다른 공유 목록 수정과 같이 updated_at 갱신
+                tombstone = self.repository.touch(tombstone.id)
+            
+            # Return updated tombstone
+            response = self._detail_response(tombstone, queue_audio=False)
         
-        # Return updated tombstone
-        return self.get_tombstone(tombstone.id)
+        if response.audio_status == AUDIO_STATUS_PENDING:
+            self._queue_audio(tombstone)
+        return response
+
+    def _queue_audio(self, tombstone: Tombstone):
+        self.tts_job_service.enqueue(tombstone)
+        notify_tts_workers()
+
+    def _migrate_legacy_share(self, tombstone: Tombstone):
+        """아직 backfill되지 않은 묘비의 share JSON을 tombstone_collaborators로 먼저 옮김"""
+        if tombstone.share is not None:
+            self.collaborator_repository.migrate_share([(tombstone.id, tombstone.share)])
+            # DB 값과 맞춤 (변경으로 표시하지 않으므로 추가 UPDATE 없음)
+            set_committed_value(tombstone, "share", None)
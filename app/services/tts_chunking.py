@@ -0,0 +1,85 @@
+"""긴 텍스트를 문장 단위로 나누고 MP3 조각을 하나로 합치는 유틸리티"""
+import re
+from typing import List
+
+# 문장 끝: 마침표/물음표/느낌표/말줄임표 (뒤따르는 닫는 따옴표·괄호 포함) + 공백, 또는 줄바꿈
+_SENTENCE_END = re.compile(r"(?<=[.!?。…])[\"'”’)\]]*\s+|\n+")
+# 긴 문장을 나눌 때 사용할 위치: 쉼표 뒤 공백, 일반 공백
+_CLAUSE_END = re.compile(r"(?<=[,，、])\s+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def split_sentences(text: str) -> List[str]:
+    """텍스트를 문장 단위로 나눕니다 (빈 문장 제외)"""
+    return [
+        sentence.strip() for sentence in _SENTENCE_END.split(text)
+        if sentence and sentence.strip()
+    ]
+
+
+def _split_long(sentence: str, max_chars: int) -> List[str]:
+    """max_chars를 넘는 문장을 쉼표 → 공백 → 글자 수 순서로 나눕니다"""
+    for pattern in (_CLAUSE_END, _WHITESPACE):
+        parts = [part for part in pattern.split(sentence) if part]
+        if len(parts) > 1:
+            return _pack(parts, max_chars)
+    return [sentence[i:i + max_chars] for i in range(0, len(sentence), max_chars)]
+
+
+def _pack(parts: List[str], max_chars: int) -> List[str]:
+    """조각들을 순서대로 max_chars 이하의 청크로 묶습니다"""
+    chunks: List[str] = []
+    current = ""
+    for part in parts:
+        if len(part) > max_chars:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.extend(_split_long(part, max_chars))
+            continue
+        candidate = f"{current} {part}" if current else part
+        if len(candidate) <= max_chars:
+            current = candidate
+        else:
+            chunks.append(current)
+            current = part
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def chunk_text(text: str, max_chars: int) -> List[str]:
+    """
+    TTS 요청 단위로 텍스트를 나눕니다.
+
+    가능한 한 문장 경계에서 자르고, 문장들을 max_chars 이하로 묶습니다.
+    """
+    if len(text) <= max_chars:
+        return [text]
+    return _pack(split_sentences(text), max_chars)
+
+
+def strip_id3(data: bytes, keep_header: bool, keep_trailer: bool) -> bytes:
+    """MP3 조각 앞의 ID3v2 태그와 뒤의 ID3v1 태그를 제거합니다"""
+    if not keep_header and data[:3] == b"ID3" and len(data) >= 10:
+        # ID3v2 헤더: 10바이트 + syncsafe 정수 크기 (+ footer 10바이트)
+        size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+        footer = 10 if data[5] & 0x10 else 0
+        data = data[10 + size + footer:]
+    if not keep_trailer and len(data) >= 128 and data[-128:-125] == b"TAG":
+        data = data[:-128]
+    return data
+
+
+def join_mp3(parts: List[bytes]) -> bytes:
+    """
+    MP3 조각들을 순서대로 이어 붙입니다.
+
+    MP3는 프레임 단위로 독립적이므로 그대로 이어도 재생되지만,
+    중간에 끼는 ID3 태그는 제거합니다 (첫 조각의 ID3v2, 마지막 조각의 ID3v1만 유지).
+    """
+    last = len(parts) - 1
+    return b"".join(
+        strip_id3(part, keep_header=index == 0, keep_trailer=index == last)
+        for index, part in enumerate(parts)
+    )
@@ -0,0 +1,335 @@
+import logging
+import os
+import tempfile
+from datetime import date, datetime, timedelta
+from typing import BinaryIO, Iterable, Iterator, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import env_config
+from app.models.audio_asset import AUDIO_ASSET_READY
+from app.models.tombstone import AUDIO_STATUS_FAILED, AUDIO_STATUS_PENDING, Tombstone, get_kst_now
+from app.models.tts_job import (
+    TTS_JOB_PENDING,
+    TTS_JOB_SOURCE_PRERENDER,
+    TTS_JOB_SOURCE_VIEW,
+    TTSJob,
+)
+from app.repositories.audio_asset_repository import AudioAssetRepository
+from app.repositories.storage_outbox_repository import StorageOutboxRepository
+from app.repositories.tombstone_repository import TombstoneRepository
+from app.repositories.tts_job_repository import TTSJobRepository
+from app.services.audio_transcoder import AudioTranscoder, audio_transcoder
+from app.services.storage import StorageBackend, get_storage
+from app.services.tts_rate_limiter import TTSRateLimitedError
+from app.services.tts_service import TTSService
+from app.utils.audio_hash import audio_storage_key, compute_audio_hash
+from app.utils.mp3_info import AudioInfo, MP3Inspector
+
+logger = logging.getLogger(__name__)
+
+# 같은 내용을 다른 워커가 생성 중일 때 다시 확인할 때까지의 대기 시간
+ASSET_WAIT_SECONDS = 5
+# 생성 중 상태가 이 시간보다 오래되면 워커가 중단된 것으로 보고 넘겨받음
+ASSET_STALE_AFTER = timedelta(minutes=10)
+
+
+class TTSJobService:
+    """TTS 작업 큐 등록 및 워커 측 처리 로직"""
+
+    def __init__(
+        self,
+        db: Session,
+        storage: Optional[StorageBackend] = None,
+        transcoder: Optional[AudioTranscoder] = None
+    ):
+        self.job_repository = TTSJobRepository(db)
+        self.tombstone_repository = TombstoneRepository(db)
+        self.asset_repository = AudioAssetRepository(db)
+        self.outbox_repository = StorageOutboxRepository(db)
+        self.db = db
+        self._storage = storage
+        self.transcoder = transcoder or audio_transcoder
+
+    @property
+    def storage(self) -> StorageBackend:
+        # 음성을 저장할 때만 필요하므로 조회 요청에서는 저장소를 만들지 않음
+        return self._storage or get_storage()
+
+    def enqueue(self, tombstone: Tombstone) -> TTSJob:
+        """
+        묘비의 TTS 생성 작업을 큐에 등록합니다.
+
+        이미 대기/처리 중인 작업이 있으면 새로 만들지 않고 그 작업을 반환합니다.
+        미리 생성 예약된 작업이 아직 대기 중이면 즉시 처리되도록 앞당깁니다.
+        """
+        job = self.job_repository.get_active(tombstone.id)
+        if not job:
+            # 동시 요청과 경합하면 먼저 만들어진 작업이 반환됨 (single-flight)
+            job = self.job_repository.create(tombstone.id)
+            if job:
+                logger.info(f"📥 TTS job {job.id} queued for tombstone {tombstone.id}")
+        elif job.status == TTS_JOB_PENDING and job.source != TTS_JOB_SOURCE_VIEW:
+            self.job_repository.promote(job.id)
+
+        if tombstone.audio_status != AUDIO_STATUS_PENDING:
+            self.tombstone_repository.update_audio_status(tombstone.id, AUDIO_STATUS_PENDING)
+
+        return job
+
+    def schedule_prerender(
+        self, today: date, days_ahead: int, window_hours: float, limit: int
+    ) -> int:
+        """
+        잠금 해제를 앞둔 묘비의 TTS 작업을 미리 등록합니다.
+
+        작업의 available_at을 window_hours 동안 고르게 분산시켜
+        한꺼번에 Supertone으로 요청이 몰리지 않게 합니다.
+        생성된 음성은 is_unlocked가 바뀌기 전까지 응답에 노출되지 않습니다.
+
+        Returns:
+            등록된 작업 수
+        """
+        candidates = self.tombstone_repository.get_prerender_candidates(
+            start_date=today + timedelta(days=1),
+            end_date=today + timedelta(days=days_ahead),
+            limit=limit
+        )
+        if not candidates:
+            return 0
+
+        start = get_kst_now()
+        spacing = timedelta(hours=window_hours) / len(candidates)
+        for index, tombstone in enumerate(candidates):
+            self.job_repository.create(
+                tombstone.id,
+                source=TTS_JOB_SOURCE_PRERENDER,
+                available_at=start + spacing * index
+            )
+
+        logger.info(f"📅 Scheduled {len(candidates)} TTS prerender jobs over {window_hours}h")
+        return len(candidates)
+
+    def promote_unlocked(self, tombstone_ids: List[int]) -> int:
+        """
+        잠금 해제된 묘비의 미리 생성 작업을 즉시 처리되도록 앞당깁니다
+        (잠금 해제 스윕의 후속 단계)
+
+        미리 생성 작업은 하루에 걸쳐 분산 예약되어 있으므로,
+        해제된 묘비는 조회되기 전에 먼저 처리합니다.
+
+        Returns:
+            앞당긴 작업 수
+        """
+        promoted = self.job_repository.promote_prerender(tombstone_ids)
+        if promoted:
+            logger.info(f"⏩ Promoted {promoted} prerender jobs for unlocked tombstones")
+        return promoted
+
+    def retry_failed(self, limit: int) -> int:
+        """
+        백오프 시간이 지난 실패 묘비의 TTS 작업을 다시 등록합니다 (재시도 스위퍼)
+
+        Returns:
+            다시 등록된 묘비 수
+        """
+        candidates = self.tombstone_repository.get_audio_retry_candidates(get_kst_now(), limit)
+        for tombstone in candidates:
+            self.enqueue(tombstone)
+
+        if candidates:
+            logger.info(f"🔁 Requeued {len(candidates)} failed TTS renders")
+        return len(candidates)
+
+    @staticmethod
+    def is_in_backoff(tombstone: Tombstone, now: Optional[datetime] = None) -> bool:
+        """
+        실패 후 재시도 대기 중이거나 재시도 횟수를 모두 쓴 묘비인지 확인합니다.
+        이 상태에서는 조회 요청이 와도 TTS를 다시 생성하지 않습니다.
+        """
+        if tombstone.audio_status != AUDIO_STATUS_FAILED:
+            return False
+        if tombstone.audio_next_retry_at is None:
+            return True
+        return (now or get_kst_now()) < tombstone.audio_next_retry_at
+
+    def process(self, job: TTSJob) -> bool:
+        """
+        워커가 선점한 작업을 처리합니다: TTS 생성 → 저장소 업로드 → audio_key 저장
+        
+        TTS 응답은 받는 대로 저장소(S3는 multipart 업로드)로 흘려보내므로 음성 전체를
+        메모리에 올리지 않고, 생성이 끝나기 전에 업로드가 시작됩니다.
+
+        같은 내용(정규화된 텍스트, 언어, 스타일, 음성)의 음성이 이미 있으면
+        Supertone 호출과 업로드 없이 기존 파일을 재사용합니다.
+
+        업로드하는 동안 MP3 프레임 헤더를 읽어 재생 시간, 크기, 코덱을 한 번 계산해
+        에셋과 묘비에 저장합니다 (이후 조회에서는 저장소를 다시 읽지 않음).
+
+        업로드 후의 DB 변경(작업 완료, 에셋 준비, 묘비 audio_key)은 한 트랜잭션으로
+        커밋됩니다. 업로드 후 실패하면 파일 삭제를 storage_outbox에 기록하고,
+        그 전에 워커가 중단되면 생성 중 상태로 남은 에셋을 정리 작업이 outbox로 옮깁니다.
+
+        Returns:
+            음성 준비 완료 여부 (다른 워커의 생성을 기다리거나 호출 한도 때문에
+            재예약된 경우 False)
+        """
+        tombstone = self.tombstone_repository.get_by_id(job.tombstone_id)
+
+        if not tombstone:
+            self.job_repository.mark_failed(job, "Tombstone not found")
+            return False
+
+        # 다른 경로로 이미 음성이 준비된 경우
+        if tombstone.audio_key or tombstone.audio_url:
+            self.job_repository.mark_done(job)
+            return True
+
+        tts_service = TTSService()
+        content_hash = compute_audio_hash(
+            tombstone.content, tts_service.language, tts_service.style, tts_service.voice
+        )
+
+        asset = self.asset_repository.get_by_hash(content_hash)
+        if asset and asset.status == AUDIO_ASSET_READY:
+            logger.info(f"♻️ Reusing cached audio for tombstone {tombstone.id}")
+            audio_info = None
+            if asset.duration_ms is not None:
+                audio_info = AudioInfo(asset.duration_ms, asset.size_bytes, asset.codec)
+            return self._complete(job, tombstone, asset.storage_key, audio_info=audio_info)
+
+        if asset:
+            claimed = self.asset_repository.take_over(
+                content_hash, get_kst_now() - ASSET_STALE_AFTER
+            )
+        else:
+            claimed = self.asset_repository.claim(
+                content_hash,
+                audio_storage_key(content_hash),
+                tts_service.language,
+                tts_service.style,
+            )
+        if not claimed:
+            # 같은 내용을 다른 워커가 생성 중 → 잠시 후 캐시에서 가져감
+            self.job_repository.reschedule(job, ASSET_WAIT_SECONDS)
+            return False
+
+        logger.info(f"🎙️ Generating TTS for tombstone {tombstone.id} (job {job.id})")
+        # 변환 음성을 만들 경우 업로드하는 동안 원본을 임시 파일에도 기록 (다시 내려받지 않음)
+        source_file = None
+        source_path = None
+        try:
+            audio_key = audio_storage_key(content_hash)
+            inspector = MP3Inspector()
+            chunks = inspector.wrap(tts_service.stream_audio(tombstone.content))
+            if self.transcoder.enabled:
+                fd, source_path = tempfile.mkstemp(suffix=".mp3")
+                source_file = os.fdopen(fd, "wb")
+                chunks = _tee(chunks, source_file)
+            audio_url = self.storage.upload_stream(chunks, audio_key)
+            if source_file:
+                source_file.close()
+            if not audio_url:
+                self._release_asset(content_hash, audio_key)
+                return self._fail(job, tombstone, "Audio upload failed")
+
+            completed = self._complete(
+                job, tombstone, audio_key, content_hash, audio_url, inspector.result()
+            )
+            if completed and source_path:
+                # 변환은 프로세스 풀에서 진행되고, 끝나면 audio_variants가 채워짐
+                self.transcoder.submit(audio_key, source_path)
+                source_path = None
+            return completed
+
+        except TTSRateLimitedError as e:
+            # 호출 한도 초과는 실패가 아니므로 한도가 풀린 뒤 다시 처리
+            self._release_asset(content_hash, audio_storage_key(content_hash))
+            logger.info(f"⏳ TTS job {job.id} throttled, retrying in {e.retry_after:.1f}s")
+            self.job_repository.reschedule(job, e.retry_after)
+            return False
+
+        except Exception as e:
+            self.db.rollback()
+            self._release_asset(content_hash, audio_storage_key(content_hash))
+            return self._fail(job, tombstone, str(e))
+
+        finally:
+            if source_file:
+                source_file.close()
+            if source_path:
+                os.unlink(source_path)
+
+    def _complete(
+        self,
+        job: TTSJob,
+        tombstone: Tombstone,
+        audio_key: str,
+        content_hash: Optional[str] = None,
+        audio_url: Optional[str] = None,
+        audio_info: Optional[AudioInfo] = None
+    ) -> bool:
+        """
+        작업 완료, 에셋 준비(새로 생성한 경우), 묘비 audio_key 저장을 한 트랜잭션으로 커밋합니다.
+
+        Raises:
+            DB 오류는 롤백 후 그대로 전달 (호출한 쪽에서 실패로 처리)
+        """
+        # 같은 음성을 쓰는 다른 묘비에서 이미 만든 변환 음성이 있으면 함께 사용
+        audio_variants = self.tombstone_repository.get_audio_variants(audio_key)
+        try:
+            # lease를 잃었다면 다른 워커가 이 작업을 이어받았으므로 결과를 쓰지 않음
+            if not self.job_repository.mark_done(job, commit=False):
+                self.db.rollback()
+                logger.warning(f"⚠️ TTS job {job.id} lost its lease, discarding result")
+                return False
+            if content_hash:
+                self.asset_repository.mark_ready(content_hash, audio_url, audio_info, commit=False)
+            self.tombstone_repository.set_audio_key(
+                tombstone.id, audio_key, audio_variants, audio_info
+            )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        logger.info(f"✅ Audio ready for tombstone {tombstone.id}: {audio_key}")
+        return True
+
+    def _release_asset(self, content_hash: str, audio_key: str):
+        """
+        생성 권한을 반납하면서 업로드되었을 수 있는 파일의 삭제를 같은 트랜잭션으로 예약합니다.
+
+        다른 묘비가 쓰고 있거나 다시 생성 중인 key는 정리 작업이 삭제하지 않습니다.
+        """
+        self.outbox_repository.add_deletes([audio_key])
+        self.asset_repository.release(content_hash)
+
+    def _fail(self, job: TTSJob, tombstone: Tombstone, error: str) -> bool:
+        logger.warning(f"⚠️ TTS job {job.id} failed: {error}")
+        if not self.job_repository.mark_failed(job, error):
+            return False
+
+        # 연속 실패 횟수에 따라 지수 백오프, max_attempts에 도달하면 재시도 중단
+        attempts = (tombstone.audio_attempts or 0) + 1
+        if attempts >= env_config.tts_max_attempts:
+            next_retry_at = None
+            logger.warning(
+                f"⚠️ Giving up TTS for tombstone {tombstone.id} after {attempts} attempts"
+            )
+        else:
+            next_retry_at = get_kst_now() + retry_delay(attempts)
+        self.tombstone_repository.mark_audio_failed(tombstone.id, attempts, error, next_retry_at)
+        return False
+
+
+def _tee(chunks: Iterable[bytes], file: BinaryIO) -> Iterator[bytes]:
+    """chunks를 그대로 넘기면서 file에도 기록합니다"""
+    for chunk in chunks:
+        file.write(chunk)
+        yield chunk
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """attempts번 연속 실패한 뒤 다음 재시도까지의 대기 시간"""
+    seconds = env_config.tts_retry_base_seconds * (2 ** (attempts - 1))
+    return timedelta(seconds=min(seconds, env_config.tts_retry_max_seconds))
@@ -0,0 +1,225 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import env_config
+from app.models.database import SessionLocal
+from app.repositories.rate_limit_repository import RateLimitRepository
+
+logger = logging.getLogger(__name__)
+
+# Supertone이 한도 초과/과부하를 알리는 응답 코드
+THROTTLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class TTSRateLimitedError(Exception):
+    """Supertone 호출 한도에 걸려 지금은 요청할 수 없는 경우"""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"TTS rate limited, retry after {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+class SharedTokenBucket:
+    """
+    DB에 상태를 저장하여 모든 uvicorn 워커 프로세스가 함께 쓰는 token bucket
+
+    초당 rate개씩 토큰이 채워지고 최대 capacity개까지 쌓입니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate: float,
+        capacity: float,
+        session_factory: Callable[[], Session] = SessionLocal
+    ):
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity
+        self.session_factory = session_factory
+
+    def acquire(self, max_wait: float):
+        """
+        토큰 하나를 가져옵니다. 토큰이 없으면 채워질 때까지 기다립니다.
+
+        Raises:
+            TTSRateLimitedError: max_wait 안에 토큰을 얻지 못한 경우
+        """
+        deadline = time.monotonic() + max_wait
+        while True:
+            db = self.session_factory()
+            try:
+                wait = RateLimitRepository(db).take_token(
+                    self.name, self.rate, self.capacity, time.time()
+                )
+            finally:
+                db.close()
+
+            if wait == 0:
+                return
+            if wait is None:
+                continue
+            if time.monotonic() + wait > deadline:
+                raise TTSRateLimitedError(wait)
+            time.sleep(wait)
+
+    def stats(self) -> dict:
+        """현재 남은 토큰 수 (추정)"""
+        db = self.session_factory()
+        try:
+            bucket = RateLimitRepository(db).get_state(self.name)
+            if bucket is None:
+                tokens = self.capacity
+            else:
+                elapsed = max(0.0, time.time() - bucket.refilled_at)
+                tokens = min(self.capacity, bucket.tokens + elapsed * self.rate)
+        finally:
+            db.close()
+        return {"rate_per_second": self.rate, "burst": self.capacity, "tokens": round(tokens, 2)}
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD(additive increase, multiplicative decrease) 방식의 동시 요청 수 제한
+
+    성공할 때마다 limit을 1/limit씩 늘려(대략 limit번 성공마다 +1) 한도를 탐색하고,
+    한도 초과/과부하 응답을 받으면 limit을 decrease_factor배로 줄입니다.
+    한 번의 burst로 여러 요청이 동시에 실패해도 cooldown 동안은 한 번만 줄입니다.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int,
+        maximum: int,
+        decrease_factor: float = 0.5,
+        cooldown: float = 1.0
+    ):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.limit = float(min(max(initial, minimum), maximum))
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+        self.in_flight = 0
+        self.waiting = 0
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self, timeout: float) -> bool:
+        """동시 요청 자리를 하나 얻습니다. timeout 안에 얻지 못하면 False"""
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            self.waiting += 1
+            try:
+                while self.in_flight >= int(self.limit):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    self._condition.wait(remaining)
+                self.in_flight += 1
+                return True
+            finally:
+                self.waiting -= 1
+
+    def release(self):
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify()
+
+    def on_success(self):
+        with self._condition:
+            previous = int(self.limit)
+            self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            if int(self.limit) > previous:
+                self._condition.notify()
+
+    def on_throttle(self):
+        with self._condition:
+            now = time.monotonic()
+            if now - self._last_decrease < self.cooldown:
+                return
+            self._last_decrease = now
+            self.limit = max(self.minimum, self.limit * self.decrease_factor)
+        logger.warning(f"⚠️ TTS concurrency limit lowered to {int(self.limit)}")
+
+    def stats(self) -> dict:
+        return {
+            "limit": int(self.limit),
+            "min": self.minimum,
+            "max": self.maximum,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting
+        }
+
+
+class TTSRateLimiter:
+    """Supertone 호출 전 동시 요청 자리와 토큰을 차례로 얻고, 응답 결과로 한도를 조정합니다"""
+
+    def __init__(
+        self,
+        concurrency: AdaptiveConcurrencyLimiter,
+        bucket: Optional[SharedTokenBucket] = None,
+        max_wait: float = 30
+    ):
+        self.concurrency = concurrency
+        self.bucket = bucket
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+        self._counters = {"success": 0, "throttled": 0, "errors": 0}
+
+    @contextmanager
+    def slot(self) -> Iterator["TTSRateLimiter"]:
+        """
+        Supertone 요청 한 번을 감싸는 context manager
+
+        Raises:
+            TTSRateLimitedError: max_wait 안에 자리나 토큰을 얻지 못한 경우
+        """
+        if not self.concurrency.acquire(self.max_wait):
+            raise TTSRateLimitedError(self.max_wait)
+        try:
+            if self.bucket:
+                self.bucket.acquire(self.max_wait)
+            yield self
+        finally:
+            self.concurrency.release()
+
+    def record(self, status_code: Optional[int]):
+        """응답 코드를 기록합니다 (None이면 연결 오류)"""
+        if status_code == 200:
+            self.concurrency.on_success()
+            key = "success"
+        elif status_code is None or status_code in THROTTLE_STATUS_CODES:
+            self.concurrency.on_throttle()
+            key = "throttled" if status_code == 429 else "errors"
+        else:
+            key = "errors"
+        with self._lock:
+            self._counters[key] += 1
+
+    def stats(self) -> dict:
+        return {
+            "concurrency": self.concurrency.stats(),
+            "token_bucket": self.bucket.stats() if self.bucket else None,
+            "responses": dict(self._counters)
+        }
+
+
+tts_rate_limiter = TTSRateLimiter(
+    concurrency=AdaptiveConcurrencyLimiter(
+        initial=env_config.tts_concurrency_initial,
+        minimum=env_config.tts_concurrency_min,
+        maximum=env_config.tts_concurrency_max
+    ),
+    bucket=SharedTokenBucket(
+        "supertone",
+        rate=env_config.tts_rate_limit_per_second,
+        capacity=env_config.tts_rate_limit_burst
+    ) if env_config.tts_rate_limit_per_second > 0 else None,
+    max_wait=env_config.tts_rate_limit_max_wait
+)
@@ -1,51 +1,180 @@
-import requests
 import logging
-from typing import Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional
 from app.core.config import env_config
+from app.services.http_client import tts_http_client
+from app.services.tts_chunking import chunk_text, join_mp3, strip_id3
+from app.services.tts_rate_limiter import TTSRateLimitedError, tts_rate_limiter
 
 logger = logging.getLogger(__name__)
 
 
+class TTSGenerationError(Exception):
+    """스트리밍 생성 도중 Supertone 요청이 실패한 경우"""
+
+
 class TTSService:
     def __init__(self):
         self.api_key = env_config.supertone_api_key
         self.api_url = env_config.supertone_api_url
+        self.language = env_config.supertone_language
+        self.style = env_config.supertone_style
+        # API URL의 마지막 경로가 음성(voice) ID
+        self.voice = self.api_url.rstrip("/").rsplit("/", 1)[-1] if self.api_url else ""
+        self.chunk_max_chars = env_config.tts_chunk_max_chars
+        self.chunk_concurrency = env_config.tts_chunk_concurrency
+        self.chunk_retries = env_config.tts_chunk_retries
+        self.stream_chunk_size = env_config.tts_stream_chunk_size
     
     def generate_audio(self, text: str) -> Optional[bytes]:
         """
         Supertone API를 사용하여 TTS 음성을 생성합니다.
         
+        긴 텍스트는 문장 경계에서 나누어 동시에 생성한 뒤 순서대로 합칩니다.
+        실패한 조각은 그 조각만 다시 요청합니다.
+        
         Args:
             text: 변환할 텍스트
         
         Returns:
             음성 파일의 바이너리 데이터, 실패 시 None
+        
+        Raises:
+            TTSRateLimitedError: Supertone 호출 한도 초과
         """
         logger.info("✅ TTS generation started")
         
-        payload = {
+        chunks = chunk_text(text, self.chunk_max_chars)
+        if len(chunks) == 1:
+            audio = self._synthesize(text)
+        else:
+            logger.info(f"✂️ Split TTS text into {len(chunks)} chunks")
+            workers = min(self.chunk_concurrency, len(chunks))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                parts = list(executor.map(self._synthesize_with_retry, chunks))
+            audio = join_mp3(parts) if all(parts) else None
+        
+        if audio:
+            logger.info("✅ TTS generation successful")
+        return audio
+    
+    def stream_audio(self, text: str) -> Iterator[bytes]:
+        """
+        TTS 음성을 bytes 조각으로 스트리밍합니다.
+        
+        응답 전체를 메모리에 올리지 않고 받는 대로 내보내므로, 업로드를
+        생성과 동시에 진행할 수 있습니다. 긴 텍스트는 동시에 생성하되
+        chunk_concurrency개까지만 미리 요청하고 순서대로 내보냅니다.
+        
+        Raises:
+            TTSGenerationError: Supertone 요청 실패
+            TTSRateLimitedError: Supertone 호출 한도 초과
+        """
+        logger.info("✅ TTS streaming started")
+        
+        chunks = chunk_text(text, self.chunk_max_chars)
+        if len(chunks) == 1:
+            yield from self._stream_single(text)
+            return
+        
+        logger.info(f"✂️ Split TTS text into {len(chunks)} chunks")
+        last = len(chunks) - 1
+        with ThreadPoolExecutor(max_workers=min(self.chunk_concurrency, len(chunks))) as executor:
+            window = deque()
+            pending = iter(enumerate(chunks))
+            for index, chunk in pending:
+                window.append((index, executor.submit(self._synthesize_with_retry, chunk)))
+                if len(window) >= self.chunk_concurrency:
+                    break
+            while window:
+                index, future = window.popleft()
+                part = future.result()
+                if not part:
+                    raise TTSGenerationError(f"TTS chunk {index + 1}/{len(chunks)} failed")
+                next_chunk = next(pending, None)
+                if next_chunk:
+                    future = executor.submit(self._synthesize_with_retry, next_chunk[1])
+                    window.append((next_chunk[0], future))
+                yield strip_id3(part, keep_header=index == 0, keep_trailer=index == last)
+        
+        logger.info("✅ TTS streaming finished")
+    
+    def _stream_single(self, text: str) -> Iterator[bytes]:
+        """Supertone API 단일 요청의 응답 본문을 스트리밍"""
+        with tts_rate_limiter.slot() as limiter:
+            try:
+                response = tts_http_client.post(
+                    self.api_url, json=self._payload(text), headers=self._headers(), stream=True
+                )
+            except Exception:
+                limiter.record(None)
+                raise
+            try:
+                limiter.record(response.status_code)
+                self._raise_if_throttled(response)
+                if response.status_code != 200:
+                    raise TTSGenerationError(
+                        f"Supertone API failed: {response.status_code} - {response.text}"
+                    )
+                received = 0
+                for data in response.iter_content(chunk_size=self.stream_chunk_size):
+                    received += len(data)
+                    yield data
+                if not received:
+                    raise TTSGenerationError("Supertone API returned empty audio")
+            finally:
+                response.close()
+    
+    def _raise_if_throttled(self, response):
+        """429 응답이면 Retry-After만큼 뒤에 다시 시도하도록 예외를 던집니다"""
+        if response.status_code != 429:
+            return
+        try:
+            retry_after = float(response.headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            retry_after = env_config.tts_rate_limit_retry_seconds
+        logger.warning(f"⚠️ Supertone rate limited, retry after {retry_after}s")
+        raise TTSRateLimitedError(retry_after)
+    
+    def _payload(self, text: str) -> dict:
+        return {
             "text": text,
-            "language": "ko",
-            "style": "neutral"
+            "language": self.language,
+            "style": self.style
         }
-        
-        headers = {
+    
+    def _headers(self) -> dict:
+        return {
             "x-sup-api-key": self.api_key,
             "Content-Type": "application/json"
         }
-        
-        request_url = self.api_url
-        
-        try:
-            response = requests.post(request_url, json=payload, headers=headers)
+    
+    def _synthesize_with_retry(self, text: str) -> Optional[bytes]:
+        """조각 하나를 생성하며, 실패 시 chunk_retries번까지 그 조각만 다시 요청합니다"""
+        for attempt in range(self.chunk_retries + 1):
+            audio = self._synthesize(text)
+            if audio:
+                return audio
+            logger.warning(f"⚠️ TTS chunk failed (attempt {attempt + 1}/{self.chunk_retries + 1})")
+        return None
+    
+    def _synthesize(self, text: str) -> Optional[bytes]:
+        """Supertone API 단일 요청 (한도 초과 시 TTSRateLimitedError)"""
+        with tts_rate_limiter.slot() as limiter:
+            try:
+                response = tts_http_client.post(
+                    self.api_url, json=self._payload(text), headers=self._headers()
+                )
+            except Exception as e:
+                limiter.record(None)
+                logger.error(f"❌ TTS generation error: {e}")
+                return None
+            limiter.record(response.status_code)
             
+            self._raise_if_throttled(response)
             if response.status_code != 200:
                 logger.error(f"❌ Supertone API failed: {response.status_code} - {response.text}")
                 return None
             
-            logger.info("✅ TTS generation successful")
             return response.content
-            
-        except Exception as e:
-            logger.error(f"❌ TTS generation error: {e}")
-            return None
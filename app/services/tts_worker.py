@@ -0,0 +1,107 @@
+import logging
+import threading
+from typing import Callable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import env_config
+from app.models.database import SessionLocal
+from app.repositories.tts_job_repository import TTSJobRepository
+from app.services.tts_job_service import TTSJobService
+
+logger = logging.getLogger(__name__)
+
+
+class TTSWorkerPool:
+    """tts_jobs 테이블을 폴링하며 TTS 작업을 처리하는 스레드 풀"""
+
+    def __init__(
+        self,
+        worker_count: int,
+        poll_interval: float,
+        prerender_budget: Optional[int] = None,
+        lease_seconds: float = 300,
+        session_factory: Callable[[], Session] = SessionLocal
+    ):
+        self.worker_count = worker_count
+        self.poll_interval = poll_interval
+        self.prerender_budget = prerender_budget
+        self.lease_seconds = lease_seconds
+        self.session_factory = session_factory
+        self._threads: List[threading.Thread] = []
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+
+    def start(self):
+        """Start worker threads"""
+        if self._threads:
+            return
+        self._stop_event.clear()
+        for index in range(self.worker_count):
+            thread = threading.Thread(
+                target=self._run,
+                name=f"tts-worker-{index}",
+                daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"TTS worker pool started ({self.worker_count} workers)")
+
+    def stop(self, timeout: float = 10.0):
+        """Stop worker threads, letting in-flight jobs finish"""
+        self._stop_event.set()
+        self._wake_event.set()
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        self._threads = []
+        logger.info("TTS worker pool stopped")
+
+    def notify(self):
+        """새 작업이 등록되었음을 알려 대기 중인 워커를 깨웁니다"""
+        self._wake_event.set()
+
+    def run_once(self) -> bool:
+        """작업 하나를 선점하여 처리합니다. 처리할 작업이 없으면 False"""
+        db: Session = self.session_factory()
+        try:
+            job = TTSJobRepository(db).claim_next(self.prerender_budget, self.lease_seconds)
+            if not job:
+                return False
+            TTSJobService(db).process(job)
+            return True
+        finally:
+            db.close()
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                if self.run_once():
+                    continue
+            except Exception as e:
+                logger.error(f"Error processing TTS job: {e}")
+
+            self._wake_event.wait(self.poll_interval)
+            self._wake_event.clear()
+
+
+worker_pool = TTSWorkerPool(
+    worker_count=env_config.tts_worker_count,
+    poll_interval=env_config.tts_worker_poll_interval,
+    prerender_budget=env_config.tts_prerender_concurrency,
+    lease_seconds=env_config.tts_job_lease_seconds
+)
+
+
+def start_tts_workers():
+    """Start the background TTS worker pool"""
+    worker_pool.start()
+
+
+def stop_tts_workers():
+    """Stop the background TTS worker pool"""
+    worker_pool.stop()
+
+
+def notify_tts_workers():
+    """Wake up idle TTS workers"""
+    worker_pool.notify()
@@ -0,0 +1,78 @@
+import json
+import logging
+from datetime import date
+from typing import Callable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models.sweep_checkpoint import UNLOCK_SWEEP
+from app.repositories.sweep_checkpoint_repository import SweepCheckpointRepository
+from app.repositories.tombstone_repository import TombstoneRepository
+
+logger = logging.getLogger(__name__)
+
+
+class UnlockSweepService:
+    """
+    잠금 해제일이 된 묘비를 chunk 단위로 해제하는 스윕
+
+    chunk마다 UPDATE ... RETURNING과 전달할 id(sweep_checkpoints)를 한 트랜잭션으로 커밋하므로
+    한꺼번에 모든 행을 잠그지 않습니다. 해제된 묘비는 잠긴 묘비 부분 인덱스에서 빠지므로
+    chunk마다 인덱스 앞부분을 다시 읽으며, 다른 트랜잭션이 잡고 있어 건너뛴 행도 다음 chunk에서
+    다시 시도합니다. 해제한 id는 chunk마다 on_unlocked로 전달하며, 전달 전에 중단되면
+    다음 실행에서 다시 전달합니다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.tombstone_repository = TombstoneRepository(db)
+        self.checkpoint_repository = SweepCheckpointRepository(db)
+
+    def sweep(
+        self,
+        current_date: date,
+        chunk_size: int,
+        on_unlocked: Optional[Callable[[List[int]], None]] = None
+    ) -> int:
+        """
+        Returns:
+            이번 실행에서 해제한 묘비 수
+
+        Raises:
+            on_unlocked의 예외는 그대로 전달 (해당 chunk의 id는 다음 실행에서 다시 전달됨)
+        """
+        checkpoint = self.checkpoint_repository.get(UNLOCK_SWEEP)
+        if checkpoint and checkpoint.pending_ids:
+            # 지난 실행이 해제 후 전달하지 못한 id
+            self._deliver(json.loads(checkpoint.pending_ids), on_unlocked)
+
+        total = 0
+        while True:
+            try:
+                unlocked = self.tombstone_repository.unlock_due_chunk(current_date, chunk_size)
+                if not unlocked:
+                    self.db.rollback()
+                    break
+                ids = sorted(tombstone_id for _, tombstone_id in unlocked)
+                self.checkpoint_repository.save(UNLOCK_SWEEP, ids)
+                self.db.commit()
+            except Exception:
+                self.db.rollback()
+                raise
+
+            total += len(ids)
+            last_date, last_id = max(unlocked)
+            logger.info(f"🔓 Unlocked {len(ids)} tombstones (through {last_date} #{last_id})")
+            self._deliver(ids, on_unlocked)
+            if len(unlocked) < chunk_size:
+                break
+
+        self.checkpoint_repository.delete(UNLOCK_SWEEP)
+        return total
+
+    def _deliver(
+        self, tombstone_ids: List[int], on_unlocked: Optional[Callable[[List[int]], None]]
+    ):
+        if on_unlocked and tombstone_ids:
+            on_unlocked(tombstone_ids)
+        self.checkpoint_repository.clear_pending(UNLOCK_SWEEP)
@@ -3,15 +3,45 @@ from sqlalchemy.orm import Session
 from app.models.user import User
 from app.repositories.user_repository import UserRepository
 from app.repositories.tombstone_repository import TombstoneRepository
+from app.repositories.storage_outbox_repository import StorageOutboxRepository
+from app.repositories.tombstone_collaborator_repository import TombstoneCollaboratorRepository
+from app.services.audio_url import get_audio_key
 from app.schemas.user import UserSignUpDto, UserSignInDto, UserResponseDto, TokenResponseDto
 from app.utils.auth import verify_password, get_password_hash, create_access_token, ACCESS_TOKEN_EXPIRE_HOURS
 
 
+def user_response(user: User) -> UserResponseDto:
+    """User → 사용자 응답 DTO"""
+    return UserResponseDto(
+        id=user.id,
+        email=user.email,
+        username=user.username,
+        created_at=user.created_at.isoformat()
+    )
+
+
+def issue_token(user: User) -> TokenResponseDto:
+    """로그인한 사용자의 JWT 토큰 발급"""
+    access_token = create_access_token(
+        data={"sub": str(user.id)}
+    )
+    
+    expires_at = datetime.utcnow() + timedelta(hours=ACCESS_TOKEN_EXPIRE_HOURS)
+    
+    return TokenResponseDto(
+        user=user_response(user),
+        session_token=access_token,
+        expires_at=expires_at.isoformat() + "Z"
+    )
+
+
 class UserService:
     def __init__(self, db: Session):
         self.db = db
         self.user_repository = UserRepository(db)
         self.tombstone_repository = TombstoneRepository(db)
+        self.outbox_repository = StorageOutboxRepository(db)
+        self.collaborator_repository = TombstoneCollaboratorRepository(db)
 
     def sign_up(self, data: UserSignUpDto) -> UserResponseDto:
         """회원가입"""
@@ -30,12 +60,7 @@ class UserService:
             hashed_password=hashed_password
         )
         
-        return UserResponseDto(
-            id=user.id,
-            email=user.email,
-            username=user.username,
-            created_at=user.created_at.isoformat()
-        )
+        return user_response(user)
 
     def sign_in(self, data: UserSignInDto) -> TokenResponseDto:
         """로그인"""
@@ -48,23 +73,7 @@ class UserService:
         if not verify_password(data.password, user.hashed_password):
             raise ValueError("이메일 또는 비밀번호가 올바르지 않습니다.")
         
-        # JWT 토큰 생성
-        access_token = create_access_token(
-            data={"sub": str(user.id)}
-        )
-        
-        expires_at = datetime.utcnow() + timedelta(hours=ACCESS_TOKEN_EXPIRE_HOURS)
-        
-        return TokenResponseDto(
-            user=UserResponseDto(
-                id=user.id,
-                email=user.email,
-                username=user.username,
-                created_at=user.created_at.isoformat()
-            ),
-            session_token=access_token,
-            expires_at=expires_at.isoformat() + "Z"
-        )
+        return issue_token(user)
 
     def delete_account(self, user_id: int) -> int:
         """회원탈퇴 - 사용자와 관련된 모든 묘지 삭제"""
@@ -72,6 +81,13 @@ class UserService:
         graves = self.tombstone_repository.get_all(user_id)
         graves_count = len(graves)
         
+        # 음성 파일 삭제 예약 - 행 삭제와 같은 트랜잭션으로 커밋되고,
+        # 실제 삭제는 백그라운드 작업이 묶어서 처리 (다른 묘비가 쓰는 파일은 유지)
+        self.outbox_repository.add_deletes(get_audio_key(grave) for grave in graves)
+        
+        # 친구 목록과 다른 묘비의 참여 기록도 같은 트랜잭션으로 삭제
+        self.collaborator_repository.delete_for_user(user_id, [grave.id for grave in graves])
+        
         # 묘지 삭제
         for grave in graves:
             self.db.delete(grave)
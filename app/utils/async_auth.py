@@ -0,0 +1,17 @@
+from fastapi import Depends
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.async_database import get_async_db
+from app.models.user import User
+from app.repositories.async_user_repository import AsyncUserRepository
+from app.utils.auth import ensure_user, get_token_user_id, security
+
+
+async def get_current_user_async(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db)
+) -> User:
+    """현재 인증된 사용자 가져오기 (비동기 세션)"""
+    user_id = get_token_user_id(credentials)
+    return ensure_user(await AsyncUserRepository(db).get_by_id(user_id))
@@ -0,0 +1,23 @@
+"""Content hashing for TTS audio deduplication"""
+import hashlib
+import re
+import unicodedata
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_tts_text(text: str) -> str:
+    """음성 결과에 영향을 주지 않는 차이(유니코드 조합형, 공백)를 제거합니다"""
+    text = unicodedata.normalize("NFC", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def compute_audio_hash(text: str, language: str, style: str, voice: str = "") -> str:
+    """정규화된 텍스트와 음성 설정으로 오디오 에셋의 content hash를 계산합니다"""
+    key = "\x1f".join([normalize_tts_text(text), language, style, voice])
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def audio_storage_key(content_hash: str) -> str:
+    """content hash에 대응하는 S3 object key"""
+    return f"audio/{content_hash}.mp3"
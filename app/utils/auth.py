@@ -1,11 +1,13 @@
+import secrets
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
 import bcrypt
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 
+from app.core.config import env_config
 from app.models.database import get_db
 from app.models.user import User
 
@@ -62,11 +64,8 @@ def decode_access_token(token: str) -> dict:
         )
 
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
-    """현재 인증된 사용자 가져오기"""
+def get_token_user_id(credentials: HTTPAuthorizationCredentials) -> int:
+    """Bearer 토큰의 사용자 ID (토큰이 잘못되었으면 401)"""
     token = credentials.credentials
     
     try:
@@ -95,7 +94,11 @@ def get_current_user(
             detail={"status": 401, "error": {"message": "Invalid user ID in token"}}
         )
     
-    user = db.query(User).filter(User.id == user_id).first()
+    return user_id
+
+
+def ensure_user(user: Optional[User]) -> User:
+    """토큰의 사용자가 없으면 401"""
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -103,3 +106,28 @@ def get_current_user(
         )
     
     return user
+
+
+def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db)
+) -> User:
+    """현재 인증된 사용자 가져오기"""
+    user_id = get_token_user_id(credentials)
+    return ensure_user(db.query(User).filter(User.id == user_id).first())
+
+
+def require_internal_token(x_internal_token: Optional[str] = Header(None)) -> None:
+    """운영용 API 접근 확인 (INTERNAL_API_TOKEN이 없으면 404, 헤더가 다르면 403)"""
+    expected = env_config.internal_api_token
+    if not expected:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"status": 404, "error": {"message": "Not found"}}
+        )
+    
+    if not x_internal_token or not secrets.compare_digest(x_internal_token, expected):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={"status": 403, "error": {"message": "Invalid internal token"}}
+        )
@@ -0,0 +1,60 @@
+from typing import Mapping, Optional
+
+# 저비트레이트 음성을 고를 네트워크 상태 (Network Information API의 effective connection type)
+SLOW_CONNECTION_TYPES = {"slow-2g", "2g", "3g"}
+# 이 값(Mbps)보다 느리면 저비트레이트 음성 사용
+SLOW_DOWNLINK_MBPS = 1.5
+# 응답이 달라지는 요청 헤더 (Vary) / 브라우저에 보내 달라고 요청할 client hint (Accept-CH)
+AUDIO_VARIANT_HINTS = ("Save-Data", "ECT", "Downlink")
+
+
+def prefers_low_bitrate(headers: Mapping[str, str]) -> bool:
+    """Save-Data, ECT, Downlink client hint로 데이터 절약이 필요한 클라이언트인지 판단합니다"""
+    if headers.get("save-data", "").strip().lower() == "on":
+        return True
+    if headers.get("ect", "").strip().lower() in SLOW_CONNECTION_TYPES:
+        return True
+    try:
+        return float(headers.get("downlink", "")) < SLOW_DOWNLINK_MBPS
+    except ValueError:
+        return False
+
+
+def accepts_media_type(headers: Mapping[str, str], media_type: str) -> bool:
+    """Accept 헤더가 없거나 media_type(또는 와일드카드)을 허용하면 True"""
+    accept = headers.get("accept", "")
+    if not accept:
+        return True
+    major = media_type.split("/")[0]
+    for item in accept.split(","):
+        value, *params = [part.strip() for part in item.split(";")]
+        quality = 1.0
+        for param in params:
+            name, _, number = param.partition("=")
+            if name == "q":
+                try:
+                    quality = float(number)
+                except ValueError:
+                    pass
+        if value in (media_type, f"{major}/*", "*/*") and quality > 0:
+            return True
+    return False
+
+
+def select_audio_variant(
+    headers: Mapping[str, str],
+    quality: Optional[str],
+    variant_name: str,
+    variant_media_type: str
+) -> Optional[str]:
+    """
+    요청에 맞는 음성 variant 이름을 고릅니다 (None이면 원본 MP3)
+
+    quality 쿼리 파라미터(low/original)가 있으면 그대로 따르고, 없으면 client hint로 판단합니다.
+    클라이언트가 variant 형식을 받지 않으면 원본을 사용합니다.
+    """
+    if quality == "original":
+        return None
+    if quality != "low" and not prefers_low_bitrate(headers):
+        return None
+    return variant_name if accepts_media_type(headers, variant_media_type) else None
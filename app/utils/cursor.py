@@ -0,0 +1,27 @@
+import base64
+import json
+from datetime import date
+from typing import Tuple
+
+
+def encode_cursor(unlock_date: date, tombstone_id: int) -> str:
+    """목록의 마지막 항목 위치를 클라이언트에 내려줄 불투명한 cursor 문자열로 만듭니다"""
+    payload = json.dumps([unlock_date.isoformat(), tombstone_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[date, int]:
+    """
+    encode_cursor로 만든 cursor를 (unlock_date, id)로 되돌립니다.
+
+    Raises:
+        ValueError: 형식이 잘못된 cursor
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        unlock_date, tombstone_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(tombstone_id, int):
+            raise TypeError(tombstone_id)
+        return date.fromisoformat(unlock_date), tombstone_id
+    except (ValueError, TypeError, UnicodeEncodeError):
+        raise ValueError("Invalid cursor")
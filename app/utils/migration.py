@@ -5,7 +5,9 @@ import os
 import logging
 from pathlib import Path
 from sqlalchemy import text
+from app.core.config import env_config
 from app.models.database import engine
+from app.utils.storage_key import storage_key_from_url
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +27,9 @@ def run_migrations():
         else:
             logger.info("🔧 Detected SQLite database")
             run_sqlite_migrations()
+        
+        with engine.connect() as conn:
+            backfill_audio_keys(conn)
             
     except Exception as e:
         logger.error(f"❌ Migration failed: {e}")
@@ -38,6 +43,15 @@ def run_sqlite_migrations():
         "add_share_token.sql",  # 공유 링크 토큰 (기존)
         "add_enroll_share_fields.sql",  # 친구 초대 필드
         "add_invite_token.sql",  # 초대 링크 토큰
+        "add_audio_status.sql",  # TTS 생성 상태
+        "add_tts_job_source.sql",  # TTS 작업 등록 경로
+        "add_tts_job_lease.sql",  # TTS 작업 lease, 중복 방지 인덱스
+        "add_audio_retry.sql",  # TTS 실패 횟수, 재시도 시각
+        "add_audio_key.sql",  # 음성 object key (presigned URL)
+        "add_audio_variants.sql",  # 변환된 음성(저비트레이트) key
+        "add_audio_metadata.sql",  # 음성 재생 시간/크기/코덱
+        "add_tombstone_list_index.sql",  # 묘비 목록 keyset pagination 인덱스
+        "add_unlock_sweep_index.sql",  # 잠금 해제 스윕 부분 인덱스
     ]
     
     migrations_dir = Path(__file__).parent.parent.parent / "migrations"
@@ -61,7 +75,10 @@ def run_sqlite_migrations():
                 
                 for statement in statements:
                     # Skip comments and empty lines
-                    if statement.startswith('--') or not statement:
+                    statement = "\n".join(
+                        line for line in statement.splitlines() if not line.strip().startswith('--')
+                    ).strip()
+                    if not statement:
                         continue
                     
                     try:
@@ -90,6 +107,15 @@ def run_postgresql_migrations():
         "add_share_token_postgresql.sql",  # 공유 링크 토큰 (기존)
         "add_enroll_share_fields_postgresql.sql",  # 친구 초대 필드
         "add_invite_token_postgresql.sql",  # 초대 링크 토큰
+        "add_audio_status_postgresql.sql",  # TTS 생성 상태
+        "add_tts_job_source_postgresql.sql",  # TTS 작업 등록 경로
+        "add_tts_job_lease_postgresql.sql",  # TTS 작업 lease, 중복 방지 인덱스
+        "add_audio_retry_postgresql.sql",  # TTS 실패 횟수, 재시도 시각
+        "add_audio_key_postgresql.sql",  # 음성 object key (presigned URL)
+        "add_audio_variants_postgresql.sql",  # 변환된 음성(저비트레이트) key
+        "add_audio_metadata_postgresql.sql",  # 음성 재생 시간/크기/코덱
+        "add_tombstone_list_index_postgresql.sql",  # 묘비 목록 keyset pagination 인덱스
+        "add_unlock_sweep_index_postgresql.sql",  # 잠금 해제 스윕 부분 인덱스
     ]
     
     migrations_dir = Path(__file__).parent.parent.parent / "migrations"
@@ -123,6 +149,60 @@ def run_postgresql_migrations():
     logger.info("✅ PostgreSQL migrations completed")
 
 
+def backfill_audio_keys(conn, batch_size: int = 500) -> int:
+    """
+    예전 audio_url을 object key로 변환해 audio_key에 저장합니다 (add_audio_key 후속 단계)
+
+    SQL로는 버킷 이름과 endpoint를 알 수 없으므로 읽기 시 변환과 같은
+    storage_key_from_url 규칙을 사용합니다. 이전 버전의 add_audio_key가 URL을 그대로
+    복사해 둔 audio_key도 audio_url에서 다시 계산해 덮어씁니다.
+    key를 알 수 없는 URL은 audio_key를 비워 두어 다음 조회 때 음성을 다시 생성합니다.
+    처리한 행은 audio_url을 비우므로 다음 시작 시에는 다시 읽지 않습니다.
+
+    Returns:
+        변환한 묘비 수
+    """
+    converted = 0
+    while True:
+        rows = conn.execute(
+            text("SELECT id, audio_url FROM tombstones WHERE audio_url IS NOT NULL LIMIT :limit"),
+            {"limit": batch_size}
+        ).all()
+        if not rows:
+            break
+        
+        for tombstone_id, audio_url in rows:
+            audio_key = storage_key_from_url(
+                audio_url, env_config.s3_bucket_name, env_config.local_storage_base_url
+            )
+            if audio_key:
+                converted += 1
+                conn.execute(
+                    text(
+                        "UPDATE tombstones SET audio_key = :audio_key, audio_url = NULL "
+                        "WHERE id = :id"
+                    ),
+                    {"audio_key": audio_key, "id": tombstone_id}
+                )
+            else:
+                logger.warning(
+                    f"⚠️ Cannot map the audio URL of tombstone {tombstone_id} to a key, "
+                    f"it will be re-rendered: {audio_url}"
+                )
+                conn.execute(
+                    text(
+                        "UPDATE tombstones SET audio_key = NULL, audio_url = NULL, "
+                        "audio_variants = NULL, audio_status = NULL WHERE id = :id"
+                    ),
+                    {"id": tombstone_id}
+                )
+        conn.commit()
+    
+    if converted:
+        logger.info(f"✅ Converted {converted} legacy audio URLs to audio keys")
+    return converted
+
+
 def check_migration_status():
     """Check if migrations have been applied"""
     try:
@@ -135,14 +215,28 @@ def check_migration_status():
             has_enroll = 'enroll' in columns
             has_share = 'share' in columns
             has_invite_token = 'invite_token' in columns
+            has_audio_status = 'audio_status' in columns
+            has_audio_attempts = 'audio_attempts' in columns
+            has_audio_key = 'audio_key' in columns
+            has_audio_variants = 'audio_variants' in columns
+            has_audio_metadata = 'audio_duration_ms' in columns
             
             logger.info(f"Migration status:")
             logger.info(f"  - share_token: {'✓' if has_share_token else '✗'}")
             logger.info(f"  - enroll: {'✓' if has_enroll else '✗'}")
             logger.info(f"  - share: {'✓' if has_share else '✗'}")
             logger.info(f"  - invite_token: {'✓' if has_invite_token else '✗'}")
+            logger.info(f"  - audio_status: {'✓' if has_audio_status else '✗'}")
+            logger.info(f"  - audio_attempts: {'✓' if has_audio_attempts else '✗'}")
+            logger.info(f"  - audio_key: {'✓' if has_audio_key else '✗'}")
+            logger.info(f"  - audio_variants: {'✓' if has_audio_variants else '✗'}")
+            logger.info(f"  - audio_duration_ms: {'✓' if has_audio_metadata else '✗'}")
             
-            return has_share_token and has_enroll and has_share and has_invite_token
+            return (
+                has_share_token and has_enroll and has_share
+                and has_invite_token and has_audio_status and has_audio_attempts
+                and has_audio_key and has_audio_variants and has_audio_metadata
+            )
             
     except Exception as e:
         logger.error(f"Failed to check migration status: {e}")
@@ -0,0 +1,124 @@
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+# 비트레이트 표 (kbps), [MPEG 버전 그룹][layer]
+_BITRATES = {
+    (1, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (1, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (1, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (2, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (2, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (2, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+# 샘플링 레이트, 헤더의 버전 비트 → (44.1k 계열, 48k 계열, 32k 계열)
+_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),  # MPEG-1
+    2: (22050, 24000, 16000),  # MPEG-2
+    0: (11025, 12000, 8000),   # MPEG-2.5
+}
+_LAYERS = {3: 1, 2: 2, 1: 3}  # 헤더의 layer 비트 → layer 번호
+
+MP3_CODEC = "mp3"
+
+
+class AudioInfo(NamedTuple):
+    """음성 파일 메타데이터"""
+    duration_ms: int
+    size_bytes: int
+    codec: str
+
+
+def _frame_header(header: bytes) -> Optional[tuple]:
+    """4바이트 MPEG 오디오 프레임 헤더를 해석합니다. 유효하지 않으면 None
+
+    Returns:
+        (프레임 길이 bytes, 프레임당 샘플 수, 샘플링 레이트)
+    """
+    if header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+        return None
+    version_bits = (header[1] >> 3) & 0x03
+    layer = _LAYERS.get((header[1] >> 1) & 0x03)
+    bitrate_index = header[2] >> 4
+    sample_rate_index = (header[2] >> 2) & 0x03
+    if version_bits == 1 or layer is None or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+
+    mpeg1 = version_bits == 3
+    bitrate = _BITRATES[(1 if mpeg1 else 2, layer)][bitrate_index] * 1000
+    sample_rate = _SAMPLE_RATES[version_bits][sample_rate_index]
+    padding = (header[2] >> 1) & 0x01
+
+    if layer == 1:
+        return (12 * bitrate // sample_rate + padding) * 4, 384, sample_rate
+    samples = 1152 if layer == 2 or mpeg1 else 576
+    return samples // 8 * bitrate // sample_rate + padding, samples, sample_rate
+
+
+class MP3Inspector:
+    """
+    MP3 스트림을 받는 대로 프레임 헤더만 읽어 재생 시간과 크기를 계산합니다.
+
+    프레임 본문은 건너뛰므로 파일 전체를 메모리에 올리지 않고, VBR 파일도
+    프레임마다 샘플 수를 더하므로 정확합니다. ID3v2/ID3v1 태그는 건너뜁니다.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._skip = 0
+        self.size_bytes = 0
+        self.frames = 0
+        self._seconds = 0.0
+
+    def feed(self, chunk: bytes):
+        self.size_bytes += len(chunk)
+        if self._skip >= len(chunk):
+            self._skip -= len(chunk)
+            return
+        self._buffer += chunk[self._skip:]
+        self._skip = 0
+        buffer = self._buffer
+        offset = 0
+
+        while len(buffer) - offset >= 10:
+            if buffer[offset:offset + 3] == b"ID3":
+                # ID3v2: 10바이트 헤더 + syncsafe 크기 (+ footer 10바이트)
+                size = 0
+                for byte in buffer[offset + 6:offset + 10]:
+                    size = (size << 7) | (byte & 0x7F)
+                step = 10 + size + (10 if buffer[offset + 5] & 0x10 else 0)
+            elif buffer[offset:offset + 3] == b"TAG":
+                step = 128  # ID3v1
+            else:
+                frame = _frame_header(buffer[offset:offset + 4])
+                if frame is None:
+                    # 다음 sync 후보(0xFF)까지 건너뜀
+                    next_sync = buffer.find(b"\xff", offset + 1)
+                    offset = next_sync if next_sync != -1 else len(buffer)
+                    continue
+                step, samples, sample_rate = frame
+                self.frames += 1
+                self._seconds += samples / sample_rate
+            offset += step
+
+        if offset > len(buffer):
+            self._skip = offset - len(buffer)
+            offset = len(buffer)
+        del buffer[:offset]
+
+    def wrap(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """chunks를 그대로 넘기면서 메타데이터를 계산합니다"""
+        for chunk in chunks:
+            self.feed(chunk)
+            yield chunk
+
+    def result(self) -> Optional[AudioInfo]:
+        """지금까지 받은 데이터의 메타데이터, MP3 프레임이 없으면 None"""
+        if not self.frames:
+            return None
+        return AudioInfo(round(self._seconds * 1000), self.size_bytes, MP3_CODEC)
+
+
+def inspect_mp3(data: bytes) -> Optional[AudioInfo]:
+    """MP3 데이터 전체의 메타데이터"""
+    inspector = MP3Inspector()
+    inspector.feed(data)
+    return inspector.result()
@@ -0,0 +1,36 @@
+from typing import Optional
+from urllib.parse import unquote, urlsplit
+
+
+def storage_key_from_url(
+    value: Optional[str], bucket_name: str = "", local_base_url: str = ""
+) -> Optional[str]:
+    """
+    예전에 저장된 음성 URL을 object key로 변환합니다.
+
+    - `https://{bucket}.s3.{region}.amazonaws.com/{key}` (virtual-hosted) → `{key}`
+    - `http://host:port/{bucket}/{key}` (path-style, S3_ENDPOINT_URL 서버 포함) → `{key}`
+    - `{local_base_url}/{key}` (STORAGE_BACKEND=local) → `{key}`
+    - 이미 key인 값은 그대로 반환
+    - key를 알 수 없는 URL(다른 버킷의 path-style URL 등)은 None
+    """
+    if not value:
+        return None
+    base_url = local_base_url.rstrip("/")
+    if base_url and value.startswith(f"{base_url}/"):
+        return value[len(base_url) + 1:] or None
+    if not value.startswith(("http://", "https://")):
+        # object key는 "/"로 시작하지 않으므로 다른 prefix의 로컬 URL로 보고 건너뜀
+        return None if value.startswith("/") else value
+
+    parts = urlsplit(value)
+    host = parts.hostname or ""
+    path = unquote(parts.path).lstrip("/")
+    virtual_hosted = (
+        host.endswith(".amazonaws.com") and not host.startswith(("s3.", "s3-"))
+    ) or (bucket_name and host.startswith(f"{bucket_name}."))
+    if virtual_hosted:
+        return path or None
+    if bucket_name and path.startswith(f"{bucket_name}/"):
+        return path[len(bucket_name) + 1:] or None
+    return None
@@ -0,0 +1,9 @@
+-- Add audio_key field to tombstones table
+-- Migration: add_audio_key
+-- Date: 2026-10-18
+
+-- Add audio_key column (저장소 object key, 응답 시 presigned URL로 변환)
+ALTER TABLE tombstones ADD COLUMN audio_key VARCHAR(500);
+
+-- 기존 audio_url은 버킷 이름/endpoint를 알아야 key로 바꿀 수 있으므로
+-- 서버 시작 시 app.utils.migration.backfill_audio_keys가 변환합니다.
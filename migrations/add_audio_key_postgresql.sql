@@ -0,0 +1,13 @@
+-- Add audio_key field to tombstones table (PostgreSQL)
+-- Migration: add_audio_key_postgresql
+-- Date: 2026-10-18
+
+-- Add audio_key column (저장소 object key, 응답 시 presigned URL로 변환)
+ALTER TABLE tombstones ADD COLUMN IF NOT EXISTS audio_key VARCHAR(500);
+
+-- 기존 audio_url은 버킷 이름/endpoint를 알아야 key로 바꿀 수 있으므로
+-- 서버 시작 시 app.utils.migration.backfill_audio_keys가 변환합니다.
+
+-- Add comment for documentation
+COMMENT ON COLUMN tombstones.audio_key IS '음성 파일 저장소 object key (응답 시 presigned URL로 변환)';
+COMMENT ON COLUMN tombstones.audio_url IS '(legacy) 공개 S3 URL, audio_key로 대체됨';
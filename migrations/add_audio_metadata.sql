@@ -0,0 +1,13 @@
+-- Add audio metadata fields to tombstones and audio_assets tables
+-- Migration: add_audio_metadata
+-- Date: 2026-10-18
+
+-- 렌더 후 한 번 계산한 음성 재생 시간, 크기, 코덱 (클라이언트가 파일을 받지 않고도 표시)
+ALTER TABLE tombstones ADD COLUMN audio_duration_ms INTEGER;
+ALTER TABLE tombstones ADD COLUMN audio_size_bytes INTEGER;
+ALTER TABLE tombstones ADD COLUMN audio_codec VARCHAR(20);
+
+-- 같은 내용을 재사용하는 묘비에 복사하기 위해 에셋에도 저장
+ALTER TABLE audio_assets ADD COLUMN duration_ms INTEGER;
+ALTER TABLE audio_assets ADD COLUMN size_bytes INTEGER;
+ALTER TABLE audio_assets ADD COLUMN codec VARCHAR(20);
@@ -0,0 +1,18 @@
+-- Add audio metadata fields to tombstones and audio_assets tables (PostgreSQL)
+-- Migration: add_audio_metadata_postgresql
+-- Date: 2026-10-18
+
+-- 렌더 후 한 번 계산한 음성 재생 시간, 크기, 코덱 (클라이언트가 파일을 받지 않고도 표시)
+ALTER TABLE tombstones ADD COLUMN IF NOT EXISTS audio_duration_ms INTEGER;
+ALTER TABLE tombstones ADD COLUMN IF NOT EXISTS audio_size_bytes BIGINT;
+ALTER TABLE tombstones ADD COLUMN IF NOT EXISTS audio_codec VARCHAR(20);
+
+-- 같은 내용을 재사용하는 묘비에 복사하기 위해 에셋에도 저장
+ALTER TABLE audio_assets ADD COLUMN IF NOT EXISTS duration_ms INTEGER;
+ALTER TABLE audio_assets ADD COLUMN IF NOT EXISTS size_bytes BIGINT;
+ALTER TABLE audio_assets ADD COLUMN IF NOT EXISTS codec VARCHAR(20);
+
+-- Add comment for documentation
+COMMENT ON COLUMN tombstones.audio_duration_ms IS '음성 재생 시간 (ms)';
+COMMENT ON COLUMN tombstones.audio_size_bytes IS '음성 파일 크기 (bytes)';
+COMMENT ON COLUMN tombstones.audio_codec IS '음성 코덱 (예: mp3)';
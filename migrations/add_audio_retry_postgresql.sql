@@ -0,0 +1,22 @@
+-- Add TTS failure/backoff fields to tombstones table (PostgreSQL)
+-- Migration: add_audio_retry_postgresql
+-- Date: 2026-10-18
+
+-- Add retry columns (연속 실패 횟수, 다음 재시도 시각, 마지막 실패 사유)
+ALTER TABLE tombstones ADD COLUMN IF NOT EXISTS audio_attempts INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE tombstones ADD COLUMN IF NOT EXISTS audio_next_retry_at TIMESTAMP;
+ALTER TABLE tombstones ADD COLUMN IF NOT EXISTS audio_last_error VARCHAR(500);
+
+-- 이미 실패한 묘비는 곧바로 재시도 대상이 되도록 설정
+-- (마이그레이션은 시작할 때마다 다시 실행되므로 재시도 정보가 없는 예전 행만 대상,
+--  재시도 한도를 다 써서 audio_next_retry_at이 NULL이 된 묘비는 audio_attempts > 0)
+UPDATE tombstones SET audio_attempts = 1, audio_next_retry_at = CURRENT_TIMESTAMP
+WHERE audio_status = 'failed' AND audio_next_retry_at IS NULL AND audio_attempts = 0;
+
+-- Create index for the retry sweeper
+CREATE INDEX IF NOT EXISTS ix_tombstones_audio_next_retry_at ON tombstones(audio_next_retry_at);
+
+-- Add comments for documentation
+COMMENT ON COLUMN tombstones.audio_attempts IS '연속 TTS 생성 실패 횟수';
+COMMENT ON COLUMN tombstones.audio_next_retry_at IS '다음 TTS 재시도 가능 시각 (NULL이면 재시도 안 함)';
+COMMENT ON COLUMN tombstones.audio_last_error IS '마지막 TTS 생성 실패 사유';
@@ -0,0 +1,9 @@
+-- Add audio_status field to tombstones table
+-- Migration: add_audio_status
+-- Date: 2026-10-18
+
+-- Add audio_status column (TTS 생성 상태: pending/ready/failed)
+ALTER TABLE tombstones ADD COLUMN audio_status VARCHAR(20);
+
+-- 이미 음성이 있는 묘비는 ready로 설정
+UPDATE tombstones SET audio_status = 'ready' WHERE audio_url IS NOT NULL AND audio_status IS NULL;
@@ -0,0 +1,12 @@
+-- Add audio_status field to tombstones table (PostgreSQL)
+-- Migration: add_audio_status_postgresql
+-- Date: 2026-10-18
+
+-- Add audio_status column (TTS 생성 상태: pending/ready/failed)
+ALTER TABLE tombstones ADD COLUMN IF NOT EXISTS audio_status VARCHAR(20);
+
+-- 이미 음성이 있는 묘비는 ready로 설정
+UPDATE tombstones SET audio_status = 'ready' WHERE audio_url IS NOT NULL AND audio_status IS NULL;
+
+-- Add comment for documentation
+COMMENT ON COLUMN tombstones.audio_status IS 'TTS 생성 상태 (pending/ready/failed)';
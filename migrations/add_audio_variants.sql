@@ -0,0 +1,6 @@
+-- Add audio_variants field to tombstones table
+-- Migration: add_audio_variants
+-- Date: 2026-10-18
+
+-- Add audio_variants column (저비트레이트 등 변환된 음성의 object key, JSON: {"low": "audio/<hash>.low.opus"})
+ALTER TABLE tombstones ADD COLUMN audio_variants TEXT;
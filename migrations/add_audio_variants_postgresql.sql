@@ -0,0 +1,9 @@
+-- Add audio_variants field to tombstones table (PostgreSQL)
+-- Migration: add_audio_variants_postgresql
+-- Date: 2026-10-18
+
+-- Add audio_variants column (저비트레이트 등 변환된 음성의 object key)
+ALTER TABLE tombstones ADD COLUMN IF NOT EXISTS audio_variants TEXT;
+
+-- Add comment for documentation
+COMMENT ON COLUMN tombstones.audio_variants IS '변환된 음성 object key (JSON: variant 이름 → key)';
@@ -5,4 +5,4 @@
 ALTER TABLE tombstones ADD COLUMN share_token VARCHAR(100);
 
 -- Create unique index on share_token
-CREATE UNIQUE INDEX idx_tombstones_share_token ON tombstones(share_token);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_tombstones_share_token ON tombstones(share_token);
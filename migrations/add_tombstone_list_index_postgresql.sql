@@ -0,0 +1,6 @@
+-- Add keyset pagination index to tombstones table (PostgreSQL)
+-- Migration: add_tombstone_list_index_postgresql
+-- Date: 2026-10-18
+
+-- 묘비 목록을 (unlock_date, id) 순서로 페이지 단위 조회 (사용자별 keyset pagination)
+CREATE INDEX IF NOT EXISTS ix_tombstones_user_unlock_date_id ON tombstones(user_id, unlock_date, id);
@@ -0,0 +1,22 @@
+-- Add lease fields and single-flight index to tts_jobs table (PostgreSQL)
+-- Migration: add_tts_job_lease_postgresql
+-- Date: 2026-10-18
+
+-- Add lease columns (작업을 선점한 워커와 만료 시각)
+ALTER TABLE tts_jobs ADD COLUMN IF NOT EXISTS lease_owner VARCHAR(64);
+ALTER TABLE tts_jobs ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMP;
+
+-- 묘비당 활성 작업이 여러 개면 가장 먼저 만든 작업만 남김
+UPDATE tts_jobs SET status = 'failed', error = 'Duplicate job'
+WHERE status IN ('pending', 'processing')
+  AND id NOT IN (
+    SELECT MIN(id) FROM tts_jobs WHERE status IN ('pending', 'processing') GROUP BY tombstone_id
+  );
+
+-- 묘비당 대기/처리 중인 작업은 하나만 허용
+CREATE UNIQUE INDEX IF NOT EXISTS uq_tts_jobs_active_tombstone ON tts_jobs(tombstone_id)
+WHERE status IN ('pending', 'processing');
+
+-- Add comment for documentation
+COMMENT ON COLUMN tts_jobs.lease_owner IS '작업을 선점한 워커의 lease 토큰';
+COMMENT ON COLUMN tts_jobs.lease_expires_at IS 'lease 만료 시각 (만료 시 다른 워커가 재처리)';
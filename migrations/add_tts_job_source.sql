@@ -0,0 +1,6 @@
+-- Add source field to tts_jobs table
+-- Migration: add_tts_job_source
+-- Date: 2026-10-18
+
+-- Add source column (작업 등록 경로: view/prerender)
+ALTER TABLE tts_jobs ADD COLUMN source VARCHAR(20) NOT NULL DEFAULT 'view';
@@ -0,0 +1,9 @@
+-- Add source field to tts_jobs table (PostgreSQL)
+-- Migration: add_tts_job_source_postgresql
+-- Date: 2026-10-18
+
+-- Add source column (작업 등록 경로: view/prerender)
+ALTER TABLE tts_jobs ADD COLUMN IF NOT EXISTS source VARCHAR(20) NOT NULL DEFAULT 'view';
+
+-- Add comment for documentation
+COMMENT ON COLUMN tts_jobs.source IS '작업 등록 경로 (view: 조회 시, prerender: 잠금 해제 전 미리 생성)';
@@ -0,0 +1,6 @@
+-- Add partial index for the chunked unlock sweep
+-- Migration: add_unlock_sweep_index
+-- Date: 2026-10-18
+
+-- 아직 잠긴 묘비만 담는 부분 인덱스 (잠금 해제 스윕이 unlock_date, id 순서로 읽음)
+CREATE INDEX IF NOT EXISTS ix_tombstones_locked_unlock_date ON tombstones(unlock_date, id) WHERE is_unlocked = 0;
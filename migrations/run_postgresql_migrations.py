@@ -102,6 +102,15 @@ def main():
         "add_share_token_postgresql.sql",  # 공유 링크 토큰 (기존)
         "add_enroll_share_fields_postgresql.sql",  # 친구 초대 필드
         "add_invite_token_postgresql.sql",  # 초대 링크 토큰
+        "add_audio_status_postgresql.sql",  # TTS 생성 상태
+        "add_tts_job_source_postgresql.sql",  # TTS 작업 등록 경로
+        "add_tts_job_lease_postgresql.sql",  # TTS 작업 lease, 중복 방지 인덱스
+        "add_audio_retry_postgresql.sql",  # TTS 실패 횟수, 재시도 시각
+        "add_audio_key_postgresql.sql",  # 음성 object key (presigned URL)
+        "add_audio_variants_postgresql.sql",  # 변환된 음성(저비트레이트) key
+        "add_audio_metadata_postgresql.sql",  # 음성 재생 시간/크기/코덱
+        "add_tombstone_list_index_postgresql.sql",  # 묘비 목록 keyset pagination 인덱스
+        "add_unlock_sweep_index_postgresql.sql",  # 잠금 해제 스윕 부분 인덱스
     ]
     
     # 데이터베이스 연결
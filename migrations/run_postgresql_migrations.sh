@@ -27,6 +27,15 @@ MIGRATIONS=(
     "add_share_token_postgresql.sql"
     "add_enroll_share_fields_postgresql.sql"
     "add_invite_token_postgresql.sql"
+    "add_audio_status_postgresql.sql"
+    "add_tts_job_source_postgresql.sql"
+    "add_tts_job_lease_postgresql.sql"
+    "add_audio_retry_postgresql.sql"
+    "add_audio_key_postgresql.sql"
+    "add_audio_variants_postgresql.sql"
+    "add_audio_metadata_postgresql.sql"
+    "add_tombstone_list_index_postgresql.sql"
+    "add_unlock_sweep_index_postgresql.sql"
 )
 
 # 각 마이그레이션 실행
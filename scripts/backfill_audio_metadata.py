@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+음성 메타데이터 backfill
+
+재생 시간/크기/코덱 컬럼이 생기기 전에 렌더된 음성 파일을 한 번씩 내려받아
+MP3 프레임 헤더를 읽고 묘비와 오디오 에셋에 기록합니다.
+같은 음성을 쓰는 묘비는 key 단위로 한 번만 처리합니다.
+
+사용법:
+    python scripts/backfill_audio_metadata.py
+    python scripts/backfill_audio_metadata.py --batch-size 100 --dry-run
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.database import SessionLocal
+from app.repositories.audio_asset_repository import AudioAssetRepository
+from app.repositories.tombstone_repository import TombstoneRepository
+from app.services.storage import get_storage
+from app.utils.mp3_info import MP3Inspector
+
+
+def inspect_stored_audio(storage, key: str):
+    """저장소의 음성 파일을 임시 파일로 내려받아 메타데이터를 계산합니다"""
+    fd, path = tempfile.mkstemp(suffix=".mp3")
+    os.close(fd)
+    try:
+        if not storage.download_audio(key, path):
+            return None
+        inspector = MP3Inspector()
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(256 * 1024), b""):
+                inspector.feed(chunk)
+        return inspector.result()
+    finally:
+        os.unlink(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Record duration/size/codec for audio rendered before metadata existed"
+    )
+    parser.add_argument("--batch-size", type=int, default=100, help="한 번에 조회할 key 수")
+    parser.add_argument("--dry-run", action="store_true", help="DB에 기록하지 않고 결과만 출력")
+    args = parser.parse_args()
+
+    storage = get_storage()
+    db = SessionLocal()
+    updated = skipped = 0
+    last_key = ""
+    try:
+        tombstones = TombstoneRepository(db)
+        assets = AudioAssetRepository(db)
+        while True:
+            keys = tombstones.get_audio_keys_without_info(last_key, args.batch_size)
+            if not keys:
+                break
+            for key in keys:
+                audio_info = inspect_stored_audio(storage, key)
+                if not audio_info:
+                    print(f"⚠️ {key}: not found or not an MP3, skipped")
+                    skipped += 1
+                    continue
+                print(f"  {key}: {audio_info.duration_ms}ms, {audio_info.size_bytes} bytes")
+                if not args.dry_run:
+                    tombstones.update_audio_info(key, audio_info)
+                    assets.update_audio_info(key, audio_info)
+                updated += 1
+            last_key = keys[-1]
+    finally:
+        db.close()
+
+    suffix = " (dry run)" if args.dry_run else ""
+    print(f"✅ Updated {updated} audio keys, skipped {skipped}{suffix}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+tombstones.share JSON → tombstone_collaborators backfill
+
+share JSON이 남은 묘비를 id 순서로 batch 단위로 옮기고 share를 비웁니다.
+batch마다 커밋하므로 서비스 중에 실행해도 되고, 중단되면 다시 실행하면 이어서 처리합니다
+(옮겨진 묘비는 share가 비어 있어 다시 조회되지 않음).
+옮겨지기 전의 묘비는 API가 share JSON을 함께 읽으므로 응답이 바뀌지 않습니다.
+
+사용법:
+    python scripts/backfill_collaborators.py
+    python scripts/backfill_collaborators.py --batch-size 500 --sleep 0.1
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.database import SessionLocal, init_db
+from app.repositories.tombstone_collaborator_repository import TombstoneCollaboratorRepository
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Move tombstones.share JSON into tombstone_collaborators"
+    )
+    parser.add_argument("--batch-size", type=int, default=500, help="한 트랜잭션에서 옮길 묘비 수")
+    parser.add_argument(
+        "--sleep", type=float, default=0.1, help="batch 사이 대기 시간 (초, DB 부하 조절)"
+    )
+    args = parser.parse_args()
+
+    init_db()  # tombstone_collaborators 테이블이 없으면 생성
+    db = SessionLocal()
+    total = 0
+    last_id = 0
+    try:
+        repository = TombstoneCollaboratorRepository(db)
+        while True:
+            count, last_id = repository.backfill_batch(last_id, args.batch_size)
+            if not count:
+                break
+            total += count
+            print(f"  migrated {total} tombstones (last id {last_id})")
+            time.sleep(args.sleep)
+    finally:
+        db.close()
+
+    print(f"✅ Backfilled collaborators for {total} tombstones")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+TTS 파이프라인 처리량 벤치마크
+
+로컬 Supertone/S3 대용 서버(fake_supertone.py, fake_s3.py)를 별도 프로세스로 띄우고,
+잠금 해제된 묘비 N개에 대해 동시에 첫 조회(get_tombstone)를 보낸 뒤
+음성이 준비될 때까지 기다리며 다음을 측정합니다.
+
+- renders/sec: 완료된 렌더 수 / 전체 소요 시간
+- 조회 응답 시간 p50/p99 (get_tombstone)
+- 렌더 시간 p50/p99 (첫 조회 → audio_status ready)
+- 이 프로세스(API + TTS 워커)의 최대 RSS
+
+사용법:
+    python scripts/bench_tts_pipeline.py --renders 200 --concurrency 50 --latency-ms 800
+    python scripts/bench_tts_pipeline.py --renders 100 --error-rate 0.1 --throttle-rate 0.05
+"""
+import argparse
+import os
+import resource
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(SCRIPTS_DIR))
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port: int, timeout: float = 10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.2):
+                return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f"Server on port {port} did not start")
+
+
+def start_stand_in(script: str, port: int, *options: str) -> subprocess.Popen:
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(SCRIPTS_DIR, script), "--port", str(port), *options],
+        stdout=subprocess.DEVNULL
+    )
+    wait_for_port(port)
+    return process
+
+
+def percentile(values, fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="TTS pipeline throughput benchmark")
+    parser.add_argument("--renders", type=int, default=100, help="첫 조회할 묘비 수")
+    parser.add_argument("--concurrency", type=int, default=20, help="동시 조회 클라이언트 수")
+    parser.add_argument("--workers", type=int, default=4, help="TTS_WORKER_COUNT")
+    parser.add_argument(
+        "--rate-limit", type=float, default=0, help="TTS_RATE_LIMIT_PER_SECOND (0이면 제한 없음)"
+    )
+    parser.add_argument("--latency-ms", type=float, default=300, help="가짜 Supertone 지연 (ms)")
+    parser.add_argument("--jitter-ms", type=float, default=100)
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--throttle-rate", type=float, default=0)
+    parser.add_argument("--payload-kb", type=float, default=64)
+    parser.add_argument("--content-chars", type=int, default=200, help="묘비 본문 길이")
+    parser.add_argument("--timeout", type=float, default=300, help="렌더 완료 대기 최대 시간 (초)")
+    parser.add_argument(
+        "--poll-ms", type=float, default=50, help="클라이언트의 상태 확인 주기 (ms)"
+    )
+    parser.add_argument("--database-url", default=None, help="기본: 임시 SQLite 파일")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    workdir = tempfile.mkdtemp(prefix="tts-bench-")
+    supertone_port, s3_port = free_port(), free_port()
+
+    processes = [
+        start_stand_in(
+            "fake_supertone.py", supertone_port,
+            "--latency-ms", str(args.latency_ms), "--jitter-ms", str(args.jitter_ms),
+            "--error-rate", str(args.error_rate), "--throttle-rate", str(args.throttle_rate),
+            "--payload-kb", str(args.payload_kb)
+        ),
+        start_stand_in("fake_s3.py", s3_port, "--data-dir", os.path.join(workdir, "s3")),
+    ]
+
+    # 앱 설정은 import 시점에 읽으므로 import 전에 환경 변수를 지정
+    os.environ.update({
+        "DATABASE_URL": args.database_url or f"sqlite:///{os.path.join(workdir, 'bench.db')}",
+        "SUPERTONE_API_URL": f"http://127.0.0.1:{supertone_port}/v1/text-to-speech/fake-voice",
+        "SUPERTONE_API_KEY": "bench",
+        "S3_ENDPOINT_URL": f"http://127.0.0.1:{s3_port}",
+        "AWS_ACCESS_KEY_ID": "bench",
+        "AWS_SECRET_ACCESS_KEY": "bench",
+        "TTS_WORKER_COUNT": str(args.workers),
+        "TTS_WORKER_POLL_INTERVAL": "0.05",
+        "TTS_RATE_LIMIT_PER_SECOND": str(args.rate_limit),
+        "TTS_RETRY_BASE_SECONDS": "1",
+        "TTS_PRERENDER_DAYS": "0",
+    })
+
+    from app.models.audio_asset import AudioAsset  # noqa: F401  (테이블 등록)
+    from app.models.database import SessionLocal, init_db
+    from app.models.tombstone import AUDIO_STATUS_FAILED, AUDIO_STATUS_READY
+    from app.repositories.tombstone_repository import TombstoneRepository
+    from app.services.tombstone_service import TombstoneService
+    from app.services.tts_rate_limiter import tts_rate_limiter
+    from app.services.tts_worker import start_tts_workers, stop_tts_workers
+
+    init_db()
+    db = SessionLocal()
+    repository = TombstoneRepository(db)
+    tombstone_ids = []
+    for index in range(args.renders):
+        # 내용이 같으면 한 번만 렌더되므로 묘비마다 다른 본문 사용
+        content = f"{index}번째 타임캡슐입니다. " + "미래의 나에게. " * (args.content_chars // 8)
+        tombstone = repository.create(
+            user_id=1,
+            title=f"bench {index}",
+            content=content[:args.content_chars],
+            unlock_date=date.today() - timedelta(days=1)
+        )
+        repository.update_unlock_status_by_id(tombstone.id, True)
+        tombstone_ids.append(tombstone.id)
+    db.close()
+
+    def first_view(tombstone_id: int):
+        session = SessionLocal()
+        try:
+            started = time.perf_counter()
+            TombstoneService(session).get_tombstone(tombstone_id)
+            view_latency = time.perf_counter() - started
+
+            deadline = started + args.timeout
+            while time.perf_counter() < deadline:
+                session.expire_all()
+                status = TombstoneRepository(session).get_by_id(tombstone_id).audio_status
+                if status in (AUDIO_STATUS_READY, AUDIO_STATUS_FAILED):
+                    return view_latency, time.perf_counter() - started, status
+                time.sleep(args.poll_ms / 1000)
+            return view_latency, None, "timeout"
+        finally:
+            session.close()
+
+    print(
+        f"🚀 {args.renders} first views, {args.concurrency} concurrent clients, "
+        f"{args.workers} TTS workers"
+    )
+    start_tts_workers()
+    started = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            results = list(executor.map(first_view, tombstone_ids))
+    finally:
+        elapsed = time.perf_counter() - started
+        stop_tts_workers()
+        for process in processes:
+            process.terminate()
+            process.wait()
+
+    view_latencies = [view for view, _, _ in results]
+    render_latencies = [render for _, render, status in results if status == AUDIO_STATUS_READY]
+    statuses = [status for _, _, status in results]
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # Linux: KB
+
+    print("=" * 60)
+    print("TTS pipeline benchmark")
+    print("=" * 60)
+    print(f"  ready / failed / timeout : {statuses.count(AUDIO_STATUS_READY)} / "
+          f"{statuses.count(AUDIO_STATUS_FAILED)} / {statuses.count('timeout')}")
+    print(f"  elapsed                  : {elapsed:.2f}s")
+    print(f"  renders/sec              : {len(render_latencies) / elapsed:.2f}")
+    print(f"  view latency p50 / p99   : {percentile(view_latencies, 0.5) * 1000:.1f}ms / "
+          f"{percentile(view_latencies, 0.99) * 1000:.1f}ms")
+    print(f"  render latency p50 / p99 : {percentile(render_latencies, 0.5) * 1000:.1f}ms / "
+          f"{percentile(render_latencies, 0.99) * 1000:.1f}ms")
+    print(f"  peak RSS                 : {peak_rss_mb:.1f}MB")
+    print(f"  rate limiter             : {tts_rate_limiter.stats()}")
+
+
+if __name__ == "__main__":
+    main()
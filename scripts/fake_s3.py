@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+로컬 S3 대용 서버 (개발/벤치마크용)
+
+boto3가 사용하는 S3 API 중 이 프로젝트에서 쓰는 것만 구현합니다.
+path-style 주소(`http://host:port/{bucket}/{key}`)만 지원하고 서명은 검사하지 않습니다.
+
+- PutObject / GetObject (Range 지원) / HeadObject / DeleteObject
+- CreateMultipartUpload / UploadPart / CompleteMultipartUpload / AbortMultipartUpload
+- DeleteObjects, ListObjectsV2
+
+사용법:
+    python scripts/fake_s3.py --port 9000 --data-dir /tmp/fake-s3
+
+앱에서 사용:
+    S3_ENDPOINT_URL=http://127.0.0.1:9000 AWS_ACCESS_KEY_ID=test AWS_SECRET_ACCESS_KEY=test
+"""
+import argparse
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import uuid
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlsplit
+from xml.sax.saxutils import escape
+
+S3_XMLNS = "http://s3.amazonaws.com/doc/2006-03-01/"
+
+
+class FakeS3Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "FakeS3Server"
+
+    # ---- 요청 파싱 ----
+
+    def _parse(self):
+        parts = urlsplit(self.path)
+        params = parse_qs(parts.query, keep_blank_values=True)
+        query = {key: values[0] for key, values in params.items()}
+        path = unquote(parts.path).lstrip("/")
+        bucket, _, key = path.partition("/")
+        return bucket, key, query
+
+    def _read_body(self) -> bytes:
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            body = self._read_http_chunked()
+        else:
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if "aws-chunked" in self.headers.get("Content-Encoding", "") or \
+                self.headers.get("x-amz-content-sha256", "").startswith("STREAMING-"):
+            body = _decode_aws_chunked(body)
+        return body
+
+    def _read_http_chunked(self) -> bytes:
+        body = bytearray()
+        while True:
+            size = int(self.rfile.readline().split(b";")[0].strip(), 16)
+            if size == 0:
+                # trailer 헤더까지 읽어서 버림
+                while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+                    pass
+                return bytes(body)
+            body.extend(self.rfile.read(size))
+            self.rfile.readline()
+
+    # ---- 응답 ----
+
+    def _send(self, status: int, body: bytes = b"", headers: dict = None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body and self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _send_xml(self, status: int, xml: str):
+        self._send(status, xml.encode("utf-8"), {"Content-Type": "application/xml"})
+
+    def _send_error(self, status: int, code: str, message: str):
+        self._send_xml(
+            status, f"<Error><Code>{code}</Code><Message>{escape(message)}</Message></Error>"
+        )
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    # ---- 메서드 ----
+
+    def do_PUT(self):
+        bucket, key, query = self._parse()
+        body = self._read_body()
+        if not key:
+            self.server.bucket_dir(bucket).mkdir(parents=True, exist_ok=True)
+            return self._send(200)
+        if "uploadId" in query:
+            upload = self.server.uploads.get(query["uploadId"])
+            if upload is None:
+                return self._send_error(404, "NoSuchUpload", query["uploadId"])
+            upload["parts"][int(query["partNumber"])] = body
+            return self._send(200, headers={"ETag": _etag(body)})
+        self.server.write_object(bucket, key, body, self.headers.get("Content-Type"))
+        self._send(200, headers={"ETag": _etag(body)})
+
+    def do_POST(self):
+        bucket, key, query = self._parse()
+        body = self._read_body()
+        if "delete" in query:
+            keys = [
+                element.text for element in ET.fromstring(body).iter()
+                if element.tag.endswith("Key")
+            ]
+            for object_key in keys:
+                self.server.delete_object(bucket, object_key)
+            deleted = "".join(f"<Deleted><Key>{escape(k)}</Key></Deleted>" for k in keys)
+            return self._send_xml(200, f'<DeleteResult xmlns="{S3_XMLNS}">{deleted}</DeleteResult>')
+        if "uploads" in query:
+            upload_id = uuid.uuid4().hex
+            self.server.uploads[upload_id] = {
+                "bucket": bucket, "key": key, "parts": {},
+                "content_type": self.headers.get("Content-Type")
+            }
+            return self._send_xml(200, (
+                f'<InitiateMultipartUploadResult xmlns="{S3_XMLNS}">'
+                f"<Bucket>{escape(bucket)}</Bucket><Key>{escape(key)}</Key><UploadId>{upload_id}</UploadId>"
+                "</InitiateMultipartUploadResult>"
+            ))
+        if "uploadId" in query:
+            upload = self.server.uploads.pop(query["uploadId"], None)
+            if upload is None:
+                return self._send_error(404, "NoSuchUpload", query["uploadId"])
+            numbers = [
+                int(n.text) for n in ET.fromstring(body).iter() if n.tag.endswith("PartNumber")
+            ]
+            data = b"".join(upload["parts"][number] for number in numbers)
+            self.server.write_object(bucket, key, data, upload["content_type"])
+            return self._send_xml(200, (
+                f'<CompleteMultipartUploadResult xmlns="{S3_XMLNS}">'
+                f"<Bucket>{escape(bucket)}</Bucket><Key>{escape(key)}</Key><ETag>{_etag(data)}</ETag>"
+                "</CompleteMultipartUploadResult>"
+            ))
+        self._send_error(400, "InvalidRequest", "Unsupported POST")
+
+    def do_DELETE(self):
+        bucket, key, query = self._parse()
+        if "uploadId" in query:
+            self.server.uploads.pop(query["uploadId"], None)
+        else:
+            self.server.delete_object(bucket, key)
+        self._send(204)
+
+    def do_HEAD(self):
+        self.do_GET()
+
+    def do_GET(self):
+        bucket, key, query = self._parse()
+        if not key:
+            return self._list_objects(bucket, query)
+
+        path = self.server.object_path(bucket, key)
+        if not path.is_file():
+            return self._send_error(404, "NoSuchKey", key)
+        data = path.read_bytes()
+        headers = {
+            "Content-Type": self.server.content_types.get((bucket, key), "binary/octet-stream"),
+            "ETag": _etag(data),
+            "Last-Modified": formatdate(path.stat().st_mtime, usegmt=True),
+            "Accept-Ranges": "bytes"
+        }
+        match = re.fullmatch(r"bytes=(\d*)-(\d*)", self.headers.get("Range", ""))
+        if match and data:
+            start, end = match.groups()
+            if start:
+                first, last = int(start), min(int(end) if end else len(data) - 1, len(data) - 1)
+            else:
+                first, last = max(0, len(data) - int(end)), len(data) - 1
+            headers["Content-Range"] = f"bytes {first}-{last}/{len(data)}"
+            return self._send(206, data[first:last + 1], headers)
+        self._send(200, data, headers)
+
+    def _list_objects(self, bucket: str, query: dict):
+        prefix = query.get("prefix", "")
+        max_keys = int(query.get("max-keys", 1000))
+        start_after = query.get("continuation-token") or query.get("start-after", "")
+
+        keys = sorted(
+            k for k in self.server.list_keys(bucket) if k.startswith(prefix) and k > start_after
+        )
+        page, truncated = keys[:max_keys], len(keys) > max_keys
+
+        contents = []
+        for key in page:
+            stat = self.server.object_path(bucket, key).stat()
+            modified = datetime.fromtimestamp(stat.st_mtime, timezone.utc).strftime(
+                "%Y-%m-%dT%H:%M:%S.000Z"
+            )
+            contents.append(
+                f"<Contents><Key>{escape(key)}</Key><LastModified>{modified}</LastModified>"
+                f"<Size>{stat.st_size}</Size><StorageClass>STANDARD</StorageClass></Contents>"
+            )
+        next_token = (
+            f"<NextContinuationToken>{escape(page[-1])}</NextContinuationToken>"
+            if truncated else ""
+        )
+        self._send_xml(200, (
+            f'<ListBucketResult xmlns="{S3_XMLNS}"><Name>{escape(bucket)}</Name>'
+            f"<Prefix>{escape(prefix)}</Prefix><KeyCount>{len(page)}</KeyCount>"
+            f"<MaxKeys>{max_keys}</MaxKeys>"
+            f"<IsTruncated>{'true' if truncated else 'false'}</IsTruncated>"
+            f"{next_token}{''.join(contents)}"
+            "</ListBucketResult>"
+        ))
+
+
+class FakeS3Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, data_dir: str, verbose: bool = False):
+        super().__init__(address, FakeS3Handler)
+        self.data_dir = Path(data_dir)
+        self.verbose = verbose
+        self.uploads = {}
+        self.content_types = {}
+        self._lock = threading.Lock()
+
+    def bucket_dir(self, bucket: str) -> Path:
+        return self.data_dir / bucket
+
+    def object_path(self, bucket: str, key: str) -> Path:
+        return self.bucket_dir(bucket) / key
+
+    def write_object(self, bucket: str, key: str, data: bytes, content_type: str = None):
+        path = self.object_path(bucket, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+        if content_type:
+            self.content_types[(bucket, key)] = content_type
+
+    def delete_object(self, bucket: str, key: str):
+        with self._lock:
+            self.object_path(bucket, key).unlink(missing_ok=True)
+            self.content_types.pop((bucket, key), None)
+
+    def list_keys(self, bucket: str):
+        root = self.bucket_dir(bucket)
+        if not root.is_dir():
+            return []
+        return [
+            path.relative_to(root).as_posix()
+            for path in root.rglob("*")
+            if path.is_file() and not path.name.startswith(".")
+        ]
+
+
+def _etag(data: bytes) -> str:
+    return f'"{hashlib.md5(data).hexdigest()}"'
+
+
+def _decode_aws_chunked(body: bytes) -> bytes:
+    """aws-chunked 인코딩(`<hex>;chunk-signature=...\\r\\n<data>\\r\\n`)을 풀어냅니다"""
+    data = bytearray()
+    position = 0
+    while position < len(body):
+        line_end = body.index(b"\r\n", position)
+        size = int(body[position:line_end].split(b";")[0], 16)
+        if size == 0:
+            break
+        start = line_end + 2
+        data.extend(body[start:start + size])
+        position = start + size + 2
+    return bytes(data)
+
+
+def make_server(
+    host: str = "127.0.0.1", port: int = 0, data_dir: str = None, verbose: bool = False
+) -> FakeS3Server:
+    """서버를 생성합니다 (serve_forever는 호출하는 쪽에서 실행)"""
+    return FakeS3Server((host, port), data_dir or tempfile.mkdtemp(prefix="fake-s3-"), verbose)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local S3 stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--data-dir", default=None, help="객체 저장 디렉토리 (기본: 임시 디렉토리)")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port, args.data_dir, args.verbose)
+    print(
+        f"🪣 Fake S3 listening on http://{args.host}:{server.server_address[1]} "
+        f"(data: {server.data_dir})",
+        flush=True,
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+로컬 Supertone TTS 대용 서버 (개발/벤치마크용)
+
+`POST /v1/text-to-speech/{voice_id}` 요청에 MP3 형태의 더미 음성을 돌려줍니다.
+지연 시간, 오류율, 429 비율, 응답 크기를 조절할 수 있습니다.
+
+사용법:
+    python scripts/fake_supertone.py --port 8100 --latency-ms 800 --error-rate 0.05 --payload-kb 64
+
+앱에서 사용:
+    SUPERTONE_API_URL=http://127.0.0.1:8100/v1/text-to-speech/fake-voice
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# ID3v2 헤더 + MPEG-1 Layer III 128kbps 44.1kHz 프레임 헤더 (프레임 길이 417 bytes)
+ID3_HEADER = b"ID3\x04\x00\x00\x00\x00\x00\x00"
+MP3_FRAME = b"\xff\xfb\x90\x64" + b"\x00" * 413
+
+
+class FakeSupertoneHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "FakeSupertoneServer"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        try:
+            text = json.loads(body or b"{}").get("text", "")
+        except ValueError:
+            return self._send(400, b'{"error": "invalid json"}')
+
+        server = self.server
+        server.record_request()
+        delay = server.latency + random.uniform(0, server.jitter)
+        if server.per_char_latency:
+            delay += server.per_char_latency * len(text)
+        time.sleep(delay)
+
+        roll = random.random()
+        if roll < server.throttle_rate:
+            return self._send(
+                429, b'{"error": "rate limited"}', {"Retry-After": str(server.retry_after)}
+            )
+        if roll < server.throttle_rate + server.error_rate:
+            return self._send(503, b'{"error": "unavailable"}')
+        self._send(200, server.payload, {"Content-Type": "audio/mpeg"})
+
+    def _send(self, status: int, body: bytes, headers: dict = None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class FakeSupertoneServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address,
+        latency: float = 0.5,
+        jitter: float = 0.0,
+        per_char_latency: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: float = 1.0,
+        payload_bytes: int = 64 * 1024,
+        verbose: bool = False
+    ):
+        super().__init__(address, FakeSupertoneHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.per_char_latency = per_char_latency
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.payload = build_mp3(payload_bytes)
+        self.verbose = verbose
+        self.request_count = 0
+        self._lock = threading.Lock()
+
+    def record_request(self):
+        with self._lock:
+            self.request_count += 1
+
+
+def build_mp3(size: int) -> bytes:
+    """size bytes 안팎의 MP3 형태 데이터 (ID3 태그 + 프레임 반복)"""
+    frames = max(1, (size - len(ID3_HEADER)) // len(MP3_FRAME))
+    return ID3_HEADER + MP3_FRAME * frames
+
+
+def make_server(host: str = "127.0.0.1", port: int = 0, **options) -> FakeSupertoneServer:
+    """서버를 생성합니다 (serve_forever는 호출하는 쪽에서 실행)"""
+    return FakeSupertoneServer((host, port), **options)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Supertone TTS stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--latency-ms", type=float, default=500, help="요청당 기본 지연 (ms)")
+    parser.add_argument(
+        "--jitter-ms", type=float, default=0, help="지연에 더할 최대 무작위 시간 (ms)"
+    )
+    parser.add_argument("--per-char-ms", type=float, default=0, help="글자당 추가 지연 (ms)")
+    parser.add_argument("--error-rate", type=float, default=0, help="503 응답 비율 (0~1)")
+    parser.add_argument("--throttle-rate", type=float, default=0, help="429 응답 비율 (0~1)")
+    parser.add_argument("--retry-after", type=float, default=1, help="429 응답의 Retry-After (초)")
+    parser.add_argument("--payload-kb", type=float, default=64, help="음성 응답 크기 (KB)")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    server = make_server(
+        args.host,
+        args.port,
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        per_char_latency=args.per_char_ms / 1000,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        payload_bytes=int(args.payload_kb * 1024),
+        verbose=args.verbose
+    )
+    print(
+        f"🎙️ Fake Supertone listening on http://{args.host}:{server.server_address[1]}"
+        "/v1/text-to-speech/fake-voice",
+        flush=True,
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+고아 음성 파일 정리
+
+어떤 묘비(audio_key)나 오디오 에셋(storage_key)도 가리키지 않는 저장소 파일을 삭제합니다.
+렌더 경합, 예전 타임스탬프 파일명, 파일 없이 지워진 행 때문에 남은 파일이 대상입니다.
+저장소 목록을 페이지 단위로 읽고 batch 단위로 DB를 확인하므로 메모리 사용량이 일정합니다.
+
+사용법:
+    python scripts/gc_orphaned_audio.py --dry-run
+    python scripts/gc_orphaned_audio.py --grace-hours 24 --batch-size 1000
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.database import SessionLocal
+from app.services.audio_gc_service import AudioGCService
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Delete audio files no tombstone points to")
+    parser.add_argument(
+        "--grace-hours", type=float, default=24, help="이 시간 안에 수정된 파일은 건너뜀"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=1000, help="DB 확인/삭제 요청 단위 (S3는 최대 1000)"
+    )
+    parser.add_argument("--prefix", default="", help="검사할 key prefix")
+    parser.add_argument("--dry-run", action="store_true", help="삭제하지 않고 대상만 집계")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        report = AudioGCService(db).collect(
+            grace_seconds=args.grace_hours * 3600,
+            batch_size=min(args.batch_size, 1000),
+            prefix=args.prefix,
+            dry_run=args.dry_run
+        )
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+    print("=" * 60)
+    print("Orphaned audio GC" + (" (dry run)" if args.dry_run else ""))
+    print("=" * 60)
+    print(f"  scanned          : {report['scanned']}")
+    print(f"  skipped (recent) : {report['skipped_recent']}")
+    print(f"  referenced       : {report['referenced']}")
+    print(f"  orphaned         : {report['orphaned']}")
+    print(f"  deleted / failed : {report['deleted']} / {report['failed']}")
+    reclaimed = report["bytes_reclaimed"]
+    print(f"  bytes reclaimed  : {reclaimed} ({reclaimed / 1024 / 1024:.1f}MB)")
+
+
+if __name__ == "__main__":
+    main()
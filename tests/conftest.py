@@ -0,0 +1,35 @@
+"""Shared fixtures for repository/service tests"""
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.config import env_config
+from app.models import Base
+
+
+@pytest.fixture
+def session_factory():
+    """In-memory SQLite session factory shared across threads"""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(session_factory):
+    db = session_factory()
+    yield db
+    db.close()
+
+
+@pytest.fixture(autouse=True)
+def disable_audio_transcode(monkeypatch):
+    """Keep ffmpeg transcoding out of tests unless a test enables it explicitly"""
+    monkeypatch.setattr(env_config, "audio_transcode_enabled", False)
@@ -0,0 +1,169 @@
+"""Async database stack tests (DATABASE_ASYNC)"""
+import asyncio
+import importlib.util
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Base
+from app.models.async_database import to_async_url
+from app.repositories.tombstone_collaborator_repository import TombstoneCollaboratorRepository
+from app.repositories.tombstone_repository import TombstoneRepository
+from app.services.tombstone_service import TombstoneService
+
+# 비동기 드라이버는 선택 설치 (pip install ".[async]")
+requires_async = pytest.mark.skipif(
+    not all(importlib.util.find_spec(name) for name in ("aiosqlite", "greenlet")),
+    reason="async extra (aiosqlite, greenlet) is not installed"
+)
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("sqlite:///./data/timegrave.db", "sqlite+aiosqlite:///./data/timegrave.db"),
+    ("postgresql://user:pw@db:5432/timegrave", "postgresql+asyncpg://user:pw@db:5432/timegrave"),
+    ("postgresql+psycopg2://user:pw@db/timegrave", "postgresql+asyncpg://user:pw@db/timegrave"),
+])
+def test_to_async_url_switches_driver(url, expected):
+    assert to_async_url(url) == expected
+
+
+def test_to_async_url_rejects_unknown_database():
+    with pytest.raises(ValueError):
+        to_async_url("mysql://user:pw@db/timegrave")
+
+
+@pytest.fixture
+def database_path(tmp_path):
+    """동기/비동기 엔진이 함께 여는 SQLite 파일"""
+    path = tmp_path / "async.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+    return path
+
+
+@pytest.fixture
+def sync_session(database_path):
+    engine = create_engine(f"sqlite:///{database_path}")
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    yield db
+    db.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def async_session_factory(database_path):
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from sqlalchemy.pool import NullPool
+
+    # 테스트마다 이벤트 루프가 달라지므로 커넥션을 재사용하지 않음
+    engine = create_async_engine(f"sqlite+aiosqlite:///{database_path}", poolclass=NullPool)
+    yield async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+    asyncio.run(engine.dispose())
+
+
+def create_graves(db, count, user_id=1):
+    repository = TombstoneRepository(db)
+    return [
+        repository.create(
+            user_id=user_id,
+            title=f"Grave {index}",
+            content="안녕, 미래의 나야.",
+            unlock_date=date.today() + timedelta(days=1 + index % 3)
+        ).id
+        for index in range(count)
+    ]
+
+
+@requires_async
+def test_async_list_matches_sync_list(sync_session, async_session_factory):
+    from app.services.async_tombstone_service import AsyncTombstoneService
+
+    create_graves(sync_session, 5)
+    shared_ids = create_graves(sync_session, 2, user_id=2)
+    TombstoneCollaboratorRepository(sync_session).add(shared_ids[0], 1)
+    sync_service = TombstoneService(sync_session)
+
+    async def list_async(method, cursor=None):
+        async with async_session_factory() as db:
+            service = AsyncTombstoneService(db)
+            return await getattr(service, method)(user_id=1, limit=3, cursor=cursor)
+
+    for method in ("list_tombstones", "list_shared_tombstones"):
+        expected, expected_cursor = getattr(sync_service, method)(user_id=1, limit=3)
+        items, cursor = asyncio.run(list_async(method))
+        assert items == expected
+        assert cursor == expected_cursor
+
+    second, _ = asyncio.run(list_async("list_tombstones", cursor))
+    assert [item.id for item in second] == [
+        item.id for item in sync_service.list_tombstones(user_id=1, limit=3, cursor=cursor)[0]
+    ]
+
+
+@pytest.fixture
+def async_client(async_session_factory):
+    from app.models.async_database import get_async_db
+    from app.routers import async_tombstone, async_user
+
+    async def override_db():
+        async with async_session_factory() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(async_user.router)
+    app.include_router(async_tombstone.router)
+    app.dependency_overrides[get_async_db] = override_db
+    return TestClient(app)
+
+
+@requires_async
+def test_async_routes_sign_in_and_list(async_client, sync_session):
+    created = async_client.post("/api/users", json={
+        "email": "async@example.com", "password": "password123", "username": "비동기"
+    })
+    assert created.status_code == 201
+    user_id = created.json()["data"]["result"]["id"]
+    assert async_client.post("/api/users", json={
+        "email": "async@example.com", "password": "password123", "username": "비동기"
+    }).json()["detail"]["error"]["code"] == "EMAIL_ALREADY_EXISTS"
+
+    signed_in = async_client.post("/api/users/sign-in", json={
+        "email": "async@example.com", "password": "password123"
+    })
+    assert signed_in.status_code == 200
+    headers = {"Authorization": f"Bearer {signed_in.json()['data']['result']['session_token']}"}
+
+    create_graves(sync_session, 3, user_id=user_id)
+    page = async_client.get("/api/graves?limit=2", headers=headers).json()["data"]
+    assert len(page["result"]) == 2
+    assert "next_cursor" in page
+
+    wrong = async_client.post("/api/users/sign-in", json={
+        "email": "async@example.com", "password": "wrong-password"
+    })
+    assert wrong.status_code == 401
+
+
+@requires_async
+def test_async_share_link_checks_owner(async_client, sync_session):
+    from app.utils.async_auth import get_current_user_async
+
+    grave_id = create_graves(sync_session, 1, user_id=2)[0]
+    async_client.app.dependency_overrides[get_current_user_async] = lambda: SimpleNamespace(id=1)
+
+    assert async_client.post(f"/api/graves/{grave_id}/share").status_code == 403
+    assert async_client.post("/api/graves/999/share").status_code == 404
+
+    async_client.app.dependency_overrides[get_current_user_async] = lambda: SimpleNamespace(id=2)
+    response = async_client.post(f"/api/graves/{grave_id}/invite")
+    assert response.status_code == 200
+    sync_session.expire_all()
+    assert TombstoneRepository(sync_session).get_by_id(grave_id).invite_token == (
+        response.json()["data"]["result"]["invite_token"]
+    )
@@ -0,0 +1,94 @@
+"""Orphaned audio garbage collector tests"""
+import os
+import time
+from datetime import date
+
+import pytest
+
+from app.repositories.audio_asset_repository import AudioAssetRepository
+from app.repositories.tombstone_repository import TombstoneRepository
+from app.services.audio_gc_service import AudioGCService
+from app.services.storage import LocalStorageBackend
+
+DAY = 24 * 60 * 60
+
+
+class CountingStorage(LocalStorageBackend):
+    def __init__(self, root_dir):
+        super().__init__(root_dir, "/media")
+        self.delete_batches = []
+
+    def delete_many(self, file_names):
+        self.delete_batches.append(list(file_names))
+        return super().delete_many(file_names)
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return CountingStorage(str(tmp_path))
+
+
+def put(storage, key, size=10, age=2 * DAY):
+    storage.upload_audio(b"x" * size, key)
+    modified = time.time() - age
+    os.utime(storage.root_dir / key, (modified, modified))
+
+
+def test_gc_deletes_only_old_unreferenced_files(db_session, storage):
+    put(storage, "audio/live.mp3")
+    put(storage, "audio/asset.mp3")
+    put(storage, "audio/orphan.mp3", size=100)
+    put(storage, "tombstone_1_20240101.mp3", size=50)
+    put(storage, "audio/fresh.mp3", age=60)
+    TombstoneRepository(db_session).create(
+        user_id=1, title="t", content="c", unlock_date=date.today(), audio_key="audio/live.mp3"
+    )
+    AudioAssetRepository(db_session).claim("hash", "audio/asset.mp3", "ko", "neutral")
+
+    report = AudioGCService(db_session, storage=storage).collect(grace_seconds=DAY, batch_size=2)
+
+    assert report["scanned"] == 5
+    assert report["skipped_recent"] == 1
+    assert report["referenced"] == 2
+    assert report["deleted"] == 2
+    assert report["bytes_reclaimed"] == 150
+    # batch 단위로 삭제 요청
+    assert all(len(batch) <= 2 for batch in storage.delete_batches)
+    remaining = sorted(obj.key for obj in storage.list_objects())
+    assert remaining == ["audio/asset.mp3", "audio/fresh.mp3", "audio/live.mp3"]
+
+
+def test_gc_dry_run_keeps_files(db_session, storage):
+    put(storage, "audio/orphan.mp3")
+
+    report = AudioGCService(db_session, storage=storage).collect(grace_seconds=DAY, dry_run=True)
+
+    assert report["orphaned"] == 1
+    assert report["deleted"] == 0
+    assert storage.delete_batches == []
+
+
+def test_gc_refuses_to_run_with_unconverted_urls(db_session, storage):
+    tombstone = TombstoneRepository(db_session).create(
+        user_id=1, title="t", content="c", unlock_date=date.today()
+    )
+    tombstone.audio_url = "https://bucket.s3.ap-northeast-2.amazonaws.com/old.mp3"
+    db_session.commit()
+
+    with pytest.raises(ValueError):
+        AudioGCService(db_session, storage=storage).collect(grace_seconds=DAY)
+
+
+def test_gc_refuses_to_run_with_urls_copied_into_audio_key(db_session, storage):
+    # 이전 버전의 add_audio_key가 path-style URL을 그대로 audio_key에 복사한 행
+    url = "http://127.0.0.1:9000/timegrave-audio/audio/live.mp3"
+    tombstone = TombstoneRepository(db_session).create(
+        user_id=1, title="t", content="c", unlock_date=date.today(), audio_key=url
+    )
+    tombstone.audio_url = url
+    db_session.commit()
+    put(storage, "audio/live.mp3")
+
+    with pytest.raises(ValueError):
+        AudioGCService(db_session, storage=storage).collect(grace_seconds=DAY)
+    assert (storage.root_dir / "audio/live.mp3").exists()
@@ -0,0 +1,197 @@
+"""Audio proxy endpoint / disk cache tests"""
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.database import get_db
+from app.repositories.tombstone_repository import TombstoneRepository
+from app.routers import tombstone as tombstone_router
+from app.services.audio_cache import AudioDiskCache
+from app.services.storage import LocalStorageBackend
+from app.utils.auth import get_current_user
+
+AUDIO = b"ID3" + bytes(range(256)) * 4
+
+
+class CountingStorage(LocalStorageBackend):
+    downloads = 0
+
+    def download_audio(self, file_name, dest_path):
+        CountingStorage.downloads += 1
+        return super().download_audio(file_name, dest_path)
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    monkeypatch.setattr(CountingStorage, "downloads", 0)
+    backend = CountingStorage(str(tmp_path / "storage"), "/media")
+    backend.upload_audio(AUDIO, "audio/abc.mp3")
+    return backend
+
+
+@pytest.fixture
+def client(session_factory, storage, tmp_path, monkeypatch):
+    cache = AudioDiskCache(
+        str(tmp_path / "cache"), max_bytes=10 * 1024 * 1024, storage_factory=lambda: storage
+    )
+    monkeypatch.setattr(tombstone_router, "audio_disk_cache", cache)
+
+    def override_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_db
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=1)
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def grave_id(db_session):
+    repository = TombstoneRepository(db_session)
+    tombstone = repository.create(
+        user_id=1,
+        title="Test Memory",
+        content="안녕, 미래의 나야.",
+        unlock_date=date.today() - timedelta(days=1),
+        audio_key="audio/abc.mp3"
+    )
+    repository.update_unlock_status_by_id(tombstone.id, True)
+    return tombstone.id
+
+
+def test_audio_proxy_serves_full_file_with_cache_headers(client, grave_id):
+    response = client.get(f"/api/graves/{grave_id}/audio")
+
+    assert response.status_code == 200
+    assert response.content == AUDIO
+    assert response.headers["content-type"] == "audio/mpeg"
+    assert response.headers["accept-ranges"] == "bytes"
+    assert "immutable" in response.headers["cache-control"]
+    assert response.headers["etag"]
+    assert response.headers["last-modified"]
+
+
+def test_audio_proxy_answers_range_from_disk_cache(client, grave_id):
+    client.get(f"/api/graves/{grave_id}/audio")
+
+    response = client.get(f"/api/graves/{grave_id}/audio", headers={"Range": "bytes=3-12"})
+
+    assert response.status_code == 206
+    assert response.content == AUDIO[3:13]
+    assert response.headers["content-range"] == f"bytes 3-12/{len(AUDIO)}"
+    assert CountingStorage.downloads == 1
+
+
+def test_audio_proxy_returns_304_for_matching_etag(client, grave_id):
+    etag = client.get(f"/api/graves/{grave_id}/audio").headers["etag"]
+
+    response = client.get(f"/api/graves/{grave_id}/audio", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+
+
+def test_audio_proxy_rejects_locked_and_foreign_graves(client, db_session):
+    repository = TombstoneRepository(db_session)
+    locked = repository.create(
+        user_id=1, title="t", content="c", unlock_date=date.today() + timedelta(days=3)
+    )
+    foreign = repository.create(
+        user_id=2, title="t", content="c", unlock_date=date.today(), audio_key="audio/abc.mp3"
+    )
+
+    assert client.get(f"/api/graves/{locked.id}/audio").status_code == 403
+    assert client.get(f"/api/graves/{foreign.id}/audio").status_code == 403
+    assert client.get("/api/graves/9999/audio").status_code == 404
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path, storage):
+    for name in ("a", "b", "c"):
+        storage.upload_audio(b"x" * 100, f"audio/{name}.mp3")
+    cache = AudioDiskCache(str(tmp_path / "cache"), max_bytes=250, storage_factory=lambda: storage)
+
+    cache.get("audio/a.mp3")
+    cache.get("audio/b.mp3")
+    cache.get("audio/a.mp3")
+    cache.get("audio/c.mp3")  # b 제거
+
+    assert cache.stats()["bytes"] == 200
+    assert cache.stats()["entries"] == 2
+    downloads = CountingStorage.downloads
+    cache.get("audio/a.mp3")
+    assert CountingStorage.downloads == downloads
+    cache.get("audio/b.mp3")
+    assert CountingStorage.downloads == downloads + 1
+    assert cache.get("audio/missing.mp3") is None
+
+
+def test_disk_cache_keeps_pinned_files_until_released(tmp_path, storage):
+    for name in ("a", "b", "c"):
+        storage.upload_audio(b"x" * 100, f"audio/{name}.mp3")
+    cache = AudioDiskCache(str(tmp_path / "cache"), max_bytes=150, storage_factory=lambda: storage)
+
+    path = cache.get("audio/a.mp3", pin=True)
+    cache.get("audio/b.mp3")
+    assert path.exists()  # 전송 중인 파일 대신 b가 남고 a는 지워지지 않음
+
+    cache.release("audio/a.mp3")
+    cache.get("audio/c.mp3")
+    assert not path.exists()
+    assert cache.stats()["entries"] == 1
+
+
+def test_disk_cache_drops_fetch_lock_after_failed_download(tmp_path, storage, monkeypatch):
+    cache = AudioDiskCache(str(tmp_path / "cache"), max_bytes=1024, storage_factory=lambda: storage)
+
+    assert cache.get("audio/missing.mp3") is None
+
+    def broken_download(file_name, dest_path):
+        raise OSError("connection reset")
+
+    monkeypatch.setattr(storage, "download_audio", broken_download)
+    with pytest.raises(OSError):
+        cache.get("audio/other.mp3")
+    assert cache._fetch_locks == {}
+
+
+def test_audio_proxy_releases_pinned_file_after_response(client, grave_id):
+    assert client.get(f"/api/graves/{grave_id}/audio").status_code == 200
+    response = client.get(f"/api/graves/{grave_id}/audio", headers={"Range": "bytes=0-9"})
+    assert response.status_code == 206
+
+    assert tombstone_router.audio_disk_cache._pins == {}
+
+
+def test_audio_proxy_serves_low_bitrate_variant_for_save_data(
+    client, grave_id, db_session, storage
+):
+    storage.upload_audio(b"OggS-opus", "audio/abc.low.opus")
+    TombstoneRepository(db_session).update_audio_variants(
+        "audio/abc.mp3", '{"low": "audio/abc.low.opus"}'
+    )
+
+    low = client.get(f"/api/graves/{grave_id}/audio", headers={"Save-Data": "on"})
+    original = client.get(
+        f"/api/graves/{grave_id}/audio", headers={"Save-Data": "on", "Accept": "audio/mpeg"}
+    )
+    forced = client.get(f"/api/graves/{grave_id}/audio?quality=low")
+
+    assert low.content == b"OggS-opus"
+    assert low.headers["content-type"] == "audio/ogg"
+    assert "Save-Data" in low.headers["vary"]
+    assert low.headers["etag"] != original.headers["etag"]
+    assert original.content == AUDIO
+    assert forced.content == b"OggS-opus"
+
+
+def test_audio_proxy_falls_back_to_original_without_variants(client, grave_id):
+    response = client.get(f"/api/graves/{grave_id}/audio", headers={"ECT": "2g"})
+
+    assert response.status_code == 200
+    assert response.content == AUDIO
@@ -0,0 +1,109 @@
+"""Presigned audio URL cache / legacy URL mapping tests"""
+from datetime import date
+from types import SimpleNamespace
+
+from app.core.config import env_config
+from app.models.tombstone import AUDIO_STATUS_READY
+from app.repositories.tombstone_repository import TombstoneRepository
+from app.services import audio_url
+from app.services.audio_url import AudioURLSigner, get_audio_key
+from app.utils.migration import backfill_audio_keys
+from app.utils.storage_key import storage_key_from_url
+
+
+class CountingStorage:
+    def __init__(self):
+        self.signed = []
+
+    def get_url(self, file_name, expires_in):
+        self.signed.append(file_name)
+        return f"https://signed.example.com/{file_name}?n={len(self.signed)}"
+
+
+def test_signer_reuses_url_until_refresh_window(monkeypatch):
+    storage = CountingStorage()
+    signer = AudioURLSigner(expires_seconds=3600, refresh_seconds=300, max_entries=10,
+                            storage_factory=lambda: storage)
+    clock = [1000.0]
+    monkeypatch.setattr(audio_url.time, "monotonic", lambda: clock[0])
+
+    first = signer.url_for("audio/a.mp3")
+    clock[0] += 3000
+    assert signer.url_for("audio/a.mp3") == first
+
+    clock[0] += 400  # 만료 300초 전을 지나면 새로 서명
+    assert signer.url_for("audio/a.mp3") != first
+    assert storage.signed == ["audio/a.mp3", "audio/a.mp3"]
+
+
+def test_signer_evicts_least_recently_used():
+    storage = CountingStorage()
+    signer = AudioURLSigner(expires_seconds=3600, refresh_seconds=300, max_entries=2,
+                            storage_factory=lambda: storage)
+
+    signer.url_for("a")
+    signer.url_for("b")
+    signer.url_for("a")
+    signer.url_for("c")  # b 제거
+    signer.url_for("a")
+    signer.url_for("b")
+
+    assert storage.signed == ["a", "b", "c", "b"]
+
+
+def test_legacy_public_urls_map_to_keys():
+    assert storage_key_from_url(
+        "https://timegrave-audio.s3.ap-northeast-2.amazonaws.com/tombstone_1_1_1733011200.123.mp3"
+    ) == "tombstone_1_1_1733011200.123.mp3"
+    url = "http://127.0.0.1:9000/bucket/audio/x.mp3"
+    assert storage_key_from_url(url, "bucket") == "audio/x.mp3"
+    assert storage_key_from_url("audio/x.mp3") == "audio/x.mp3"
+    assert storage_key_from_url("/media/audio/x.mp3", "bucket", "/media") == "audio/x.mp3"
+    assert storage_key_from_url(None) is None
+    # 다른 버킷의 path-style URL은 key를 알 수 없음
+    assert storage_key_from_url("http://127.0.0.1:9000/other/audio/x.mp3", "bucket") is None
+
+    legacy = SimpleNamespace(audio_key=None, audio_url="https://b.s3.ap-northeast-2.amazonaws.com/audio/y.mp3")
+    assert get_audio_key(legacy) == "audio/y.mp3"
+
+
+def test_backfill_converts_legacy_urls_and_clears_unknown_ones(session_factory, monkeypatch):
+    monkeypatch.setattr(env_config, "s3_bucket_name", "timegrave-audio")
+    monkeypatch.setattr(env_config, "local_storage_base_url", "/media")
+    db = session_factory()
+    repository = TombstoneRepository(db)
+    urls = {
+        "virtual": "https://timegrave-audio.s3.ap-northeast-2.amazonaws.com/tombstone_1.mp3",
+        "path": "http://127.0.0.1:9000/timegrave-audio/audio/abc.mp3",
+        "aws_path": "https://s3.ap-northeast-2.amazonaws.com/timegrave-audio/audio/def.mp3",
+        "local": "/media/audio/ghi.mp3",
+        "unknown": "http://127.0.0.1:9000/other-bucket/audio/jkl.mp3",
+    }
+    ids = {}
+    for name, url in urls.items():
+        tombstone = repository.create(user_id=1, title=name, content="c", unlock_date=date.today())
+        tombstone.audio_url = url
+        # 이전 버전의 마이그레이션이 URL을 그대로 복사해 둔 행
+        tombstone.audio_key = url if name != "virtual" else None
+        tombstone.audio_status = AUDIO_STATUS_READY
+        ids[name] = tombstone.id
+    db.commit()
+    db.close()
+
+    with session_factory.kw["bind"].connect() as conn:
+        assert backfill_audio_keys(conn, batch_size=2) == 4
+        assert backfill_audio_keys(conn) == 0
+
+    db = session_factory()
+    rows = {name: TombstoneRepository(db).get_by_id(ids[name]) for name in urls}
+    assert {name: row.audio_key for name, row in rows.items()} == {
+        "virtual": "tombstone_1.mp3",
+        "path": "audio/abc.mp3",
+        "aws_path": "audio/def.mp3",
+        "local": "audio/ghi.mp3",
+        "unknown": None,
+    }
+    assert all(row.audio_url is None for row in rows.values())
+    # key를 알 수 없는 음성은 다음 조회 때 다시 생성
+    assert rows["unknown"].audio_status is None
+    db.close()
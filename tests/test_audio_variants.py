@@ -0,0 +1,173 @@
+"""Audio variant transcoding / client hint selection tests"""
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+import pytest
+
+from app.core.config import env_config
+from app.models.tombstone import AUDIO_STATUS_READY
+from app.repositories.tombstone_repository import TombstoneRepository
+from app.repositories.tts_job_repository import TTSJobRepository
+from app.services import tts_job_service
+from app.services.audio_transcoder import AudioTranscoder, source_storage_key, variant_storage_key
+from app.services.storage import LocalStorageBackend
+from app.services.tts_job_service import TTSJobService
+from app.utils.client_hints import select_audio_variant
+
+
+def fake_transcode(source_path, dest_path, variant):
+    """ffmpeg 대신 내용 앞에 표시만 붙임 (spawn된 프로세스에서 import 가능해야 함)"""
+    with open(source_path, "rb") as source, open(dest_path, "wb") as dest:
+        dest.write(f"{variant.codec}:{variant.bitrate}:".encode() + source.read())
+
+
+class FakeTTSService:
+    language = "ko"
+    style = "neutral"
+    voice = "test-voice"
+
+    def stream_audio(self, text):
+        yield b"ID3fake"
+        yield b"-mp3"
+
+
+class RecordingTranscoder:
+    enabled = True
+
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, storage_key, source_path):
+        with open(source_path, "rb") as file:
+            self.submitted.append((storage_key, file.read()))
+        os.unlink(source_path)
+
+
+def test_variant_keys_map_back_to_source():
+    key = variant_storage_key("audio/abc.mp3", "low")
+
+    assert key == "audio/abc.low.opus"
+    assert source_storage_key(key) == "audio/abc.mp3"
+    assert source_storage_key("audio/abc.mp3") == "audio/abc.mp3"
+
+
+@pytest.mark.parametrize("headers, quality, expected", [
+    ({}, None, None),
+    ({"save-data": "on"}, None, "low"),
+    ({"ect": "3g"}, None, "low"),
+    ({"ect": "4g", "downlink": "0.8"}, None, "low"),
+    ({"ect": "4g", "downlink": "10"}, None, None),
+    ({"save-data": "on", "accept": "audio/mpeg"}, None, None),
+    ({"save-data": "on", "accept": "audio/*;q=0.9"}, None, "low"),
+    ({"save-data": "on", "accept": "audio/ogg;q=0"}, None, None),
+    ({}, "low", "low"),
+    ({"save-data": "on"}, "original", None),
+])
+def test_select_audio_variant_uses_client_hints(headers, quality, expected):
+    assert select_audio_variant(headers, quality, "low", "audio/ogg") == expected
+
+
+def test_transcoder_uploads_variants_and_records_keys(session_factory, tmp_path, monkeypatch):
+    monkeypatch.setattr(env_config, "audio_transcode_enabled", True)
+    storage = LocalStorageBackend(str(tmp_path / "storage"), "/media")
+    db = session_factory()
+    repository = TombstoneRepository(db)
+    first = repository.create(
+        user_id=1, title="a", content="c", unlock_date=date.today(), audio_key="audio/abc.mp3"
+    )
+    second = repository.create(
+        user_id=2, title="b", content="c", unlock_date=date.today(), audio_key="audio/abc.mp3"
+    )
+    source = tmp_path / "source.mp3"
+    source.write_bytes(b"ID3audio")
+
+    transcoder = AudioTranscoder(
+        max_workers=1,
+        max_pending=4,
+        transcode_fn=fake_transcode,
+        storage_factory=lambda: storage,
+        session_factory=session_factory
+    )
+    try:
+        future = transcoder.submit("audio/abc.mp3", str(source))
+        assert future.result(timeout=60) == {"low": "audio/abc.low.opus"}
+    finally:
+        transcoder.shutdown()
+
+    assert (tmp_path / "storage" / "audio" / "abc.low.opus").read_bytes() == b"libopus:24k:ID3audio"
+    assert not source.exists()
+    db.expire_all()
+    for tombstone_id in (first.id, second.id):
+        variants = repository.get_by_id(tombstone_id).audio_variants
+        assert json.loads(variants) == {"low": "audio/abc.low.opus"}
+    assert transcoder.stats()["completed"] == 1
+    db.close()
+
+
+def test_transcoder_skips_when_disabled(tmp_path):
+    source = tmp_path / "source.mp3"
+    source.write_bytes(b"ID3audio")
+    transcoder = AudioTranscoder(max_workers=1, max_pending=1, transcode_fn=fake_transcode)
+
+    assert transcoder.submit("audio/abc.mp3", str(source)) is None
+    assert not source.exists()
+    assert transcoder.stats()["skipped"] == 1
+
+
+def test_transcoder_cleans_up_when_it_cannot_schedule(tmp_path, monkeypatch):
+    monkeypatch.setattr(env_config, "audio_transcode_enabled", True)
+    source = tmp_path / "source.mp3"
+    source.write_bytes(b"ID3audio")
+    transcoder = AudioTranscoder(max_workers=1, max_pending=1, transcode_fn=fake_transcode)
+
+    def closed_executors():
+        raise RuntimeError("cannot schedule new futures after shutdown")
+
+    monkeypatch.setattr(transcoder, "_executors", closed_executors)
+
+    assert transcoder.submit("audio/abc.mp3", str(source)) is None
+    assert not source.exists()
+    assert transcoder._pending.acquire(blocking=False)  # 대기 자리가 반환됨
+
+
+def test_transcoder_cleans_up_cancelled_work(tmp_path, monkeypatch):
+    monkeypatch.setattr(env_config, "audio_transcode_enabled", True)
+    transcoder = AudioTranscoder(max_workers=1, max_pending=2, transcode_fn=fake_transcode)
+    finisher = ThreadPoolExecutor(max_workers=1)
+    release = threading.Event()
+    finisher.submit(release.wait)  # 다음 작업이 대기열에 남도록 막아 둠
+    monkeypatch.setattr(transcoder, "_executors", lambda: (None, finisher))
+    source = tmp_path / "source.mp3"
+    source.write_bytes(b"ID3audio")
+
+    future = transcoder.submit("audio/abc.mp3", str(source))
+    finisher.shutdown(wait=False, cancel_futures=True)
+    release.set()
+
+    assert future.cancelled()
+    assert not source.exists()
+    assert transcoder.stats()["skipped"] == 1
+    assert transcoder._pending.acquire(blocking=False)
+    assert transcoder._pending.acquire(blocking=False)
+
+
+def test_render_hands_a_copy_of_the_audio_to_the_transcoder(db_session, tmp_path, monkeypatch):
+    monkeypatch.setattr(tts_job_service, "TTSService", FakeTTSService)
+    repository = TombstoneRepository(db_session)
+    tombstone = repository.create(
+        user_id=1, title="t", content="안녕", unlock_date=date.today() - timedelta(days=1)
+    )
+    TTSJobRepository(db_session).create(tombstone.id)
+    job = TTSJobRepository(db_session).claim_next()
+    transcoder = RecordingTranscoder()
+    storage = LocalStorageBackend(str(tmp_path), "/media")
+
+    assert TTSJobService(db_session, storage=storage, transcoder=transcoder).process(job)
+
+    db_session.expire_all()
+    tombstone = repository.get_by_id(tombstone.id)
+    assert tombstone.audio_status == AUDIO_STATUS_READY
+    assert transcoder.submitted == [(tombstone.audio_key, b"ID3fake-mp3")]
@@ -0,0 +1,95 @@
+"""Tombstone collaborator (share list) tests"""
+from datetime import date, datetime, timedelta
+
+from app.models.tombstone_collaborator import TombstoneCollaborator
+from app.repositories.tombstone_collaborator_repository import TombstoneCollaboratorRepository
+from app.repositories.tombstone_repository import TombstoneRepository
+from app.schemas.tombstone import CreateTombstoneDto
+from app.services.tombstone_service import TombstoneService
+
+
+def create_legacy_tombstone(db, share_json):
+    """share JSON 컬럼에 친구 목록이 저장된 (backfill 전) 묘비"""
+    tombstone = TombstoneRepository(db).create(
+        user_id=1,
+        title="Legacy",
+        content="예전 묘비",
+        unlock_date=date.today() + timedelta(days=10),
+    )
+    tombstone.share = share_json
+    db.commit()
+    return tombstone.id
+
+
+def test_create_and_update_share_list_use_collaborator_rows(db_session):
+    service = TombstoneService(db_session)
+    created = service.create_tombstone(CreateTombstoneDto(
+        user_id=1, title="Together", content="함께 쓰는 묘비",
+        unlock_date=date.today() + timedelta(days=30), share=[2, 3, 2]
+    ))
+    assert created.share == [2, 3]
+
+    service.update_share_list(created.id, 1, "add", 4)
+    service.update_share_list(created.id, 1, "remove", 2)
+    service.update_share_list(created.id, 1, "add", 3)
+
+    assert set(service.get_tombstone(created.id).share) == {3, 4}
+    assert TombstoneRepository(db_session).get_by_id(created.id).share is None
+
+
+def test_legacy_share_json_is_read_until_backfilled(db_session):
+    tombstone_id = create_legacy_tombstone(db_session, "[5, 6]")
+    service = TombstoneService(db_session)
+
+    assert service.get_tombstone(tombstone_id).share == [5, 6]
+
+    # 수정하면 해당 묘비의 JSON부터 옮긴 뒤 INSERT
+    service.update_share_list(tombstone_id, 1, "add", 7)
+
+    assert set(TombstoneCollaboratorRepository(db_session).get_user_ids(tombstone_id)) == {5, 6, 7}
+    assert TombstoneRepository(db_session).get_by_id(tombstone_id).share is None
+
+
+def test_backfill_is_batched_and_idempotent(db_session):
+    shares = ("[2]", "[2, 3]", "not json", "[]", "[4]")
+    ids = [create_legacy_tombstone(db_session, share) for share in shares]
+    repository = TombstoneCollaboratorRepository(db_session)
+
+    first = repository.backfill_batch(0, 2)
+    assert first == (2, ids[1])
+    assert repository.backfill_batch(first[1], 10) == (3, ids[4])
+    assert repository.backfill_batch(ids[4], 10) == (0, ids[4])
+    # 다시 처음부터 돌려도 새로 옮길 묘비가 없음
+    assert repository.backfill_batch(0, 10) == (0, 0)
+
+    assert repository.get_user_ids_by_tombstone(ids) == {ids[0]: [2], ids[1]: [2, 3], ids[4]: [4]}
+    assert db_session.query(TombstoneCollaborator).count() == 4
+
+
+def test_accept_invite_adds_collaborator_once(db_session):
+    service = TombstoneService(db_session)
+    tombstone_id = create_legacy_tombstone(db_session, None)
+    TombstoneRepository(db_session).update_invite_token(tombstone_id, "invite-abc")
+
+    service.accept_invite("invite-abc", 9)
+    result = service.accept_invite("invite-abc", 9)
+
+    assert result.share == [9]
+
+
+def test_accept_invite_bumps_updated_at_only_when_added(db_session):
+    service = TombstoneService(db_session)
+    tombstone_id = create_legacy_tombstone(db_session, None)
+    repository = TombstoneRepository(db_session)
+    repository.update_invite_token(tombstone_id, "invite-xyz")
+    repository.get_by_id(tombstone_id).updated_at = datetime(2020, 1, 1)
+    db_session.commit()
+
+    service.accept_invite("invite-xyz", 9)
+    bumped = repository.get_by_id(tombstone_id).updated_at
+    assert bumped > datetime(2020, 1, 1)
+
+    repository.get_by_id(tombstone_id).updated_at = datetime(2020, 1, 1)
+    db_session.commit()
+    service.accept_invite("invite-xyz", 9)
+    assert repository.get_by_id(tombstone_id).updated_at == datetime(2020, 1, 1)
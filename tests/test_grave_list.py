@@ -0,0 +1,137 @@
+"""Grave list pagination tests"""
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.database import get_db
+from app.repositories.tombstone_repository import TombstoneRepository
+from app.services.tombstone_service import TombstoneService
+from app.utils.auth import get_current_user
+
+
+@pytest.fixture
+def client(session_factory):
+    def override_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_db
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=1)
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def create_graves(db, count, user_id=1):
+    repository = TombstoneRepository(db)
+    # 같은 unlock_date가 여러 개여도 id로 순서가 정해짐
+    return [
+        repository.create(
+            user_id=user_id,
+            title=f"Grave {index}",
+            content="안녕, 미래의 나야.",
+            unlock_date=date.today() + timedelta(days=1 + index % 3)
+        ).id
+        for index in range(count)
+    ]
+
+
+def test_pages_cover_every_grave_once_in_unlock_order(db_session):
+    create_graves(db_session, 7)
+    create_graves(db_session, 2, user_id=2)
+    service = TombstoneService(db_session)
+
+    seen, cursor, pages = [], None, 0
+    while True:
+        items, cursor = service.list_tombstones(user_id=1, limit=3, cursor=cursor)
+        seen.extend(items)
+        pages += 1
+        if not cursor:
+            break
+
+    assert pages == 3
+    assert [item.id for item in seen] == [
+        item.id for item in sorted(seen, key=lambda item: (item.unlock_date, item.id))
+    ]
+    assert len({item.id for item in seen}) == 7
+    assert all(item.user_id == 1 for item in seen)
+
+
+def test_last_full_page_has_no_next_cursor(db_session):
+    create_graves(db_session, 3)
+
+    items, cursor = TombstoneService(db_session).list_tombstones(user_id=1, limit=3)
+
+    assert len(items) == 3
+    assert cursor is None
+
+
+def test_list_graves_endpoint_pages_with_cursor(client, db_session):
+    create_graves(db_session, 5)
+
+    first = client.get("/api/graves?limit=2").json()["data"]
+    second = client.get(f"/api/graves?limit=2&cursor={first['next_cursor']}").json()["data"]
+
+    assert len(first["result"]) == 2
+    first_ids = {item["id"] for item in first["result"]}
+    assert first_ids.isdisjoint(item["id"] for item in second["result"])
+    assert "next_cursor" in second
+
+
+def test_list_graves_rejects_invalid_cursor_and_limit(client):
+    response = client.get("/api/graves?cursor=not-a-cursor")
+    assert response.status_code == 400
+    assert response.json()["detail"]["error"]["message"] == "Invalid cursor"
+
+    assert client.get("/api/graves?limit=0").status_code == 400
+
+
+def test_list_page_reads_only_list_columns(db_session):
+    create_graves(db_session, 2)
+    db_session.expunge_all()
+
+    rows = TombstoneRepository(db_session).get_page(user_id=1, limit=10)
+
+    assert len(rows) == 2
+    assert "content" not in rows[0]._fields
+    assert "title" in rows[0]._fields
+    # ORM 엔티티를 만들지 않으므로 세션에 묘비가 올라오지 않음
+    assert len(db_session.identity_map) == 0
+
+
+def test_shared_with_me_lists_collaborations_and_enrolled_graves(client, db_session):
+    repository = TombstoneRepository(db_session)
+    unlock_date = date.today() + timedelta(days=5)
+    invited = repository.create(
+        user_id=2, title="Invited", content="c", unlock_date=unlock_date, collaborators=[1]
+    )
+    enrolled = repository.create(
+        user_id=3, title="Enrolled", content="c", unlock_date=unlock_date, enroll=1
+    )
+    repository.create(
+        user_id=2, title="Not mine", content="c", unlock_date=unlock_date, collaborators=[4]
+    )
+    repository.create(
+        user_id=1, title="Own", content="c", unlock_date=unlock_date, enroll=1, collaborators=[1]
+    )
+
+    first = client.get("/api/graves/shared-with-me?limit=1").json()["data"]
+    second = client.get(
+        f"/api/graves/shared-with-me?limit=1&cursor={first['next_cursor']}"
+    ).json()["data"]
+
+    assert [item["id"] for item in first["result"] + second["result"]] == [invited.id, enrolled.id]
+    assert first["result"][0]["share"] == [1]
+    assert "next_cursor" not in second
+
+
+def test_share_link_for_missing_grave_is_404(client):
+    response = client.post("/api/graves/999/share")
+
+    assert response.status_code == 404
+    assert response.json()["detail"]["error"]["message"] == "Grave not found"
@@ -0,0 +1,33 @@
+"""MP3 metadata parser tests"""
+from app.utils.mp3_info import MP3_CODEC, MP3Inspector, inspect_mp3
+
+# MPEG-1 Layer III, 128kbps, 44.1kHz, no padding → 417 bytes, 1152 samples
+FRAME_128K = b"\xff\xfb\x90\x00" + b"\x00" * 413
+# MPEG-1 Layer III, 32kbps, 44.1kHz (VBR 파일의 조용한 구간)
+FRAME_32K = b"\xff\xfb\x10\x00" + b"\x00" * 100
+ID3V2 = b"ID3\x04\x00\x00\x00\x00\x00\x0a" + b"\xff" * 10  # 태그 본문에 sync처럼 보이는 바이트
+
+
+def test_inspect_mp3_counts_frames_and_skips_id3():
+    data = ID3V2 + FRAME_128K * 100 + b"TAG" + b"\x00" * 125
+
+    info = inspect_mp3(data)
+
+    assert info.duration_ms == round(100 * 1152 / 44100 * 1000)
+    assert info.size_bytes == len(data)
+    assert info.codec == MP3_CODEC
+
+
+def test_inspector_handles_small_chunks_and_vbr():
+    data = ID3V2 + (FRAME_128K + FRAME_32K) * 20
+    inspector = MP3Inspector()
+
+    chunks = [data[offset:offset + 7] for offset in range(0, len(data), 7)]
+    assert b"".join(inspector.wrap(chunks)) == data
+
+    assert inspector.frames == 40
+    assert inspector.result() == inspect_mp3(data)
+
+
+def test_inspect_non_mp3_returns_none():
+    assert inspect_mp3(b"not an mp3 at all" * 10) is None
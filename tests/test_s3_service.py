@@ -0,0 +1,167 @@
+"""S3 streaming upload tests with an in-memory client and the local S3 stand-in"""
+import importlib.util
+import threading
+from pathlib import Path
+
+import pytest
+from botocore.exceptions import ClientError
+
+from app.services import s3_service
+from app.services.s3_service import S3Service
+
+
+class FakeS3Client:
+    def __init__(self, fail_part=None):
+        self.fail_part = fail_part
+        self.objects = {}
+        self.parts = []
+        self.aborted = []
+        self.delete_batches = []
+
+    def put_object(self, Bucket, Key, Body, ContentType):
+        self.objects[Key] = Body
+
+    def create_multipart_upload(self, Bucket, Key, ContentType):
+        return {"UploadId": "upload-1"}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        if PartNumber == self.fail_part:
+            raise ClientError({"Error": {"Code": "InternalError"}}, "UploadPart")
+        self.parts.append(Body)
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        numbers = [part["PartNumber"] for part in MultipartUpload["Parts"]]
+        assert numbers == list(range(1, len(self.parts) + 1))
+        self.objects[Key] = b"".join(self.parts)
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.aborted.append(UploadId)
+
+    def delete_objects(self, Bucket, Delete):
+        keys = [obj["Key"] for obj in Delete["Objects"]]
+        self.delete_batches.append(keys)
+        errors = [{"Key": key, "Code": "AccessDenied"} for key in keys if key.startswith("locked/")]
+        for key in keys:
+            if not key.startswith("locked/"):
+                self.objects.pop(key, None)
+        return {"Errors": errors} if errors else {}
+
+
+def make_service(client, part_size=4):
+    service = S3Service()
+    service.s3_client = client
+    service.part_size = part_size
+    return service
+
+
+def test_upload_stream_uses_single_put_for_small_audio():
+    client = FakeS3Client()
+
+    url = make_service(client).upload_stream([b"ab", b"c"], "audio/x.mp3")
+
+    assert url.endswith("/audio/x.mp3")
+    assert client.objects["audio/x.mp3"] == b"abc"
+    assert client.parts == []
+
+
+def test_upload_stream_sends_fixed_size_parts():
+    client = FakeS3Client()
+
+    url = make_service(client).upload_stream([b"abc", b"defgh", b"ij"], "audio/x.mp3")
+
+    assert url
+    assert client.parts == [b"abcd", b"efgh", b"ij"]
+    assert client.objects["audio/x.mp3"] == b"abcdefghij"
+
+
+def test_upload_stream_aborts_on_s3_error():
+    client = FakeS3Client(fail_part=2)
+
+    assert make_service(client).upload_stream([b"abcdefghij"], "audio/x.mp3") is None
+    assert client.aborted == ["upload-1"]
+    assert "audio/x.mp3" not in client.objects
+
+
+def test_upload_stream_aborts_when_source_fails():
+    client = FakeS3Client()
+
+    def chunks():
+        yield b"abcdef"
+        raise RuntimeError("tts failed")
+
+    with pytest.raises(RuntimeError):
+        make_service(client).upload_stream(chunks(), "audio/x.mp3")
+    assert client.aborted == ["upload-1"]
+
+
+def test_delete_many_batches_keys_and_reports_failures():
+    client = FakeS3Client()
+    keys = [f"audio/{i}.mp3" for i in range(2500)] + ["locked/a.mp3"]
+    client.objects = {key: b"x" for key in keys}
+
+    failed = make_service(client).delete_many(keys)
+
+    assert failed == ["locked/a.mp3"]
+    assert [len(batch) for batch in client.delete_batches] == [1000, 1000, 501]
+    assert list(client.objects) == ["locked/a.mp3"]
+
+
+@pytest.fixture
+def fake_s3_endpoint(tmp_path, monkeypatch):
+    path = Path(__file__).parent.parent / "scripts" / "fake_s3.py"
+    spec = importlib.util.spec_from_file_location("fake_s3", path)
+    fake_s3 = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(fake_s3)
+
+    server = fake_s3.make_server(data_dir=str(tmp_path))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    endpoint = f"http://127.0.0.1:{server.server_address[1]}"
+    monkeypatch.setattr(s3_service.env_config, "s3_endpoint_url", endpoint)
+    monkeypatch.setattr(s3_service.env_config, "aws_access_key_id", "test")
+    monkeypatch.setattr(s3_service.env_config, "aws_secret_access_key", "test")
+    yield endpoint
+    server.shutdown()
+    server.server_close()
+
+
+def test_multipart_upload_round_trips_through_local_s3(fake_s3_endpoint):
+    service = S3Service()
+    part = b"x" * service.part_size
+
+    url = service.upload_stream([part, b"tail"], "audio/big.mp3")
+
+    assert url == f"{fake_s3_endpoint}/{service.bucket_name}/audio/big.mp3"
+    stored = service.s3_client.get_object(Bucket=service.bucket_name, Key="audio/big.mp3")
+    body = stored["Body"].read()
+    assert body == part + b"tail"
+    assert service.delete_audio("audio/big.mp3")
+
+
+def test_delete_many_through_local_s3(fake_s3_endpoint):
+    service = S3Service()
+    for index in range(3):
+        service.upload_audio(b"audio", f"audio/{index}.mp3")
+
+    assert service.delete_many(["audio/0.mp3", "audio/1.mp3", "audio/missing.mp3"]) == []
+    listed = service.s3_client.list_objects_v2(Bucket=service.bucket_name)
+    assert [obj["Key"] for obj in listed["Contents"]] == ["audio/2.mp3"]
+
+
+def test_list_objects_pages_through_local_s3(fake_s3_endpoint):
+    service = S3Service()
+    service.list_page_size = 2
+    for index in range(5):
+        service.upload_audio(b"a" * index, f"audio/{index}.mp3")
+    service.upload_audio(b"other", "other/x.mp3")
+    requests = []
+    service.s3_client.meta.events.register(
+        "before-call.s3.ListObjectsV2", lambda params, **kwargs: requests.append(params)
+    )
+
+    objects = list(service.list_objects("audio/"))
+
+    assert [obj.key for obj in objects] == [f"audio/{index}.mp3" for index in range(5)]
+    assert [obj.size for obj in objects] == list(range(5))
+    assert len(requests) == 3
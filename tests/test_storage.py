@@ -0,0 +1,65 @@
+"""Storage backend registry / local storage tests"""
+import threading
+
+import pytest
+
+from app.services import storage
+from app.services.storage import (
+    LocalStorageBackend,
+    get_storage,
+    register_storage_backend,
+    set_storage,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_storage():
+    set_storage(None)
+    yield
+    set_storage(None)
+
+
+def test_local_backend_stores_streamed_audio(tmp_path):
+    backend = LocalStorageBackend(str(tmp_path), "/media/")
+
+    url = backend.upload_stream([b"ID3", b"audio"], "audio/abc.mp3")
+
+    assert url == "/media/audio/abc.mp3"
+    assert (tmp_path / "audio" / "abc.mp3").read_bytes() == b"ID3audio"
+    assert backend.delete_audio("audio/abc.mp3")
+    assert not (tmp_path / "audio" / "abc.mp3").exists()
+
+
+def test_local_backend_rejects_keys_outside_root(tmp_path):
+    backend = LocalStorageBackend(str(tmp_path / "audio"), "/media")
+
+    with pytest.raises(ValueError):
+        backend.upload_audio(b"x", "../escape.mp3")
+
+
+def test_get_storage_creates_backend_once(monkeypatch, tmp_path):
+    created = []
+
+    def factory():
+        created.append(1)
+        return LocalStorageBackend(str(tmp_path), "/media")
+
+    register_storage_backend("counting", factory)
+    monkeypatch.setattr(storage.env_config, "storage_backend", "counting")
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(get_storage())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_get_storage_rejects_unknown_backend(monkeypatch):
+    monkeypatch.setattr(storage.env_config, "storage_backend", "nope")
+
+    with pytest.raises(ValueError):
+        get_storage()
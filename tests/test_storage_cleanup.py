@@ -0,0 +1,134 @@
+"""Account deletion → storage outbox → batched file cleanup tests"""
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import update
+
+from app.models.audio_asset import AudioAsset
+from app.models.storage_outbox import StorageOutbox
+from app.models.tombstone import get_kst_now
+from app.repositories.audio_asset_repository import AudioAssetRepository
+from app.repositories.tombstone_repository import TombstoneRepository
+from app.repositories.user_repository import UserRepository
+from app.services.storage import LocalStorageBackend
+from app.services.storage_cleanup_service import StorageCleanupService
+from app.services.user_service import UserService
+
+
+class FlakyStorage(LocalStorageBackend):
+    def __init__(self, root_dir, failing):
+        super().__init__(root_dir, "/media")
+        self.failing = set(failing)
+        self.batches = []
+
+    def delete_many(self, file_names):
+        self.batches.append(list(file_names))
+        failed = [name for name in file_names if name in self.failing]
+        super().delete_many([name for name in file_names if name not in self.failing])
+        return failed
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return LocalStorageBackend(str(tmp_path), "/media")
+
+
+def create_user(db, email):
+    return UserRepository(db).create(email=email, username=email.split("@")[0], hashed_password="x")
+
+
+def create_tombstone(db, storage, user_id, key):
+    storage.upload_audio(b"ID3audio", key)
+    assets = AudioAssetRepository(db)
+    assets.claim(key.split("/")[-1], key, "ko", "neutral")
+    assets.mark_ready(key.split("/")[-1], f"/media/{key}")
+    return TombstoneRepository(db).create(
+        user_id=user_id,
+        title="t",
+        content=key,
+        unlock_date=date.today() - timedelta(days=1),
+        audio_key=key
+    )
+
+
+def test_delete_account_queues_audio_keys_in_same_transaction(db_session, storage):
+    user = create_user(db_session, "a@example.com")
+    create_tombstone(db_session, storage, user.id, "audio/a.mp3")
+    create_tombstone(db_session, storage, user.id, "audio/b.mp3")
+
+    assert UserService(db_session).delete_account(user.id) == 2
+
+    keys = sorted(entry.storage_key for entry in db_session.query(StorageOutbox).all())
+    assert keys == ["audio/a.mp3", "audio/b.mp3"]
+    # 파일은 요청 안에서 지우지 않음
+    assert (storage.root_dir / "audio" / "a.mp3").exists()
+
+
+def test_cleanup_deletes_files_but_keeps_shared_copies(db_session, storage):
+    owner = create_user(db_session, "owner@example.com")
+    friend = create_user(db_session, "friend@example.com")
+    create_tombstone(db_session, storage, owner.id, "audio/mine.mp3")
+    shared = create_tombstone(db_session, storage, owner.id, "audio/shared.mp3")
+    # copy_shared_tombstone이 만든 복사본은 같은 key를 참조
+    TombstoneRepository(db_session).create(
+        user_id=friend.id, title="copy", content=shared.content,
+        unlock_date=shared.unlock_date, audio_key=shared.audio_key
+    )
+    UserService(db_session).delete_account(owner.id)
+
+    deleted = StorageCleanupService(db_session, storage=storage).process_deletes(limit=1000)
+
+    assert deleted == 1
+    assert not (storage.root_dir / "audio" / "mine.mp3").exists()
+    assert (storage.root_dir / "audio" / "shared.mp3").exists()
+    assert db_session.query(StorageOutbox).count() == 0
+    assets = [asset.storage_key for asset in db_session.query(AudioAsset).all()]
+    assert assets == ["audio/shared.mp3"]
+
+
+def test_cleanup_retries_failed_deletes_later(db_session, tmp_path):
+    storage = FlakyStorage(str(tmp_path), failing={"audio/b.mp3"})
+    user = create_user(db_session, "a@example.com")
+    create_tombstone(db_session, storage, user.id, "audio/a.mp3")
+    create_tombstone(db_session, storage, user.id, "audio/b.mp3")
+    UserService(db_session).delete_account(user.id)
+
+    service = StorageCleanupService(db_session, storage=storage)
+    assert service.process_deletes(limit=1000) == 1
+    assert storage.batches == [
+        ["audio/a.mp3", "audio/b.mp3", "audio/a.low.opus", "audio/b.low.opus"]
+    ]
+
+    remaining = db_session.query(StorageOutbox).one()
+    assert remaining.storage_key == "audio/b.mp3"
+    assert remaining.attempts == 1
+    # 재시도 시각 전에는 다시 처리하지 않음
+    assert service.process_deletes(limit=1000) == 0
+    assert len(storage.batches) == 1
+
+
+def test_abandoned_render_is_queued_and_removed(db_session, storage):
+    # 업로드는 끝났지만 DB에 기록하기 전에 워커가 중단된 경우
+    storage.upload_audio(b"ID3audio", "audio/abandoned.mp3")
+    AudioAssetRepository(db_session).claim("abandoned", "audio/abandoned.mp3", "ko", "neutral")
+    db_session.execute(update(AudioAsset).values(updated_at=get_kst_now() - timedelta(hours=1)))
+    db_session.commit()
+    service = StorageCleanupService(db_session, storage=storage)
+
+    assert service.requeue_abandoned_renders(limit=100) == 1
+    assert db_session.query(AudioAsset).count() == 0
+    assert service.process_deletes(limit=1000) == 1
+    assert not (storage.root_dir / "audio" / "abandoned.mp3").exists()
+
+
+def test_cleanup_waits_for_key_being_rendered_again(db_session, storage):
+    storage.upload_audio(b"ID3audio", "audio/again.mp3")
+    db_session.add(StorageOutbox(storage_key="audio/again.mp3"))
+    db_session.commit()
+    AudioAssetRepository(db_session).claim("again", "audio/again.mp3", "ko", "neutral")
+
+    assert StorageCleanupService(db_session, storage=storage).process_deletes(limit=1000) == 0
+
+    assert (storage.root_dir / "audio" / "again.mp3").exists()
+    entry = db_session.query(StorageOutbox).one()
+    assert entry.last_error == "Render in progress"
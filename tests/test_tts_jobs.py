@@ -0,0 +1,407 @@
+"""TTS job queue tests"""
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.models.audio_asset import AudioAsset
+from app.models.storage_outbox import StorageOutbox
+from app.models.tombstone import AUDIO_STATUS_FAILED, AUDIO_STATUS_PENDING, AUDIO_STATUS_READY
+from app.models.tts_job import (
+    TTS_JOB_DONE,
+    TTS_JOB_FAILED,
+    TTS_JOB_PENDING,
+    TTS_JOB_PROCESSING,
+    TTS_JOB_SOURCE_PRERENDER,
+)
+from app.repositories.audio_asset_repository import AudioAssetRepository
+from app.repositories.tombstone_repository import TombstoneRepository
+from app.repositories.tts_job_repository import TTSJobRepository
+from app.services import tts_job_service
+from app.services.audio_url import audio_url_signer
+from app.services.storage import StorageBackend, set_storage
+from app.services.tombstone_service import TombstoneService
+from app.services.tts_job_service import TTSJobService
+from app.services.tts_rate_limiter import TTSRateLimitedError
+from app.services.tts_service import TTSGenerationError
+from app.utils.audio_hash import compute_audio_hash
+
+
+class FakeTTSService:
+    language = "ko"
+    style = "neutral"
+    voice = "test-voice"
+    calls = 0
+
+    def stream_audio(self, text):
+        FakeTTSService.calls += 1
+        yield b"ID3fake"
+        yield b"-mp3"
+
+
+class MP3TTSService(FakeTTSService):
+    # MPEG-1 Layer III 128kbps 44.1kHz 프레임 50개 (약 1.3초)
+    frame = b"\xff\xfb\x90\x00" + b"\x00" * 413
+
+    def stream_audio(self, text):
+        for _ in range(50):
+            yield self.frame
+
+
+class FailingTTSService(FakeTTSService):
+    def stream_audio(self, text):
+        raise TTSGenerationError("TTS generation failed")
+        yield
+
+
+class ThrottledTTSService(FakeTTSService):
+    def stream_audio(self, text):
+        raise TTSRateLimitedError(30)
+        yield
+
+
+class FakeS3Service(StorageBackend):
+    uploads = []
+
+    def upload_stream(self, chunks, file_name):
+        b"".join(chunks)
+        FakeS3Service.uploads.append(file_name)
+        return f"https://bucket.example.com/{file_name}"
+
+    def upload_audio(self, file_content, file_name):
+        return self.upload_stream([file_content], file_name)
+
+    def delete_audio(self, file_name):
+        return True
+
+    def get_url(self, file_name, expires_in):
+        return f"https://bucket.example.com/{file_name}?X-Amz-Expires={expires_in}"
+
+    def download_audio(self, file_name, dest_path):
+        return False
+
+    def list_objects(self, prefix=""):
+        return iter(())
+
+
+@pytest.fixture(autouse=True)
+def reset_storage():
+    yield
+    set_storage(None)
+    audio_url_signer.clear()
+
+
+def create_unlocked_tombstone(db, content="안녕, 미래의 나야."):
+    repository = TombstoneRepository(db)
+    tombstone = repository.create(
+        user_id=1,
+        title="Test Memory",
+        content=content,
+        unlock_date=date.today() - timedelta(days=1)
+    )
+    repository.update_unlock_status_by_id(tombstone.id, True)
+    return tombstone
+
+
+def test_get_tombstone_enqueues_job_without_rendering(db_session):
+    tombstone = create_unlocked_tombstone(db_session)
+
+    result = TombstoneService(db_session).get_tombstone(tombstone.id)
+
+    assert result.audio_status == AUDIO_STATUS_PENDING
+    assert result.audio_url is None
+    assert TTSJobRepository(db_session).count_pending() == 1
+
+
+def test_enqueue_reuses_active_job(db_session):
+    tombstone = create_unlocked_tombstone(db_session)
+    service = TombstoneService(db_session)
+
+    service.get_tombstone(tombstone.id)
+    service.get_tombstone(tombstone.id)
+
+    assert TTSJobRepository(db_session).count_pending() == 1
+
+
+def test_claim_next_claims_job_once(db_session):
+    tombstone = create_unlocked_tombstone(db_session)
+    TTSJobService(db_session).enqueue(tombstone)
+    repository = TTSJobRepository(db_session)
+
+    job = repository.claim_next()
+
+    assert job.status == TTS_JOB_PROCESSING
+    assert job.attempts == 1
+    assert repository.claim_next() is None
+
+
+def test_process_fills_audio_url(db_session, monkeypatch):
+    monkeypatch.setattr(tts_job_service, "TTSService", FakeTTSService)
+    set_storage(FakeS3Service())
+    tombstone = create_unlocked_tombstone(db_session)
+    TTSJobService(db_session).enqueue(tombstone)
+    job = TTSJobRepository(db_session).claim_next()
+
+    assert TTSJobService(db_session).process(job) is True
+
+    result = TombstoneService(db_session).get_tombstone(tombstone.id)
+    assert result.audio_status == AUDIO_STATUS_READY
+    assert result.audio_url.startswith("https://bucket.example.com/audio/")
+    assert "X-Amz-Expires" in result.audio_url
+    assert TombstoneRepository(db_session).get_by_id(tombstone.id).audio_key.endswith(".mp3")
+    assert TTSJobRepository(db_session).get_by_id(job.id).status == TTS_JOB_DONE
+
+
+def test_process_records_audio_metadata(db_session, monkeypatch):
+    monkeypatch.setattr(tts_job_service, "TTSService", MP3TTSService)
+    set_storage(FakeS3Service())
+    first = create_unlocked_tombstone(db_session)
+    second = create_unlocked_tombstone(db_session)
+    service = TTSJobService(db_session)
+
+    for tombstone in (first, second):
+        service.enqueue(tombstone)
+        assert service.process(TTSJobRepository(db_session).claim_next()) is True
+
+    # 재사용한 묘비도 에셋에 저장된 메타데이터를 받음
+    for tombstone in (first, second):
+        result = TombstoneService(db_session).get_tombstone(tombstone.id)
+        assert result.audio_duration_ms == round(50 * 1152 / 44100 * 1000)
+        assert result.audio_size_bytes == 50 * 417
+        assert result.audio_codec == "mp3"
+    listed, _ = TombstoneService(db_session).list_tombstones(1)
+    assert {item.audio_duration_ms for item in listed} == {1306}
+    assert AudioAssetRepository(db_session).get_storage_totals() == {"assets": 1, "bytes": 50 * 417}
+
+
+def test_process_failure_marks_failed(db_session, monkeypatch):
+    monkeypatch.setattr(tts_job_service, "TTSService", FailingTTSService)
+    tombstone = create_unlocked_tombstone(db_session)
+    TTSJobService(db_session).enqueue(tombstone)
+    job = TTSJobRepository(db_session).claim_next()
+
+    assert TTSJobService(db_session).process(job) is False
+
+    assert TTSJobRepository(db_session).get_by_id(job.id).status == TTS_JOB_FAILED
+    failed = TombstoneRepository(db_session).get_by_id(tombstone.id)
+    assert failed.audio_status == AUDIO_STATUS_FAILED
+    assert failed.audio_attempts == 1
+    assert failed.audio_last_error == "TTS generation failed"
+    assert failed.audio_next_retry_at is not None
+
+
+def test_db_failure_after_upload_rolls_back_and_queues_file_delete(db_session, monkeypatch):
+    monkeypatch.setattr(tts_job_service, "TTSService", FakeTTSService)
+    set_storage(FakeS3Service())
+    tombstone = create_unlocked_tombstone(db_session)
+    TTSJobService(db_session).enqueue(tombstone)
+    job = TTSJobRepository(db_session).claim_next()
+
+    def broken_set_audio_key(*args, **kwargs):
+        raise OperationalError("UPDATE tombstones", {}, Exception("database is locked"))
+
+    monkeypatch.setattr(TombstoneRepository, "set_audio_key", broken_set_audio_key)
+
+    assert TTSJobService(db_session).process(job) is False
+
+    db_session.expire_all()
+    # 작업 완료/에셋 준비도 함께 롤백되어 반쪽짜리 상태가 남지 않음
+    assert TTSJobRepository(db_session).get_by_id(job.id).status == TTS_JOB_FAILED
+    assert TombstoneRepository(db_session).get_by_id(tombstone.id).audio_key is None
+    assert db_session.query(AudioAsset).count() == 0
+    # 업로드된 파일은 storage_outbox에 삭제가 예약됨
+    outbox_keys = [entry.storage_key for entry in db_session.query(StorageOutbox).all()]
+    assert outbox_keys == FakeS3Service.uploads[-1:]
+
+
+def fail_render(db, tombstone):
+    TTSJobService(db).enqueue(tombstone)
+    job = TTSJobRepository(db).claim_next()
+    TTSJobService(db).process(job)
+    db.expire_all()
+    return TombstoneRepository(db).get_by_id(tombstone.id)
+
+
+def test_view_during_backoff_skips_synthesis(db_session, monkeypatch):
+    monkeypatch.setattr(tts_job_service, "TTSService", FailingTTSService)
+    tombstone = create_unlocked_tombstone(db_session)
+    fail_render(db_session, tombstone)
+
+    response = TombstoneService(db_session).get_tombstone(tombstone.id)
+
+    assert response.audio_status == AUDIO_STATUS_FAILED
+    assert TTSJobRepository(db_session).get_active(tombstone.id) is None
+
+
+def test_retry_sweeper_requeues_after_backoff(db_session, monkeypatch):
+    monkeypatch.setattr(tts_job_service, "TTSService", FailingTTSService)
+    tombstone = create_unlocked_tombstone(db_session)
+    failed = fail_render(db_session, tombstone)
+
+    assert TTSJobService(db_session).retry_failed(limit=10) == 0
+
+    TombstoneRepository(db_session).mark_audio_failed(
+        tombstone.id, failed.audio_attempts, failed.audio_last_error,
+        failed.audio_next_retry_at - timedelta(days=1)
+    )
+    assert TTSJobService(db_session).retry_failed(limit=10) == 1
+    assert TTSJobRepository(db_session).get_active(tombstone.id) is not None
+    refreshed = TombstoneRepository(db_session).get_by_id(tombstone.id)
+    assert refreshed.audio_status == AUDIO_STATUS_PENDING
+
+
+def test_backoff_grows_until_max_attempts(db_session, monkeypatch):
+    monkeypatch.setattr(tts_job_service, "TTSService", FailingTTSService)
+    monkeypatch.setattr(tts_job_service.env_config, "tts_max_attempts", 3)
+    tombstone = create_unlocked_tombstone(db_session)
+
+    delays = []
+    for _ in range(3):
+        before = tts_job_service.get_kst_now()
+        failed = fail_render(db_session, tombstone)
+        if failed.audio_next_retry_at:
+            delays.append(failed.audio_next_retry_at - before)
+
+    assert failed.audio_attempts == 3
+    assert failed.audio_next_retry_at is None  # 재시도 중단
+    assert delays[1] > delays[0]
+    assert TTSJobService.is_in_backoff(failed)
+
+
+def test_rate_limited_job_is_rescheduled_not_failed(db_session, monkeypatch):
+    monkeypatch.setattr(tts_job_service, "TTSService", ThrottledTTSService)
+    set_storage(FakeS3Service())
+    tombstone = create_unlocked_tombstone(db_session)
+    TTSJobService(db_session).enqueue(tombstone)
+    job = TTSJobRepository(db_session).claim_next()
+
+    assert TTSJobService(db_session).process(job) is False
+
+    db_session.expire_all()
+    rescheduled = TTSJobRepository(db_session).get_by_id(job.id)
+    assert rescheduled.status == TTS_JOB_PENDING
+    assert TTSJobRepository(db_session).claim_next() is None  # Retry-After 동안은 가져가지 않음
+    refreshed = TombstoneRepository(db_session).get_by_id(tombstone.id)
+    assert refreshed.audio_status == AUDIO_STATUS_PENDING
+
+
+def create_locked_tombstone(db, days_until_unlock):
+    return TombstoneRepository(db).create(
+        user_id=1,
+        title="Future Memory",
+        content="1년 후의 나에게.",
+        unlock_date=date.today() + timedelta(days=days_until_unlock)
+    )
+
+
+def test_schedule_prerender_spreads_upcoming_unlocks(db_session):
+    soon = [create_locked_tombstone(db_session, days) for days in (1, 2)]
+    create_locked_tombstone(db_session, 30)
+    service = TTSJobService(db_session)
+
+    scheduled = service.schedule_prerender(date.today(), days_ahead=3, window_hours=10, limit=100)
+
+    assert scheduled == 2
+    jobs = [TTSJobRepository(db_session).get_active(t.id) for t in soon]
+    assert all(job.source == TTS_JOB_SOURCE_PRERENDER for job in jobs)
+    assert jobs[1].available_at - jobs[0].available_at == timedelta(hours=5)
+    # 이미 예약된 묘비는 다시 등록하지 않음
+    assert service.schedule_prerender(date.today(), days_ahead=3, window_hours=10, limit=100) == 0
+
+
+def test_prerendered_audio_hidden_until_unlock(db_session, monkeypatch):
+    monkeypatch.setattr(tts_job_service, "TTSService", FakeTTSService)
+    set_storage(FakeS3Service())
+    tombstone = create_locked_tombstone(db_session, 1)
+    TTSJobService(db_session).schedule_prerender(
+        date.today(), days_ahead=1, window_hours=0, limit=10
+    )
+    job = TTSJobRepository(db_session).claim_next()
+    TTSJobService(db_session).process(job)
+
+    locked = TombstoneService(db_session).get_tombstone(tombstone.id)
+    assert locked.audio_url is None
+    assert locked.audio_status is None
+
+    TombstoneRepository(db_session).update_unlock_status_by_id(tombstone.id, True)
+    unlocked = TombstoneService(db_session).get_tombstone(tombstone.id)
+    assert unlocked.audio_status == AUDIO_STATUS_READY
+    assert unlocked.audio_url is not None
+
+
+def test_claim_next_respects_prerender_budget(db_session):
+    for days in (1, 2):
+        create_locked_tombstone(db_session, days)
+    TTSJobService(db_session).schedule_prerender(
+        date.today(), days_ahead=2, window_hours=0, limit=10
+    )
+    repository = TTSJobRepository(db_session)
+
+    assert repository.claim_next(prerender_budget=1) is not None
+    assert repository.claim_next(prerender_budget=1) is None
+
+
+def test_identical_content_is_rendered_once(db_session, monkeypatch):
+    monkeypatch.setattr(tts_job_service, "TTSService", FakeTTSService)
+    set_storage(FakeS3Service())
+    monkeypatch.setattr(FakeTTSService, "calls", 0)
+    monkeypatch.setattr(FakeS3Service, "uploads", [])
+    first = create_unlocked_tombstone(db_session, "안녕,  미래의 나야.")
+    second = create_unlocked_tombstone(db_session, "안녕, 미래의 나야.\n")
+    service = TTSJobService(db_session)
+
+    for tombstone in (first, second):
+        service.enqueue(tombstone)
+        assert service.process(TTSJobRepository(db_session).claim_next()) is True
+
+    repository = TombstoneRepository(db_session)
+    assert repository.get_by_id(first.id).audio_key == repository.get_by_id(second.id).audio_key
+    assert FakeTTSService.calls == 1
+    assert len(FakeS3Service.uploads) == 1
+
+
+def test_job_waits_while_same_content_is_rendering(db_session, monkeypatch):
+    monkeypatch.setattr(tts_job_service, "TTSService", FakeTTSService)
+    tombstone = create_unlocked_tombstone(db_session)
+    content_hash = compute_audio_hash(tombstone.content, "ko", "neutral", "test-voice")
+    AudioAssetRepository(db_session).claim(content_hash, "audio/x.mp3", "ko", "neutral")
+    service = TTSJobService(db_session)
+    service.enqueue(tombstone)
+    job = TTSJobRepository(db_session).claim_next()
+
+    assert service.process(job) is False
+
+    rescheduled = TTSJobRepository(db_session).get_by_id(job.id)
+    assert rescheduled.status == TTS_JOB_PENDING
+    assert rescheduled.available_at > job.started_at
+
+
+def test_concurrent_enqueue_keeps_single_active_job(db_session, session_factory):
+    tombstone = create_unlocked_tombstone(db_session)
+    other_session = session_factory()
+    try:
+        first = TTSJobRepository(db_session).create(tombstone.id)
+        # 다른 요청이 get_active 확인 직후 동시에 create를 호출한 경우
+        second = TTSJobRepository(other_session).create(tombstone.id)
+    finally:
+        other_session.close()
+
+    assert first.id == second.id
+    assert TTSJobRepository(db_session).count_pending() == 1
+
+
+def test_expired_lease_is_reclaimed_and_stale_worker_is_fenced(db_session):
+    tombstone = create_unlocked_tombstone(db_session)
+    TTSJobService(db_session).enqueue(tombstone)
+    repository = TTSJobRepository(db_session)
+
+    claimed = repository.claim_next(lease_seconds=-1)
+    stale = SimpleNamespace(id=claimed.id, lease_owner=claimed.lease_owner)
+    reclaimed = repository.claim_next()
+
+    assert reclaimed.id == stale.id
+    assert reclaimed.lease_owner != stale.lease_owner
+    assert reclaimed.attempts == 2
+    assert repository.mark_done(stale) is False
+    assert repository.mark_done(reclaimed) is True
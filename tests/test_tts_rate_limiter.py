@@ -0,0 +1,82 @@
+"""Shared token bucket / AIMD concurrency limiter tests"""
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import env_config
+from app.main import app
+from app.models.database import get_db
+from app.services import tts_rate_limiter as rate_limiter_module
+from app.services.tts_rate_limiter import (
+    AdaptiveConcurrencyLimiter,
+    SharedTokenBucket,
+    TTSRateLimitedError,
+)
+
+
+def test_token_bucket_is_shared_between_processes(session_factory):
+    # 같은 DB를 쓰는 두 인스턴스 = 두 uvicorn 워커 프로세스
+    first = SharedTokenBucket("supertone", rate=0.001, capacity=3, session_factory=session_factory)
+    second = SharedTokenBucket("supertone", rate=0.001, capacity=3, session_factory=session_factory)
+
+    first.acquire(max_wait=0)
+    second.acquire(max_wait=0)
+    first.acquire(max_wait=0)
+
+    with pytest.raises(TTSRateLimitedError):
+        second.acquire(max_wait=0)
+    assert second.stats()["tokens"] < 1
+
+
+def test_token_bucket_waits_for_refill(session_factory):
+    bucket = SharedTokenBucket("supertone", rate=50, capacity=1, session_factory=session_factory)
+
+    bucket.acquire(max_wait=0)
+    bucket.acquire(max_wait=1)  # 1/50초 뒤 토큰이 채워짐
+
+
+def test_aimd_halves_on_throttle_and_probes_back_up():
+    limiter = AdaptiveConcurrencyLimiter(initial=8, minimum=1, maximum=10, cooldown=60)
+
+    limiter.on_throttle()
+    limiter.on_throttle()  # 같은 burst의 실패는 한 번만 반영
+    assert limiter.stats()["limit"] == 4
+
+    for _ in range(5):  # 대략 limit번 성공하면 1 증가
+        limiter.on_success()
+    assert limiter.stats()["limit"] == 5
+
+
+def test_aimd_blocks_beyond_limit():
+    limiter = AdaptiveConcurrencyLimiter(initial=1, minimum=1, maximum=2)
+
+    assert limiter.acquire(timeout=0)
+    assert not limiter.acquire(timeout=0.01)
+    limiter.release()
+    assert limiter.acquire(timeout=0)
+
+
+def test_tts_stats_requires_internal_token(session_factory, monkeypatch):
+    def override_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_db
+    monkeypatch.setattr(rate_limiter_module.tts_rate_limiter, "bucket", None)
+    try:
+        client = TestClient(app)
+        monkeypatch.setattr(env_config, "internal_api_token", "")
+        assert client.get("/api/tts/stats").status_code == 404
+
+        monkeypatch.setattr(env_config, "internal_api_token", "ops-secret")
+        assert client.get("/api/tts/stats").status_code == 403
+        wrong = client.get("/api/tts/stats", headers={"X-Internal-Token": "wrong"})
+        assert wrong.status_code == 403
+
+        response = client.get("/api/tts/stats", headers={"X-Internal-Token": "ops-secret"})
+        assert response.status_code == 200
+        assert response.json()["data"]["result"]["queue"]["pending"] == 0
+    finally:
+        app.dependency_overrides.clear()
@@ -0,0 +1,199 @@
+"""Supertone HTTP client / TTS service tests against a local HTTP server"""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.services import tts_service
+from app.services.http_client import PooledHTTPClient
+from app.services.tts_chunking import chunk_text, join_mp3
+from app.services.tts_rate_limiter import (
+    AdaptiveConcurrencyLimiter,
+    TTSRateLimitedError,
+    TTSRateLimiter,
+)
+from app.services.tts_service import TTSService
+
+
+class FakeSupertoneHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    failures_left = 0
+    throttled_left = 0
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if FakeSupertoneHandler.throttled_left > 0:
+            FakeSupertoneHandler.throttled_left -= 1
+            status, body = 429, b"slow down"
+        elif FakeSupertoneHandler.failures_left > 0:
+            FakeSupertoneHandler.failures_left -= 1
+            status, body = 503, b"busy"
+        else:
+            status, body = 200, b"ID3audio"
+        self.send_response(status)
+        if status == 429:
+            self.send_header("Retry-After", "7")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def fake_supertone():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeSupertoneHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1/text-to-speech/voice"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def local_rate_limiter(monkeypatch):
+    """공유 token bucket(DB) 없이 동시 요청 수만 제한"""
+    limiter = TTSRateLimiter(AdaptiveConcurrencyLimiter(initial=4, minimum=1, maximum=8))
+    monkeypatch.setattr(tts_service, "tts_rate_limiter", limiter)
+    return limiter
+
+
+def make_client(max_retries=2):
+    return PooledHTTPClient(
+        pool_size=2,
+        connect_timeout=1,
+        read_timeout=1,
+        max_retries=max_retries,
+        backoff_factor=0,
+        backoff_jitter=0
+    )
+
+
+def test_client_reuses_keep_alive_connection(fake_supertone):
+    client = make_client()
+
+    for _ in range(3):
+        assert client.post(fake_supertone, json={"text": "안녕"}).status_code == 200
+
+    (host,) = client.pool_stats()["hosts"]
+    assert host["connections_opened"] == 1
+    assert host["requests"] == 3
+    assert client.pool_stats()["in_flight"] == 0
+    client.close()
+
+
+def test_client_retries_transient_errors(fake_supertone, monkeypatch):
+    monkeypatch.setattr(FakeSupertoneHandler, "failures_left", 2)
+    client = make_client(max_retries=2)
+
+    response = client.post(fake_supertone, json={"text": "안녕"})
+
+    assert response.status_code == 200
+    assert response.content == b"ID3audio"
+    client.close()
+
+
+def test_client_gives_up_after_bounded_retries(fake_supertone, monkeypatch):
+    monkeypatch.setattr(FakeSupertoneHandler, "failures_left", 5)
+    client = make_client(max_retries=1)
+
+    assert client.post(fake_supertone, json={"text": "안녕"}).status_code == 503
+    client.close()
+
+
+def test_chunk_text_splits_at_korean_sentence_boundaries():
+    text = (
+        "안녕, 미래의 나야. 오늘은 2025년 12월 1일이야! "
+        "1년 후의 너는 어떤 모습일까? 지금의 나는 새로운 도전을 시작하려고 해."
+    )
+
+    chunks = chunk_text(text, max_chars=30)
+
+    assert chunks == [
+        "안녕, 미래의 나야.",
+        "오늘은 2025년 12월 1일이야!",
+        "1년 후의 너는 어떤 모습일까?",
+        "지금의 나는 새로운 도전을 시작하려고 해.",
+    ]
+    assert chunk_text(text, max_chars=1000) == [text]
+
+
+def test_chunk_text_packs_sentences_and_splits_long_ones():
+    assert chunk_text("가. 나. 다.\n라.", max_chars=6) == ["가. 나.", "다. 라."]
+    assert all(len(chunk) <= 5 for chunk in chunk_text("가나다라마바사아자차카타파하", max_chars=5))
+
+
+def test_join_mp3_keeps_only_outer_tags():
+    id3v2 = b"ID3\x04\x00\x00\x00\x00\x00\x02ab"
+    id3v1 = b"TAG" + b"\x00" * 125
+
+    joined = join_mp3([id3v2 + b"frame1" + id3v1, id3v2 + b"frame2" + id3v1])
+
+    assert joined == id3v2 + b"frame1frame2" + id3v1
+
+
+def test_generate_audio_retries_only_failed_chunk(monkeypatch):
+    service = TTSService()
+    service.chunk_max_chars = 10
+    service.chunk_concurrency = 2
+    service.chunk_retries = 1
+    calls = []
+    failed_once = set()
+
+    def fake_synthesize(text):
+        calls.append(text)
+        if text.startswith("둘째") and text not in failed_once:
+            failed_once.add(text)
+            return None
+        return text.encode("utf-8")
+
+    monkeypatch.setattr(service, "_synthesize", fake_synthesize)
+
+    audio = service.generate_audio("첫째 문장이다. 둘째 문장이다. 셋째 문장이다.")
+
+    assert audio == "첫째 문장이다.둘째 문장이다.셋째 문장이다.".encode("utf-8")
+    assert sorted(calls) == sorted(
+        ["첫째 문장이다.", "둘째 문장이다.", "둘째 문장이다.", "셋째 문장이다."]
+    )
+
+
+def test_stream_audio_yields_chunks_in_order(monkeypatch):
+    service = TTSService()
+    service.chunk_max_chars = 10
+    service.chunk_concurrency = 2
+
+    monkeypatch.setattr(service, "_synthesize", lambda text: text.encode("utf-8"))
+
+    parts = list(service.stream_audio("첫째 문장이다. 둘째 문장이다. 셋째 문장이다."))
+
+    sentences = ["첫째 문장이다.", "둘째 문장이다.", "셋째 문장이다."]
+    assert parts == [text.encode("utf-8") for text in sentences]
+
+
+def test_stream_audio_reads_single_response(fake_supertone, monkeypatch):
+    client = make_client()
+    monkeypatch.setattr(tts_service, "tts_http_client", client)
+    service = TTSService()
+    service.api_url = fake_supertone
+    service.stream_chunk_size = 3
+
+    assert b"".join(service.stream_audio("안녕")) == b"ID3audio"
+    client.close()
+
+
+def test_synthesize_surfaces_429_to_rate_limiter(fake_supertone, monkeypatch, local_rate_limiter):
+    monkeypatch.setattr(FakeSupertoneHandler, "throttled_left", 1)
+    client = make_client(max_retries=2)
+    monkeypatch.setattr(tts_service, "tts_http_client", client)
+    service = TTSService()
+    service.api_url = fake_supertone
+
+    with pytest.raises(TTSRateLimitedError) as error:
+        service._synthesize("안녕")
+
+    assert error.value.retry_after == 7
+    assert local_rate_limiter.stats()["responses"]["throttled"] == 1
+    assert local_rate_limiter.stats()["concurrency"]["limit"] == 2
+    assert service._synthesize("안녕") == b"ID3audio"
+    client.close()
@@ -0,0 +1,90 @@
+"""Single-statement repository updates / unit of work tests"""
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app.repositories.tombstone_collaborator_repository import TombstoneCollaboratorRepository
+from app.repositories.tombstone_repository import TombstoneRepository
+from app.repositories.unit_of_work import unit_of_work
+from app.services.tombstone_service import TombstoneService
+
+
+@contextmanager
+def recorded(db):
+    """세션이 실행한 SQL 문과 커밋 수를 기록"""
+    statements, commits = [], []
+    engine = db.get_bind()
+
+    def on_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    def on_commit(session):
+        commits.append(1)
+
+    event.listen(engine, "before_cursor_execute", on_execute)
+    event.listen(db, "after_commit", on_commit)
+    try:
+        yield statements, commits
+    finally:
+        event.remove(engine, "before_cursor_execute", on_execute)
+        event.remove(db, "after_commit", on_commit)
+
+
+def create_grave(db, user_id=1):
+    return TombstoneRepository(db).create(
+        user_id=user_id,
+        title="t",
+        content="긴 본문" * 100,
+        unlock_date=date.today() + timedelta(days=3),
+    ).id
+
+
+def test_token_update_is_a_single_statement(db_session):
+    grave_id = create_grave(db_session)
+    service = TombstoneService(db_session)
+
+    with recorded(db_session) as (statements, commits):
+        assert service.generate_share_token(grave_id, user_id=1)
+
+    assert len(statements) == 1
+    assert statements[0].startswith("UPDATE tombstones SET share_token")
+    assert len(commits) == 1
+
+
+def test_token_update_reports_missing_and_foreign_graves(db_session):
+    grave_id = create_grave(db_session, user_id=2)
+    service = TombstoneService(db_session)
+
+    assert service.generate_invite_token(9999, user_id=1) is None
+    with pytest.raises(ValueError, match="permission"):
+        service.generate_invite_token(grave_id, user_id=1)
+    assert TombstoneRepository(db_session).get_by_id(grave_id).invite_token is None
+
+
+def test_share_list_update_commits_once_without_reloading(db_session):
+    grave_id = create_grave(db_session)
+    service = TombstoneService(db_session)
+    db_session.expunge_all()
+
+    with recorded(db_session) as (statements, commits):
+        result = service.update_share_list(grave_id, 1, "add", 5)
+
+    assert result.share == [5]
+    assert len(commits) == 1
+    # UPDATE ... RETURNING, INSERT, 친구 목록 조회 (묘비를 다시 SELECT하지 않음)
+    assert [statement.split()[0] for statement in statements] == ["UPDATE", "INSERT", "SELECT"]
+
+
+def test_unit_of_work_rolls_back_every_change(db_session):
+    grave_id = create_grave(db_session)
+
+    with pytest.raises(RuntimeError):
+        with unit_of_work(db_session):
+            TombstoneRepository(db_session).update_share_token(grave_id, "token")
+            TombstoneCollaboratorRepository(db_session).add(grave_id, 7)
+            raise RuntimeError("boom")
+
+    assert TombstoneRepository(db_session).get_by_id(grave_id).share_token is None
+    assert TombstoneCollaboratorRepository(db_session).get_user_ids(grave_id) == []
@@ -0,0 +1,96 @@
+"""Chunked unlock sweep tests"""
+import json
+from datetime import date, timedelta
+
+import pytest
+
+from app.models.sweep_checkpoint import UNLOCK_SWEEP
+from app.models.tts_job import TTS_JOB_SOURCE_PRERENDER, TTS_JOB_SOURCE_VIEW
+from app.repositories.sweep_checkpoint_repository import SweepCheckpointRepository
+from app.repositories.tombstone_repository import TombstoneRepository
+from app.repositories.tts_job_repository import TTSJobRepository
+from app.services.tombstone_service import TombstoneService
+from app.services.unlock_sweep_service import UnlockSweepService
+
+TODAY = date(2026, 10, 18)
+
+
+def create_graves(db, unlock_dates):
+    repository = TombstoneRepository(db)
+    return [
+        repository.create(user_id=1, title="t", content="c", unlock_date=unlock_date).id
+        for unlock_date in unlock_dates
+    ]
+
+
+def unlocked_ids(db):
+    repository = TombstoneRepository(db)
+    return {grave.id for grave in repository.get_all(1) if grave.is_unlocked}
+
+
+def test_sweep_unlocks_due_graves_in_chunks(db_session):
+    due = create_graves(db_session, [TODAY - timedelta(days=n % 3) for n in range(7)])
+    future = create_graves(db_session, [TODAY + timedelta(days=1)])
+    chunks = []
+
+    total = UnlockSweepService(db_session).sweep(TODAY, chunk_size=3, on_unlocked=chunks.append)
+
+    assert total == 7
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+    assert sorted(sum(chunks, [])) == sorted(due)
+    assert unlocked_ids(db_session) == set(due)
+    assert future[0] not in unlocked_ids(db_session)
+    assert SweepCheckpointRepository(db_session).get(UNLOCK_SWEEP) is None
+
+
+def test_failed_delivery_is_retried_and_sweep_resumes(db_session):
+    due = create_graves(db_session, [TODAY - timedelta(days=1)] * 5)
+    delivered = []
+
+    def crash_on_second_chunk(ids):
+        if len(delivered) == 1:
+            raise RuntimeError("downstream unavailable")
+        delivered.append(ids)
+
+    with pytest.raises(RuntimeError):
+        UnlockSweepService(db_session).sweep(TODAY, chunk_size=2, on_unlocked=crash_on_second_chunk)
+
+    # 두 번째 chunk는 해제와 전달할 id가 커밋되었지만 전달되지 않음
+    checkpoint = SweepCheckpointRepository(db_session).get(UNLOCK_SWEEP)
+    assert json.loads(checkpoint.pending_ids) == due[2:4]
+    assert len(unlocked_ids(db_session)) == 4
+
+    total = UnlockSweepService(db_session).sweep(TODAY, chunk_size=2, on_unlocked=delivered.append)
+
+    assert total == 1
+    assert delivered == [due[0:2], due[2:4], due[4:5]]
+    assert unlocked_ids(db_session) == set(due)
+
+
+def test_interrupted_sweep_still_unlocks_rows_before_its_progress(db_session):
+    create_graves(db_session, [TODAY - timedelta(days=1)] * 3)
+
+    def crash(ids):
+        raise RuntimeError("downstream unavailable")
+
+    with pytest.raises(RuntimeError):
+        UnlockSweepService(db_session).sweep(TODAY, chunk_size=2, on_unlocked=crash)
+    # 이미 처리한 행보다 (unlock_date, id) 순서가 앞서는 묘비 (예: 잠겨 있어 건너뛴 행)
+    earlier, = create_graves(db_session, [TODAY - timedelta(days=5)])
+
+    UnlockSweepService(db_session).sweep(TODAY, chunk_size=2)
+
+    assert earlier in unlocked_ids(db_session)
+    assert len(unlocked_ids(db_session)) == 4
+
+
+def test_unlock_check_promotes_prerendered_jobs(db_session):
+    grave_id, = create_graves(db_session, [date.today()])
+    jobs = TTSJobRepository(db_session)
+    job = jobs.create(
+        grave_id, source=TTS_JOB_SOURCE_PRERENDER, available_at=TODAY + timedelta(days=1)
+    )
+
+    assert TombstoneService(db_session).check_and_unlock_tombstones() == 1
+
+    assert jobs.get_by_id(job.id).source == TTS_JOB_SOURCE_VIEW